@@ -0,0 +1,184 @@
+"""Time downloading, caching and parsing against a local mock of the
+Elsevier APIs (see `mock_api.py`), without network access or API key.
+
+Run as `python benchmarks/bench_api.py`.  Compares the best time of each
+scenario with the baseline stored in `baselines.json`, and exits with
+status 1 if a scenario exceeds its baseline by more than the tolerance, so
+that the script can guard against regressions.  Baselines depend on the
+machine and are not part of the repository: the first run of a scenario
+stores its time as baseline, and `--save-baseline` replaces the stored
+times by the current ones.  Options `--latency`, `--jitter`,
+`--rate-limit-every` and `--replay` are passed on to the mock server, and
+`--throttle` keeps the client-side rate limits of pybliometrics.
+"""
+import gc
+import json
+import socket
+import subprocess
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from pybliometrics.utils import init, RATELIMITS, URLS
+
+HERE = Path(__file__).parent
+BASELINES = HERE / 'baselines.json'
+EIDS = [f'2-s2.0-{85000000000 + i}' for i in range(100)]
+APIS = ('AbstractRetrieval', 'AuthorSearch', 'ScopusSearch')
+
+
+def public_properties(obj) -> list[str]:
+    """Names of the public properties of an object's class."""
+    return sorted({name for cls in type(obj).__mro__ for name, attr in vars(cls).items()
+                   if isinstance(attr, property) and not name.startswith('_')})
+
+
+def access_all(objects) -> int:
+    """Access all public properties of the objects; return the number of
+    properties raising an error (due to fields missing in the payloads).
+    """
+    failed = set()
+    for obj in objects:
+        for name in public_properties(obj):
+            try:
+                getattr(obj, name)
+            except Exception:
+                failed.add(name)
+    return len(failed)
+
+
+def scenarios() -> dict:
+    """Scenarios as pairs of setup and timed function; the result of setup
+    is passed to the timed function.
+    """
+    from pybliometrics.scopus import AbstractRetrieval, AuthorSearch, ScopusSearch
+
+    def from_cache(make):
+        return lambda: [make() for _ in range(10)]
+
+    return {
+        'search pages': (None, lambda _: ScopusSearch('BENCH', subscriber=False, refresh=True)),
+        'search pages, 4 workers': (None, lambda _: ScopusSearch(
+            'BENCH', subscriber=False, refresh=True, workers=4)),
+        'search cursor': (None, lambda _: ScopusSearch('BENCH', refresh=True)),
+        'author search pages': (None, lambda _: AuthorSearch('AUTHLAST(bench)', refresh=True)),
+        'REF paging': (None, lambda _: AbstractRetrieval(EIDS[0], view='REF', refresh=True)),
+        'bulk retrieval, 4 workers': (None, lambda _: list(AbstractRetrieval.bulk(
+            EIDS, view='FULL', refresh=True, workers=4))),
+        'cache hit, retrieval': (
+            lambda: list(AbstractRetrieval.bulk(EIDS, view='FULL', workers=4)),
+            lambda _: [AbstractRetrieval(eid, view='FULL') for eid in EIDS]),
+        'cache hit, search': (
+            lambda: ScopusSearch('BENCH'),
+            lambda _: ScopusSearch('BENCH')),
+        'parse AbstractRetrieval FULL': (
+            from_cache(lambda: AbstractRetrieval(EIDS[0], view='FULL')), access_all),
+        'parse AbstractRetrieval REF': (
+            from_cache(lambda: AbstractRetrieval(EIDS[0], view='REF')), access_all),
+        'parse ScopusSearch COMPLETE': (
+            lambda: [ScopusSearch('BENCH')], access_all),
+        'parse AuthorSearch': (
+            lambda: [AuthorSearch('AUTHLAST(bench)')], access_all),
+    }
+
+
+def start_server(args) -> tuple[subprocess.Popen, str]:
+    """Start the mock server in its own process, so that it does not compete
+    with the benchmarks for the GIL.  Returns the process and the base URL.
+    """
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    command = [sys.executable, str(HERE / 'mock_api.py'), '--port', str(port),
+               '--latency', str(args.latency), '--jitter', str(args.jitter),
+               '--rate-limit-every', str(args.rate_limit_every)]
+    if args.replay:
+        command += ['--replay', args.replay]
+    server = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    if server.stdout.readline().strip() != 'ready':
+        server.kill()
+        raise RuntimeError("The mock server failed to start.")
+    return server, f'http://127.0.0.1:{port}'
+
+
+def main() -> int:
+    parser = ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--repeat', type=int, default=5)
+    # Requests and cache access make times vary more than pure computation
+    parser.add_argument('--tolerance', type=float, default=0.5,
+                        help='allowed relative slowdown against the baseline')
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--throttle', action='store_true')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--rate-limit-every', type=int, default=0)
+    parser.add_argument('--replay')
+    parser.add_argument('-k', dest='select', default='',
+                        help='run only scenarios containing this text')
+    args = parser.parse_args()
+
+    server, base = start_server(args)
+    try:
+        with TemporaryDirectory() as cache:
+            # Two keys, so that injected 429s are retried with the other key
+            init(config={'Authentication': {'APIKey': 'key1, key2'},
+                         'Directories': {api: f'{cache}/{api}' for api in APIS}})
+            for api, url in URLS.items():
+                URLS[api] = url.replace('https://api.elsevier.com', base)
+            if not args.throttle:
+                RATELIMITS.update(dict.fromkeys(RATELIMITS, 0))
+            results = run(args)
+    finally:
+        server.kill()
+    return report(results, args)
+
+
+def run(args) -> dict[str, float]:
+    """Run the selected scenarios and return their best times."""
+    results = {}
+    for name, (setup, timed) in scenarios().items():
+        if args.select not in name:
+            continue
+        times = []
+        for _ in range(args.repeat):
+            prepared = setup() if setup else None
+            gc.collect()
+            start = perf_counter()
+            outcome = timed(prepared)
+            times.append(perf_counter() - start)
+        results[name] = min(times)
+        if isinstance(outcome, int) and outcome:
+            print(f"  note: {outcome} properties failed in '{name}'")
+    return results
+
+
+def report(results: dict[str, float], args) -> int:
+    """Print the times next to their baselines, and store them as baselines
+    of scenarios without one (or of all with `--save-baseline`).  Returns
+    the exit status.
+    """
+    stored = json.loads(BASELINES.read_text()) if BASELINES.exists() else {}
+    new = {name: round(seconds, 4) for name, seconds in results.items()
+           if args.save_baseline or name not in stored}
+    if new:
+        BASELINES.write_text(json.dumps({**stored, **new}, indent=2, sort_keys=True) + "\n")
+    failed = 0
+    print(f"{'scenario':<32}{'best s':>10}{'baseline':>10}{'change':>9}")
+    for name, seconds in results.items():
+        baseline = stored.get(name)
+        if baseline is None:
+            print(f"{name:<32}{seconds:>10.4f}{'-':>10}  (new baseline)")
+            continue
+        change = seconds / baseline - 1
+        # Ignore differences of less than 5 ms, which are mostly noise
+        slower = change > args.tolerance and seconds - baseline > 0.005
+        flag = '  REGRESSION' if slower and not args.save_baseline else ''
+        failed += bool(flag)
+        print(f"{name:<32}{seconds:>10.4f}{baseline:>10.4f}{change:>+9.0%}{flag}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
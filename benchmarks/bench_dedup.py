@@ -0,0 +1,37 @@
+"""Time the deduplication of authors in hyper-authored search results.
+
+Run as `python benchmarks/bench_dedup.py`.
+"""
+from functools import reduce
+from time import perf_counter
+
+from payloads import search_entry
+
+from pybliometrics.scopus.scopus_search import _parse_document
+from pybliometrics.utils import deduplicate
+
+
+def deduplicate_quadratic(lst):
+    """The previous implementation of `deduplicate()`, for reference."""
+    return reduce(lambda x, y: x + y if y[0] not in x else x,
+                  map(lambda x: [x], lst), [])
+
+
+def timed(func, *args):
+    start = perf_counter()
+    func(*args)
+    return perf_counter() - start
+
+
+def main(n_authors: int = 5_000) -> None:
+    entry = search_entry(0, n_authors=n_authors)
+    authors = entry['author']
+    assert deduplicate(authors) == deduplicate_quadratic(authors)
+    print(f"Synthetic entry with {n_authors:,} authors")
+    print(f"  deduplicate() of authors, quadratic: {timed(deduplicate_quadratic, authors):8.3f} s")
+    print(f"  deduplicate() of authors, linear:    {timed(deduplicate, authors):8.3f} s")
+    print(f"  parsing the entry for ScopusSearch:  {timed(_parse_document, entry, True):8.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Measure the time to import pybliometrics and its subpackages.
+
+Each import runs in a fresh interpreter.  Run as
+`python benchmarks/bench_import.py`; exits with status 1 if the median
+time of a statement exceeds its budget (in milliseconds), so that the
+script can guard against import-time regressions.
+"""
+import subprocess
+import sys
+from statistics import median
+
+STATEMENTS = {
+    'import pybliometrics': 5,
+    'from pybliometrics.scopus import ScopusSearch': 80,
+    'from pybliometrics.sciencedirect import ArticleRetrieval': 80,
+    'from pybliometrics.scival import AuthorMetrics': 80,
+}
+
+
+def time_import(statement: str) -> float:
+    """Time one import statement in a fresh interpreter, in milliseconds."""
+    code = ("from time import perf_counter; start = perf_counter(); "
+            f"{statement}; print(perf_counter() - start)")
+    out = subprocess.run([sys.executable, '-c', code], check=True,
+                         capture_output=True, text=True).stdout
+    return float(out) * 1000
+
+
+def main(repeat: int = 7) -> int:
+    failed = 0
+    print(f"{'statement':<58}{'median ms':>10}{'budget':>8}")
+    for statement, budget in STATEMENTS.items():
+        elapsed = median(time_import(statement) for _ in range(repeat))
+        flag = '' if elapsed <= budget else '  REGRESSION'
+        failed += bool(flag)
+        print(f"{statement:<58}{elapsed:>10.1f}{budget:>8}{flag}")
+    return int(failed > 0)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
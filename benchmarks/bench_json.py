@@ -0,0 +1,36 @@
+"""Compare the available JSON backends on payloads of realistic size.
+
+Run as `python benchmarks/bench_json.py`.
+"""
+from timeit import Timer
+
+from payloads import abstract_full, search_entry
+
+from pybliometrics.utils import JSON_BACKENDS, json_dumps, json_loads, set_json_backend
+
+
+def main(repeat: int = 5) -> None:
+    payloads = {
+        'AbstractRetrieval FULL, 20 refs': abstract_full(n_refs=20),
+        'AbstractRetrieval FULL, 200 refs': abstract_full(n_refs=200),
+        'AbstractRetrieval FULL, 2000 refs': abstract_full(n_refs=2000),
+        'ScopusSearch page, 25 entries': [search_entry(i) for i in range(25)],
+    }
+    print(f"{'payload':<36}{'KB':>8}  {'backend':<8}{'loads ms':>10}{'dumps ms':>10}")
+    for label, payload in payloads.items():
+        for backend in JSON_BACKENDS:
+            try:
+                set_json_backend(backend)
+            except ImportError:
+                continue
+            encoded = json_dumps(payload)
+            number = max(1, 2_000_000 // len(encoded))
+            loads = min(Timer(lambda: json_loads(encoded)).repeat(repeat, number))
+            dumps = min(Timer(lambda: json_dumps(payload)).repeat(repeat, number))
+            print(f"{label:<36}{len(encoded) / 1024:>8.0f}  {backend:<8}"
+                  f"{loads / number * 1000:>10.3f}{dumps / number * 1000:>10.3f}")
+    set_json_backend()
+
+
+if __name__ == '__main__':
+    main()
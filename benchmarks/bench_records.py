@@ -0,0 +1,61 @@
+"""Compare the memory retained by namedtuple results and by a `RecordStore`,
+and the peak memory while building them from a cached file.
+
+Run as `python benchmarks/bench_records.py`.
+"""
+import tracemalloc
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+
+from payloads import search_entry
+
+from pybliometrics.scopus.scopus_search import Document, _parse_document
+from pybliometrics.utils import json_dumps, json_loads, RecordStore
+
+
+def measure(func, *args):
+    """Return result, retained MB, peak MB and seconds of a function call."""
+    tracemalloc.start()
+    start = perf_counter()
+    result = func(*args)
+    seconds = perf_counter() - start
+    size, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size / 2**20, peak / 2**20, seconds
+
+
+def namedtuples(fname):
+    """Like `results` of an object read from the cache: decode the whole
+    file, then parse.
+    """
+    entries = [json_loads(line) for line in fname.read_bytes().split(b"\n")]
+    return [Document._make(_parse_document(e, True)) for e in entries]
+
+
+def store(fname, n):
+    """Like `results_compact()` with `init(lazy=True)`: decode and parse
+    the file line by line.
+    """
+    with fname.open('rb') as f:
+        rows = (_parse_document(json_loads(line), True) for line in f)
+        return RecordStore.from_rows(Document, rows, n)
+
+
+def main(n: int = 100_000) -> None:
+    with TemporaryDirectory() as folder:
+        fname = Path(folder, 'cache')
+        fname.write_bytes(b"\n".join(json_dumps(search_entry(i, n_authors=3))
+                                     for i in range(n)))
+        records, mb_records, peak_records, s_records = measure(namedtuples, fname)
+        compact, mb_compact, peak_compact, s_compact = measure(store, fname, n)
+    assert compact[n // 2] == records[n // 2]
+    print(f"{n:,} synthetic ScopusSearch results, under tracemalloc")
+    print(f"  list of namedtuples: {mb_records:8.1f} MB, peak {peak_records:8.1f} MB "
+          f"(built in {s_records:.2f} s)")
+    print(f"  RecordStore:         {mb_compact:8.1f} MB, peak {peak_compact:8.1f} MB "
+          f"(built in {s_compact:.2f} s)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,206 @@
+"""Local stand-in for the Elsevier APIs, for benchmarks without network.
+
+Serves the Scopus Search and Author Search APIs (pages by `start` and
+`count`, or by `cursor`) and the Abstract Retrieval API (pages of
+references by `startref` for view REF).  Responses are recorded ones from
+`--replay` where available, and synthetic ones from `payloads.py`
+otherwise.  Recorded responses are files `<replay>/<URL path>/<VIEW>.json`,
+e.g. `responses/content/abstract/eid/2-s2.0-85068268027/FULL.json`, and
+may be copies of cached files of pybliometrics.  Recorded search responses
+(a response or JSON lines of entries) provide the entries of all pages,
+recorded REF responses all references.
+
+Responses are encoded once and kept in memory.  The server can inject
+latency and responses with status 429.  Run as
+`python benchmarks/mock_api.py --port 8800 --latency 0.02`; it prints
+`ready` once it listens.  `GET /stats` returns the number of requests
+and of injected 429s.
+"""
+import json
+import random
+from argparse import ArgumentParser
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Lock
+from time import sleep
+from urllib.parse import parse_qs, urlparse
+
+from payloads import abstract_full, author_search_entry, reference, search_entry
+
+REFS_PER_PAGE = 40
+
+
+class MockAPI:
+    """Responses of the mocked APIs, with injected latency and 429s."""
+
+    def __init__(self, results: int = 2000, refs: int = 1000,
+                 latency: float = 0.0, jitter: float = 0.0,
+                 rate_limit_every: int = 0, replay: str | None = None,
+                 seed: int = 0) -> None:
+        self.results = results
+        self.refs = refs
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit_every = rate_limit_every
+        self.replay = Path(replay) if replay else None
+        self.random = random.Random(seed)
+        self.stats = {'requests': 0, 'rate_limited': 0}
+        self._lock = Lock()
+        self._encoded = {}
+        self._entries = {}
+
+    def respond(self, path: str, params: dict) -> tuple[int, bytes]:
+        """Return status and body of the response to a request."""
+        if path == '/stats':
+            return 200, json.dumps(self.stats).encode()
+        with self._lock:
+            self.stats['requests'] += 1
+            n = self.stats['requests']
+            delay = self.latency + self.random.uniform(0, self.jitter)
+            limited = self.rate_limit_every and n % self.rate_limit_every == 0
+            if limited:
+                self.stats['rate_limited'] += 1
+        if delay:
+            sleep(delay)
+        if limited:
+            return 429, b'{"error-response": {"error-message": "Rate limit exceeded"}}'
+        view = params.get('view', 'STANDARD')
+        if path.startswith('/content/search/'):
+            if 'cursor' in params:
+                start = 0 if params['cursor'] == '*' else int(params['cursor'])
+            else:
+                start = int(params.get('start', 0))
+            count = int(params.get('count', 25))
+            return 200, self._encode((path, view, start, count), self._search_page,
+                                     path, view, start, count)
+        if path.startswith('/content/abstract/'):
+            if view == 'REF':
+                start = int(params.get('startref', 1)) - 1
+                return 200, self._encode((path, view, start), self._ref_page,
+                                         path, start)
+            return 200, self._encode((path, view), self._retrieval, path, view)
+        return 404, b'{"service-error": {"status": {"statusText": "Unknown path"}}}'
+
+    def _encode(self, key, make, *args) -> bytes:
+        """Auxiliary function to encode each distinct response once."""
+        try:
+            return self._encoded[key]
+        except KeyError:
+            encoded = json.dumps(make(*args)).encode()
+            with self._lock:
+                self._encoded[key] = encoded
+            return encoded
+
+    def _recorded(self, path, view):
+        """Auxiliary function to read a recorded response, if any."""
+        if self.replay is None:
+            return None
+        fname = self.replay / path.strip('/') / f'{view}.json'
+        if not fname.exists():
+            return None
+        text = fname.read_text(encoding='utf8')
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:  # Cached search results: one entry per line
+            return [json.loads(line) for line in text.splitlines() if line]
+
+    def _search_entries(self, path, view):
+        """Auxiliary function to get the entries of all results."""
+        key = (path, view)
+        if key not in self._entries:
+            recorded = self._recorded(path, view)
+            if recorded is not None:
+                if isinstance(recorded, dict):
+                    recorded = recorded.get('search-results', {}).get('entry', [])
+                entries = recorded
+                entries = (entries * (self.results // max(len(entries), 1) + 1))[:self.results]
+            elif path.endswith('/author'):
+                entries = [author_search_entry(i) for i in range(self.results)]
+            else:
+                entries = [search_entry(i) for i in range(self.results)]
+            self._entries[key] = entries
+        return self._entries[key]
+
+    def _search_page(self, path, view, start, count):
+        entries = self._search_entries(path, view)[start:start + count]
+        return {'search-results': {
+            'opensearch:totalResults': str(self.results),
+            'opensearch:startIndex': str(start),
+            'opensearch:itemsPerPage': str(len(entries)),
+            'cursor': {'@current': str(start), '@next': str(start + count)},
+            'entry': entries}}
+
+    def _ref_page(self, path, start):
+        key = (path, 'REF')
+        if key not in self._entries:
+            recorded = self._recorded(path, 'REF')
+            if recorded is not None:
+                refs = recorded['abstracts-retrieval-response']['references']['reference']
+            else:
+                refs = [reference(i) for i in range(self.refs)]
+            self._entries[key] = refs
+        refs = self._entries[key]
+        return {'abstracts-retrieval-response': {'references': {
+            '@total-references': str(len(refs)),
+            'reference': refs[start:start + REFS_PER_PAGE]}}}
+
+    def _retrieval(self, path, view):
+        recorded = self._recorded(path, view)
+        if recorded is not None:
+            return recorded
+        payload = abstract_full(n_refs=100)
+        identifier = path.rstrip('/').rsplit('/', 1)[-1]
+        payload['abstracts-retrieval-response']['coredata']['eid'] = identifier
+        return payload
+
+
+def serve(api: MockAPI, port: int = 0, host: str = '127.0.0.1') -> ThreadingHTTPServer:
+    """Create a server for `api`; call `serve_forever()` to run it."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+        disable_nagle_algorithm = True  # Headers and body are written separately
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {k: v[0] for k, v in parse_qs(url.query).items()}
+            status, body = api.respond(url.path, params)
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('X-RateLimit-Remaining', '10000')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def main() -> None:
+    parser = ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--port', type=int, default=8800)
+    parser.add_argument('--results', type=int, default=2000,
+                        help='number of results of every search')
+    parser.add_argument('--refs', type=int, default=1000,
+                        help='number of references in view REF')
+    parser.add_argument('--latency', type=float, default=0.0,
+                        help='seconds to wait before each response')
+    parser.add_argument('--jitter', type=float, default=0.0,
+                        help='maximum random seconds added to the latency')
+    parser.add_argument('--rate-limit-every', type=int, default=0,
+                        help='answer every n-th request with status 429')
+    parser.add_argument('--replay', help='folder with recorded responses')
+    args = parser.parse_args()
+    api = MockAPI(args.results, args.refs, args.latency, args.jitter,
+                  args.rate_limit_every, args.replay)
+    server = serve(api, args.port)
+    print('ready', flush=True)
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+"""Synthetic API responses shaped like those of the Scopus APIs.
+
+The generators are deterministic, so timings remain comparable across runs.
+"""
+
+
+def author(i: int, n_afids: int = 2) -> dict:
+    """An author entry as contained in Scopus Search API results."""
+    return {
+        '@_fa': 'true', '@seq': str(i + 1),
+        'author-url': f'https://api.elsevier.com/content/author/author_id/{57000000000 + i}',
+        'authid': str(57000000000 + i), 'authname': f'Surname{i} G.',
+        'surname': f'Surname{i}', 'given-name': f'Given{i}', 'initials': 'G.',
+        'afid': [{'@_fa': 'true', '$': str(60000000 + (i + k) % 50)}
+                 for k in range(n_afids)]
+    }
+
+
+def search_entry(i: int, n_authors: int = 10) -> dict:
+    """A document entry as returned by the Scopus Search API (COMPLETE)."""
+    authors = [author(k) for k in range(n_authors)]
+    affiliations = [{'@_fa': 'true', 'afid': str(60000000 + k),
+                     'affilname': f'University &amp; Institute {k}',
+                     'affiliation-city': 'City', 'affiliation-country': 'Country'}
+                    for k in range(min(n_authors, 50))]
+    return {
+        '@_fa': 'true', 'eid': f'2-s2.0-{85000000000 + i}',
+        'dc:identifier': f'SCOPUS_ID:{85000000000 + i}',
+        'prism:doi': f'10.1016/j.test.{2020 + i % 5}.{i:06d}',
+        'pii': f'S0000000000{i:06d}', 'pubmed-id': str(30000000 + i),
+        'dc:title': f'Title of document {i} &amp; more',
+        'dc:creator': 'Surname0 G.', 'subtype': ('ar', 're', 'cp')[i % 3],
+        'subtypeDescription': ('Article', 'Review', 'Conference Paper')[i % 3],
+        'prism:publicationName': f'Journal {i % 20}', 'prism:issn': '12345678',
+        'prism:eIssn': '87654321', 'source-id': str(20000 + i % 20),
+        'prism:volume': str(i % 50), 'prism:issueIdentifier': str(i % 12),
+        'prism:pageRange': f'{i}-{i + 10}', 'article-number': None,
+        'prism:coverDate': f'{2020 + i % 5}-0{1 + i % 9}-01',
+        'prism:coverDisplayDate': 'January 2020',
+        'prism:aggregationType': 'Journal', 'citedby-count': str(i % 100),
+        'openaccess': str(i % 2), 'openaccessFlag': bool(i % 2),
+        'dc:description': f'Abstract {i}. ' + 'Lorem ipsum dolor sit amet. ' * 10,
+        'authkeywords': 'Keyword one | Keyword two | Keyword three',
+        'affiliation': affiliations, 'author-count': {'@limit': '100', '$': str(n_authors)},
+        'author': authors, 'fund-no': 'undefined', 'fund-sponsor': 'Agency',
+        'freetoread': {'value': [{'$': 'all'}, {'$': 'publisherhybridgold'}]},
+        'freetoreadLabel': {'value': [{'$': 'All Open Access'}, {'$': 'Hybrid Gold'}]},
+    }
+
+
+def author_search_entry(i: int) -> dict:
+    """An author entry as returned by the Author Search API."""
+    return {
+        '@_fa': 'true', 'dc:identifier': f'AUTHOR_ID:{57000000000 + i}',
+        'eid': f'9-s2.0-{57000000000 + i}', 'orcid': f'0000-0000-0000-{i % 10000:04d}',
+        'preferred-name': {'surname': f'Surname{i}', 'given-name': f'Given{i}',
+                           'initials': 'G.'},
+        'name-variant': [{'surname': f'Surname{i}', 'given-name': 'G.'}],
+        'document-count': str(i % 300),
+        'subject-area': [{'@abbrev': a, '@frequency': str(k + i % 7), '$': a}
+                         for k, a in enumerate(('MEDI', 'COMP', 'ENGI'))],
+        'affiliation-current': {'affiliation-url': '', 'affiliation-id': str(60000000 + i % 50),
+                                'affiliation-name': f'University {i % 50}',
+                                'affiliation-city': 'City', 'affiliation-country': 'Country'},
+    }
+
+
+def search_response(entries: list, total: int | None = None, cursor: str = '*') -> dict:
+    """A page of results of a search API."""
+    return {'search-results': {
+        'opensearch:totalResults': str(len(entries) if total is None else total),
+        'opensearch:startIndex': '0', 'opensearch:itemsPerPage': str(len(entries)),
+        'cursor': {'@current': cursor, '@next': cursor + 'n'},
+        'entry': entries}}
+
+
+def reference(i: int) -> dict:
+    """A reference as contained in an Abstract Retrieval API response."""
+    return {
+        '@reference-instance-id': str(i), '@id': str(84000000000 + i),
+        'ref-info': {
+            'ref-title': {'ref-titletext': f'Referenced work {i}'},
+            'refd-itemidlist': {'itemid': [
+                {'@idtype': 'SGR', '$': str(84000000000 + i)},
+                {'@idtype': 'DOI', '$': f'10.1000/ref.{i}'}]},
+            'ref-authors': {'author': [
+                {'@seq': str(k + 1), 'ce:initials': 'A.', 'ce:indexed-name': f'Author{k} A.',
+                 'ce:surname': f'Author{k}'} for k in range(5)]},
+            'ref-sourcetitle': f'Journal {i % 30}',
+            'ref-publicationyear': {'@first': str(1990 + i % 30)},
+            'ref-volisspag': {'voliss': {'@volume': str(i % 40)},
+                              'pagerange': {'@first': '1', '@last': '20'}},
+            'ref-text': None},
+        'ref-fulltext': f'Author0 A., et al. Referenced work {i}. Journal {i % 30}.'}
+
+
+def abstract_full(n_refs: int = 100, n_authors: int = 10) -> dict:
+    """An Abstract Retrieval API response in view FULL."""
+    authors = [{'@seq': str(k + 1), '@auid': str(57000000000 + k),
+                'ce:initials': 'G.', 'ce:indexed-name': f'Surname{k} G.',
+                'ce:surname': f'Surname{k}', 'ce:given-name': f'Given{k}',
+                'affiliation': {'@id': str(60000000 + k % 50)}}
+               for k in range(n_authors)]
+    return {'abstracts-retrieval-response': {
+        'coredata': {'eid': '2-s2.0-85000000000', 'dc:title': 'A document',
+                     'dc:description': 'Lorem ipsum dolor sit amet. ' * 60,
+                     'citedby-count': '42', 'prism:doi': '10.1016/j.test.2020.000000',
+                     'prism:publicationName': 'Journal', 'prism:coverDate': '2020-01-01'},
+        'authors': {'author': authors},
+        'item': {'bibrecord': {
+            'head': {'abstracts': 'Lorem ipsum dolor sit amet. ' * 60},
+            'tail': {'bibliography': {'@refcount': str(n_refs),
+                                      'reference': [reference(k) for k in range(n_refs)]}}}},
+        'references': {'@total-references': str(n_refs),
+                       'reference': [reference(k) for k in range(n_refs)]}}}
@@ -1,11 +1,29 @@
-from importlib.metadata import version
-
-__version__ = version("pybliometrics")
-
 __citation__ = 'Rose, Michael E. and John R. Kitchin: "pybliometrics: '\
     'Scriptable bibliometrics using a Python interface to Scopus", SoftwareX '\
     '10 (2019) 100263.'
 
-import pybliometrics.scopus
-import pybliometrics.sciencedirect
-from pybliometrics.utils.startup import init
+# Subpackages and objects are imported on first access (PEP 562), so that
+# `import pybliometrics` stays cheap
+_SUBMODULES = ('exception', 'sciencedirect', 'scival', 'scopus',
+               'superclasses', 'utils')
+_OBJECTS = {'init': 'pybliometrics.utils.startup',
+            'profile': 'pybliometrics.utils.profiling'}
+
+
+def __getattr__(name):
+    from importlib import import_module
+    if name == '__version__':
+        from importlib.metadata import version
+        value = version("pybliometrics")
+    elif name in _SUBMODULES:
+        value = import_module(f'pybliometrics.{name}')
+    elif name in _OBJECTS:
+        value = getattr(import_module(_OBJECTS[name]), name)
+    else:
+        raise AttributeError(f"module 'pybliometrics' has no attribute '{name}'")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted([*globals(), '__version__', *_SUBMODULES, *_OBJECTS])
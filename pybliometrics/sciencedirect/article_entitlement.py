@@ -1,7 +1,8 @@
 """Module for retrieving article entitlement information from ScienceDirect."""
 
 from pybliometrics.superclasses import Retrieval
-from pybliometrics.utils import chained_get, check_parameter_value, detect_id_type, VIEWS
+from pybliometrics.utils import chained_get, check_parameter_value, detect_id_type, \
+    remember_eid, VIEWS
 
 
 class ArticleEntitlement(Retrieval):
@@ -83,9 +84,15 @@ class ArticleEntitlement(Retrieval):
 
         self._view = view
         self._refresh = refresh
+        self._id = identifier
+        self._id_type = id_type
         # Retrieve and get content
         Retrieval.__init__(self, identifier=identifier, id_type=id_type, **kwds)
+
+    def _process_json(self) -> None:
         self._json = chained_get(self._json, ["entitlement-response", "document-entitlement"])
+        if self._json:
+            remember_eid(self._id, self._id_type, self.eid)
 
     def __str__(self) -> str:
         s = self.message
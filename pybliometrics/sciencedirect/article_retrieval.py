@@ -1,10 +1,12 @@
 from typing import NamedTuple
 
 from pybliometrics.superclasses import Retrieval
+from pybliometrics.superclasses.base import _body_file_path
 from pybliometrics.utils import (
     chained_get,
     check_parameter_value,
     detect_id_type,
+    json_loads,
     list_authors,
     make_bool_if_possible,
     make_int_if_possible,
@@ -121,8 +123,23 @@ class ArticleRetrieval(Retrieval):
 
     @property
     def originalText(self) -> str | None:
-        """Complete document text."""
-        return self._json.get('originalText')
+        """Complete document text.  Read from the cache only when first
+        accessed.  The text is cached in a file of its own next to the
+        other data and shares their age; if it has been removed since, the
+        document is downloaded again.
+        """
+        if 'originalText' not in self._json:
+            if self._view == 'FULL':
+                try:
+                    text = json_loads(_body_file_path(self._cache_file_path).read_bytes())
+                except FileNotFoundError:
+                    identifier, id_type, kwds = self._arguments
+                    text = ArticleRetrieval(identifier, refresh=True, view=self._view,
+                                            id_type=id_type, **kwds).originalText
+            else:
+                text = None
+            self._json['originalText'] = text
+        return self._json['originalText']
 
     @property
     def pageRange(self) -> str | None:
@@ -221,8 +238,11 @@ class ArticleRetrieval(Retrieval):
 
         self._view = view
         self._refresh = refresh
+        self._arguments = (identifier, id_type, kwds)
 
         Retrieval.__init__(self, identifier=identifier, id_type=id_type, **kwds)
+
+    def _process_json(self) -> None:
         if self._view != "ENTITLED":
             self._json = self._json['full-text-retrieval-response']
 
@@ -110,6 +110,7 @@ class NonserialTitle(Retrieval):
         # Load json
         Retrieval.__init__(self, identifier=self._id, **kwds)
 
+    def _process_json(self) -> None:
         # Parse json
         self._json = self._json['nonserial-metadata-response']
         self._entry = self._json['entry'][0]
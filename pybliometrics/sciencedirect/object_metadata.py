@@ -3,7 +3,8 @@
 from typing import NamedTuple
 
 from pybliometrics.superclasses import Retrieval
-from pybliometrics.utils import chained_get, check_parameter_value, detect_id_type, make_int_if_possible, VIEWS
+from pybliometrics.utils import chained_get, check_parameter_value, detect_id_type, make_int_if_possible, \
+    remember_eid, VIEWS
 
 
 class Metadata(NamedTuple):
@@ -74,6 +75,13 @@ class ObjectMetadata(Retrieval):
 
         super().__init__(self.identifier, self.id_type, **kwds)
 
+    def _process_json(self) -> None:
+        # Object EIDs consist of the document's EID and the object's filename
+        for obj in self.results[:1]:
+            suffix = f'-{obj.filename}'
+            if obj.filename and obj.eid.endswith(suffix):
+                remember_eid(self.identifier, self.id_type, obj.eid[:-len(suffix)])
+
     def __str__(self):
         return (f'Document with {self.id_type} {self.identifier} contains '
                 f'{len(self.results)} objects.')
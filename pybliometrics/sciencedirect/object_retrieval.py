@@ -1,17 +1,65 @@
 """Module to retrieve a specific object of a document."""
 
+import mmap
+import shutil
 from io import BytesIO
+from pathlib import Path
+from threading import RLock
+from weakref import finalize, WeakSet
 
 from pybliometrics.sciencedirect import ArticleRetrieval
 from pybliometrics.superclasses import Retrieval
-from pybliometrics.utils import check_parameter_value, detect_id_type
+from pybliometrics.superclasses.base import _CacheProbe
+from pybliometrics.utils import check_parameter_value, detect_id_type, \
+    lookup_eid, remember_eid
+
+
+# Open views on cached objects, by cached file
+_VIEWS = {}
+_VIEWS_LOCK = RLock()
+
+
+class ObjectBuffer(mmap.mmap):
+    """Read-only, memory-mapped view on a cached object.  Behaves like a
+    binary file object and supports the buffer protocol, so that the
+    object's content is never copied into memory as a whole.  Close it
+    with `close()` or by using it as context manager.
+    """
+    def getvalue(self) -> bytes:
+        """Return the entire content, like `BytesIO.getvalue()`."""
+        return self[:]
 
 
 class ObjectRetrieval(Retrieval):
     @property
-    def object(self) -> BytesIO:
-        """The object retrieved."""
-        return BytesIO(self._object)
+    def object(self) -> ObjectBuffer | BytesIO:
+        """The object retrieved, as a memory-mapped, file-like view on the
+        cached file.  Each access returns a new view positioned at the start.
+        Empty objects are returned as empty `BytesIO`.  Views stay open
+        until closed, e.g. with `close()` of this object.
+        """
+        if not self.size:
+            return BytesIO()
+        with self._cache_file_path.open('rb') as f:
+            view = ObjectBuffer(f.fileno(), 0, access=mmap.ACCESS_READ)
+        with _VIEWS_LOCK:
+            _VIEWS.setdefault(self._file_identifier, WeakSet()).add(view)
+        finalize(view, _forget_views, self._file_identifier)
+        self._views.add(view)
+        return view
+
+    @property
+    def _object(self) -> bytes:
+        """The content of the object.  Kept for backward compatibility;
+        prefer `object` or `save_to()`, which do not read the entire object
+        into memory.
+        """
+        return self._cache_file_path.read_bytes()
+
+    @property
+    def size(self) -> int:
+        """The size of the object in bytes."""
+        return self._cache_file_path.stat().st_size
 
     def __init__(self,
                  identifier: int | str,
@@ -39,23 +87,80 @@ class ObjectRetrieval(Retrieval):
             check_parameter_value(id_type, allowed_id_types, "id_type")
 
         if id_type != 'eid':
-            identifier = self._get_eid(identifier)
+            identifier = self._get_eid(identifier, id_type)
         file_identifier = f'{identifier}-{filename}'
 
         self._identifier = identifier
         self._filename = filename
+        self._file_identifier = file_identifier
         self._view = ''
         self._refresh = refresh
+        self._views = WeakSet()
 
         super().__init__(file_identifier, 'eid', **kwds)
 
-    def _get_eid(self, identifier: str) -> str:
-        """Get the EID of a document."""
-        am = ArticleRetrieval(identifier, field='eid')
-        return am.eid
+    def __enter__(self) -> "ObjectRetrieval":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close all views returned by `object`."""
+        _close_views(self._views)
+
+    def _release_cache_file(self) -> None:
+        """Close all views on the cached file (of any object), which is
+        about to be replaced.  Open views prevent this on Windows.
+        """
+        with _VIEWS_LOCK:
+            views = _VIEWS.pop(self._file_identifier, ())
+        _close_views(views)
+
+    def save_to(self, path: str | Path) -> Path:
+        """Copy the object to a file without loading it into memory.
+
+        :param path: The file to write to.  If it is an existing folder,
+                     the object is saved there under its filename.
+        :returns: The path of the written file.
+        """
+        path = Path(path)
+        if path.is_dir():
+            path = path / self._filename
+        shutil.copyfile(self._cache_file_path, path)
+        return path
+
+    def _get_eid(self, identifier: str, id_type: str) -> str:
+        """Get the EID of a document, from the persistent EID map if the
+        identifier has been resolved before.
+        """
+        eid = lookup_eid(identifier, id_type)
+        if eid is None:
+            if self._probe_cache:
+                raise _CacheProbe(None, hit=False)  # Resolving would download
+            am = ArticleRetrieval(identifier, id_type=id_type, field='eid')
+            eid = am.eid
+            remember_eid(identifier, id_type, eid)
+        return eid
 
     def __str__(self) -> str:
         """Return a string with the filename, document and object size in KB."""
-        size_kb = f"{len(self._object) / 1024:.1f}" if self._object else "0.0"
+        size_kb = f"{self.size / 1024:.1f}"
         return (f"Object {self._filename} from document with EID {self._identifier}"
                 f" has size of {size_kb} KB.")
+
+
+def _close_views(views) -> None:
+    """Auxiliary function to close memory-mapped views."""
+    for view in list(views):
+        view.close()
+
+
+def _forget_views(file_identifier: str) -> None:
+    """Auxiliary function to drop the entry of a cached file from `_VIEWS`
+    once all its views are gone.
+    """
+    with _VIEWS_LOCK:
+        views = _VIEWS.get(file_identifier)
+        if views is not None and not list(views):
+            del _VIEWS[file_identifier]
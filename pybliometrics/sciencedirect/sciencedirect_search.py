@@ -1,9 +1,10 @@
 from typing import NamedTuple
 
 from pybliometrics.superclasses import Search
-from pybliometrics.utils import check_field_consistency, chained_get, \
-    check_integrity, check_parameter_value, deduplicate, \
-    make_search_summary, VIEWS
+from pybliometrics.utils import check_column_integrity, \
+    check_field_consistency, chained_get, check_integrity, \
+    check_parameter_value, deduplicate, make_arrow_table, \
+    make_search_summary, RecordStore, VIEWS
 
 
 class Document(NamedTuple):
@@ -24,7 +25,18 @@ class Document(NamedTuple):
     volume: str | None
 
 
+# Types of columns in columnar exports (all other columns are strings)
+_COLUMN_TYPES = {
+    'openaccess_status': 'bool',
+    'coverDate': 'date',
+    'publicationName': 'dictionary',
+}
+
+
 class ScienceDirectSearch(Search):
+    _document = Document
+    _column_types = _COLUMN_TYPES
+
     @property
     def results(self) -> list[Document] | None:
         """A list of namedtuples in the form `(authors first_author doi title link
@@ -46,46 +58,68 @@ class ScienceDirectSearch(Search):
         The list of authors and the list of affiliations per author are
         deduplicated.
         """
-        fields = 'authors first_author doi title link load_date openaccess_status pii '\
-            'coverDate endingPage publicationName startingPage api_link volume'
-        check_field_consistency(self._integrity, fields)
-        # Parse elements one-by-one
-        out = []
-        for item in self._json:
-            # Get authors and create ";" separated string
-            authors_list = self._get_authors(item)
-            authors_list = deduplicate(authors_list)
-            authors = ';'.join(authors_list)
-            # Get links
-            links_found = item.get('link')
-            links = {'api_link': None, 'scidir': None}
-            for link in links_found:
-                if link.get('@ref') == 'self':
-                    links['api_link'] = link.get('@href')
-                elif link.get('@ref') == 'scidir':
-                    links['scidir'] = link.get('@href')
-            # Get doi
-            doi = item.get("prism:doi") or item.get("dc:identifier")[4:] if item.get("dc:identifier") else None
-            new = Document(
-                authors=authors,
-                first_author=item.get('dc:creator'),
-                doi=doi,
-                title=item.get("dc:title"),
-                link=links["scidir"],
-                load_date=item.get("load-date"),
-                openaccess_status=item.get("openaccess"),
-                pii=item.get("pii"),
-                coverDate=item.get("prism:coverDate"),
-                endingPage=item.get("prism:endingPage"),
-                publicationName=item.get("prism:publicationName"),
-                startingPage=item.get("prism:startingPage"),
-                api_link=links["api_link"] or item.get("prism:url"),
-                volume=item.get("prism:volume")
-            )
-            out.append(new)
+        check_field_consistency(self._integrity, " ".join(Document._fields))
+        out = [Document._make(_parse_document(item)) for item in self._json]
         check_integrity(out, self._integrity, self._action)
         return out or None
 
+    def results_table(self) -> dict[str, list]:
+        """The search results as dictionary of columns, i.e. one list per
+        field of `results`.  Columns are built straight from the downloaded
+        data, which makes conversion into DataFrames much faster than via
+        `results`, e.g. with `pandas.DataFrame(s.results_table())`.
+
+        Raises
+        ------
+        ValueError
+            If the elements provided in `integrity_fields` do not match the
+            actual field names (see `results`).
+        """
+        check_field_consistency(self._integrity, " ".join(Document._fields))
+        rows = [_parse_document(item) for item in self._json]
+        values = zip(*rows) if rows else [[]] * len(Document._fields)
+        columns = {field: list(col) for field, col in zip(Document._fields, values)}
+        check_column_integrity(columns, self._integrity, self._action)
+        return columns
+
+    def results_compact(self) -> RecordStore | None:
+        """The search results as compact, column-wise `RecordStore`, which
+        needs less memory than `results`, how much less depending on how
+        many values repeat; strings unique to each document, like titles,
+        take most of it.  It is built while parsing, without
+        creating `results` or `results_table()` first.  With
+        `init(lazy=True)`, it is built from the cached file line by line,
+        without decoding all results at once.
+        Its elements behave like the namedtuples of `results` (indexing,
+        attribute access, iteration and comparison), but are no instances
+        of `tuple`.  Use `.to_records()` to obtain the namedtuples.
+
+        Raises
+        ------
+        ValueError
+            If the elements provided in `integrity_fields` do not match the
+            actual field names (see `results`).
+        """
+        check_field_consistency(self._integrity, " ".join(Document._fields))
+        rows = (_parse_document(item) for item in self._iter_entries())
+        store = RecordStore.from_rows(Document, rows, self._n)
+        if not store:
+            return None
+        columns = {field: store.column(field) for field in self._integrity}
+        check_column_integrity(columns, self._integrity, self._action)
+        return store
+
+    def to_arrow(self):
+        """The search results as `pyarrow.Table` with typed columns:
+        `openaccess_status` is boolean, `coverDate` is a date and
+        `publicationName` is dictionary-encoded.  All other fields are
+        strings.
+
+        Requires `pyarrow`, which you can install via
+        `pip install pybliometrics[arrow]`.
+        """
+        return make_arrow_table(self.results_table(), self._column_types)
+
     def __init__(self,
                  query: str,
                  refresh: bool | int = False,
@@ -172,13 +206,41 @@ class ScienceDirectSearch(Search):
         """DOIs of retrieved documents."""
         return [d.get("prism:doi") or d.get("dc:identifier")[4:] if d.get("dc:identifier") else None for d in self._json]
 
-    def _get_authors(self, item: dict) -> list:
-        """Auxiliary function to get the authors."""
-        authors_data = chained_get(item, ['authors', 'author'], [])
-        if isinstance(authors_data, list):
-            authors_list = [a.get('$') for a in authors_data]
-        elif isinstance(authors_data, str):
-            authors_list = [authors_data]
-        else:
-            authors_list = []
-        return authors_list
+
+def _get_authors(item: dict) -> list:
+    """Auxiliary function to get the authors."""
+    authors_data = chained_get(item, ['authors', 'author'], [])
+    if isinstance(authors_data, list):
+        authors_list = [a.get('$') for a in authors_data]
+    elif isinstance(authors_data, str):
+        authors_list = [authors_data]
+    else:
+        authors_list = []
+    return authors_list
+
+
+def _parse_document(item):
+    """Auxiliary function to parse one search result into a tuple whose
+    elements are ordered like the fields of `Document`.
+    """
+    # Get authors and create ";" separated string
+    authors_list = _get_authors(item)
+    authors_list = deduplicate(authors_list)
+    authors = ';'.join(authors_list)
+    # Get links
+    links_found = item.get('link')
+    links = {'api_link': None, 'scidir': None}
+    for link in links_found:
+        if link.get('@ref') == 'self':
+            links['api_link'] = link.get('@href')
+        elif link.get('@ref') == 'scidir':
+            links['scidir'] = link.get('@href')
+    # Get doi
+    doi = item.get("prism:doi") or item.get("dc:identifier")[4:] if item.get("dc:identifier") else None
+    return (authors, item.get('dc:creator'), doi, item.get("dc:title"),
+            links["scidir"], item.get("load-date"), item.get("openaccess"),
+            item.get("pii"), item.get("prism:coverDate"),
+            item.get("prism:endingPage"), item.get("prism:publicationName"),
+            item.get("prism:startingPage"),
+            links["api_link"] or item.get("prism:url"),
+            item.get("prism:volume"))
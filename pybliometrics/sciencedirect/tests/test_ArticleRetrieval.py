@@ -2,6 +2,9 @@
 
 from pybliometrics.sciencedirect import ArticleRetrieval, init
 from pybliometrics.sciencedirect.article_retrieval import Author
+from pybliometrics.superclasses import base
+from pybliometrics.superclasses.base import _body_file_path
+from pybliometrics.utils import json_dumps, json_loads
 
 init()
 
@@ -156,6 +159,35 @@ def test_originalText():
     assert ar_full.originalText[-80000:-78000] == ar_full_test_originalText
 
 
+def test_originalText_lazy():
+    ar = ArticleRetrieval('S2949948823000112', view='FULL', refresh=30)
+    assert _body_file_path(ar._cache_file_path).exists()
+    ar = ArticleRetrieval('S2949948823000112', view='FULL')
+    assert 'originalText' not in ar._json
+    assert ar.title == ar_full.title
+    assert ar.originalText == ar_full.originalText
+
+
+def test_originalText_old_cache(monkeypatch):
+    ar = ArticleRetrieval('S2949948823000112', view='FULL', refresh=30)
+    fname = ar._cache_file_path
+    body = _body_file_path(fname)
+    # Files cached before bodies were stored separately
+    data = json_loads(fname.read_bytes())
+    data['full-text-retrieval-response']['originalText'] = json_loads(body.read_bytes())
+    fname.write_bytes(json_dumps(data))
+    body.unlink()
+
+    def get_content(*args, **kwds):
+        raise AssertionError("No request expected")
+
+    monkeypatch.setattr(base, 'get_content', get_content)
+    ar = ArticleRetrieval('S2949948823000112', view='FULL', refresh=30)
+    assert body.exists()
+    assert 'originalText' not in ar._json
+    assert ar.originalText == ar_full.originalText
+
+
 def test_pageRange():
     assert ar_full.pageRange == '179-196'
     assert ar_meta.pageRange == '679-688'
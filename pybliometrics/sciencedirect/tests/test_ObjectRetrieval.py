@@ -2,10 +2,10 @@
 
 import xml.etree.ElementTree as ET
 
-from io import BytesIO
 from PIL import Image
 
-from pybliometrics.sciencedirect import init, ObjectRetrieval
+from pybliometrics.sciencedirect import init, ObjectBuffer, ObjectRetrieval
+from pybliometrics.sciencedirect import object_retrieval
 
 init()
 
@@ -19,18 +19,47 @@ or_2 = ObjectRetrieval('10.1016/j.rcim.2020.102086',
 
 
 def test_object():
-    """Tests whether the object is a BytesIO object and its content."""
+    """Tests whether the object is a memory-mapped buffer and its content."""
     obj_1_last_50 = b'\xbf\xbd\xb6\xeb;+\\\x87Y7\x94[y\x17\xe3\xeb/(\xcf#\xda\xc9\x90\x80 \x08\x02\x00\x80 \x08\x02\x00\x80 \x08\x02\x00\x80 \x08\x02\x00\x80 \x08\x02\x03\xff\xd9'
-    assert isinstance(or_1.object, BytesIO)
+    assert isinstance(or_1.object, ObjectBuffer)
     assert or_1.object.getvalue()[-50:] == obj_1_last_50
     with Image.open(or_1.object) as img:
         assert img.format.lower() == 'jpeg'
 
     obj_2_150_200 = b"085 235.866 8.8237' width='283.039pt' xmlns='http:"
-    assert isinstance(or_2.object, BytesIO)
+    assert isinstance(or_2.object, ObjectBuffer)
     assert or_2.object.getvalue()[150:200] == obj_2_150_200
     assert ET.parse(or_2.object).getroot().tag == '{http://www.w3.org/2000/svg}svg'
 
+
+def test_close():
+    """Tests whether views are closed together with the object."""
+    with ObjectRetrieval('10.1016/j.rcim.2020.102086', 'si92.svg',
+                         id_type='doi', refresh=30) as obj:
+        view = obj.object
+        assert not view.closed
+        assert obj._object == view.getvalue()
+    assert view.closed
+
+
+def test_views_of_other_objects():
+    """Tests whether views stay open unless the cached file is replaced."""
+    view = or_2.object
+    ObjectRetrieval('10.1016/j.rcim.2020.102086', 'si92.svg',
+                    id_type='doi', refresh=30)
+    assert not view.closed
+    del view
+    assert or_2._file_identifier not in object_retrieval._VIEWS
+
+
+def test_save_to(tmp_path):
+    """Tests whether the object is copied to a file or folder."""
+    target = or_1.save_to(tmp_path / 'figure.jpg')
+    assert target.read_bytes() == or_1.object.getvalue()
+    assert or_2.save_to(tmp_path) == tmp_path / 'si92.svg'
+    assert or_2.size == (tmp_path / 'si92.svg').stat().st_size
+
+
 def test_str():
     """Tests the string representation of the ObjectRetrieval object."""
     expected_1 = "Object gr10.jpg from document with EID 1-s2.0-S156984322300331X has size of 34.7 KB."
@@ -1,5 +1,7 @@
 """Tests for sciencedirect.ScienceDirectSearch"""
 
+import pytest
+
 from pybliometrics.exception import Scopus400Error
 from pybliometrics.sciencedirect import ScienceDirectSearch, init
 from pybliometrics.sciencedirect.sciencedirect_search import Document
@@ -73,3 +75,17 @@ def test_wrong_query():
         raise AssertionError(f"Unexpected exception type: {type(e).__name__}")
     else:
         raise AssertionError("Expected Scopus400Error but no exception was raised")
+
+
+def test_results_table():
+    received = sds_standard.results_table()
+    assert list(received.keys()) == list(Document._fields)
+    assert list(zip(*received.values())) == sds_standard.results
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    sds_standard.to_parquet(tmp_path)
+    sds_empty.to_parquet(tmp_path)
+    received = ScienceDirectSearch.read_parquet(tmp_path, columns=['doi', 'year'])
+    assert received.to_pylist() == [{'doi': '10.1016/j.eswa.2024.124912', 'year': 2024}]
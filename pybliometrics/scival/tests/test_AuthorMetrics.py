@@ -216,3 +216,12 @@ def test_str_representation():
     str_empty = str(empty_metrics)
     expected_empty = "No authors found"
     assert str_empty == expected_empty
+
+
+def test_chunks():
+    """Test that chunked requests are merged into the same results."""
+    chunked = AuthorMetrics([7201667143, 6603480302], by_year=True, refresh=30,
+                            chunk_size=1, metric_chunk_size=2)
+    assert sorted(chunked.authors) == sorted(multiple_authors_all.authors)
+    assert sorted(chunked.CitationCount) == sorted(multiple_authors_all.CitationCount)
+    assert sorted(chunked.ScholarlyOutput) == sorted(multiple_authors_all.ScholarlyOutput)
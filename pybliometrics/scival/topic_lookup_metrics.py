@@ -1,8 +1,9 @@
 from typing import NamedTuple
 
 from pybliometrics.superclasses import Retrieval
-from pybliometrics.utils import make_int_if_possible
-from pybliometrics.utils.constants import SCIVAL_METRICS
+from pybliometrics.utils import make_chunks, make_int_if_possible, make_stable_chunks, \
+    map_in_threads, merge_metric_results, split_values
+from pybliometrics.utils.constants import SCIVAL_MAX_ENTITIES, SCIVAL_METRICS
 from pybliometrics.utils.parse_metrics import extract_metric_data, extract_metric_lists, MetricData
 
 
@@ -345,6 +346,9 @@ class TopicLookupMetrics(Retrieval):
                  metric_types: str | list | None = None,
                  by_year: bool = False,
                  refresh: bool | int = False,
+                 chunk_size: int = SCIVAL_MAX_ENTITIES,
+                 metric_chunk_size: int | None = None,
+                 workers: int = 4,
                  **kwds: str
                  ) -> None:
         """Interaction with the SciVal's `metrics` endpoint of the `TopicLookup API`.
@@ -365,6 +369,16 @@ class TopicLookupMetrics(Retrieval):
         :param refresh: Whether to refresh the cached file if it exists or not.
                         If int is passed, cached file will be refreshed if the
                         number of days since last modification exceeds that value.
+        :param chunk_size: The maximum number of topics per request.  Longer
+                           lists are deduplicated, sorted and split into
+                           chunks, which are downloaded concurrently, cached
+                           separately and merged.  Chunk boundaries depend
+                           on the IDs, so that overlapping lists share most
+                           chunks.
+        :param metric_chunk_size: The maximum number of metric types per
+                                  request.  If `None`, all metric types are
+                                  requested at once.
+        :param workers: The number of chunks to download concurrently.
         :param kwds: Keywords passed on as query parameters.  Must contain
                      fields and values mentioned in the 
                      https://dev.elsevier.com/documentation/SciValTopicAPI.wadl.
@@ -389,6 +403,24 @@ class TopicLookupMetrics(Retrieval):
         if isinstance(metric_types, list):
             metric_types = ",".join(metric_types)
 
+        # Split long lists into chunks, which are cached separately
+        ids = split_values(topic_ids)
+        metrics = split_values(metric_types)
+        if len(ids) > chunk_size or (metric_chunk_size and len(metrics) > metric_chunk_size):
+            self._probe_parts()
+            chunks = [(i, m) for i in make_stable_chunks(sorted(set(ids)), chunk_size)
+                      for m in make_chunks(metrics, metric_chunk_size)]
+
+            def retrieve(chunk):
+                return TopicLookupMetrics(*chunk, by_year=by_year, refresh=refresh,
+                                          chunk_size=chunk_size,
+                                          metric_chunk_size=metric_chunk_size, **kwds)
+
+            parts = map_in_threads(retrieve, chunks, workers)
+            self._json = merge_metric_results([p._json for p in parts], "topic")
+            self._adopt_cache_info(parts)
+            return
+
         # Set up parameters for the API call
         params = {
             'topicIds': topic_ids,
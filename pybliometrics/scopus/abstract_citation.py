@@ -4,7 +4,11 @@ from typing import NamedTuple
 from warnings import warn
 
 from pybliometrics.superclasses import Retrieval
-from pybliometrics.utils import chained_get, check_parameter_value
+from pybliometrics.utils import chained_get, check_parameter_value, listify, \
+    make_stable_chunks, map_in_threads
+
+# Maximum number of identifiers per request
+CHUNK_SIZE = 25
 
 
 class Author(NamedTuple):
@@ -208,13 +212,18 @@ class CitationOverview(Retrieval):
                  id_type: str = "scopus_id",
                  refresh: bool | int = False,
                  citation: str | None = None,
+                 workers: int = 4,
                  **kwds: str
                  ) -> None:
         """Interaction with the Citation Overview API.
 
-        :param identifier: Up to 25 identifiers of the same kind for which to look
+        :param identifier: Identifiers of the same kind for which to look
                            up citations.  Must be Scopus IDs, DOIs, PIIs or
-                           Pubmed IDs.
+                           Pubmed IDs.  More than 25 identifiers are split
+                           into chunks of at most 25, which are downloaded
+                           (and cached) separately and merged.  Chunk
+                           boundaries depend on the identifiers, so that
+                           overlapping lists share most chunks.
         :param date: Represents the year range for which the citations should be counted.
                      If `None`, Scopus returns data for the current and the previous
                      two years.
@@ -230,6 +239,8 @@ class CitationOverview(Retrieval):
         :param citation: Allows for the exclusion of self-citations or those
                          by books.  If `None`, will count all citations.
                          Allowed values: `None, exclude-self, exclude-books`
+        :param workers: The number of chunks to download concurrently if
+                        there are more than 25 identifiers.
         :param kwds: Keywords passed on as query parameters.  Must contain
                      fields and values mentioned in the API specification at
                      https://dev.elsevier.com/documentation/AbstractCitationAPI.wadl.
@@ -237,8 +248,7 @@ class CitationOverview(Retrieval):
         Raises
         -----
         ValueError
-            If parameter `identifier` contains fewer than 1 or more than
-            25 elements.
+            If parameter `identifier` contains no element.
 
         ValueError
             If any of the parameters `citation`, `id_type` or `refresh` is not
@@ -248,7 +258,12 @@ class CitationOverview(Retrieval):
         -----
         The directory for cached results is `{path}/STANDARD/{id}-{citation}-{date}`,
         where `path` is specified in your configuration file, and `id` the
-        md5-hashed version of a string joining `identifier` on underscore.
+        md5-hashed version of a string joining `identifier` (or, for more
+        than 25 identifiers, those of each chunk) on underscore.
+
+        The merged results of chunks list the documents chunk by chunk.
+        Column totals are summed up and the h-index is computed from the
+        total citation counts (`rowTotal`) of all documents.
 
         Your API Key needs to be augmented by Elsevier's Scopus
         Integration Team to access this API.
@@ -259,8 +274,8 @@ class CitationOverview(Retrieval):
         if citation:
             allowed = ('exclude-self', 'exclude-books')
             check_parameter_value(citation, allowed, "citation")
-        if len(identifier) < 0 or len(identifier) > 25:
-            msg = "Provide at least 1 and at most than 25 identifiers"
+        if len(identifier) < 1:
+            msg = "Provide at least 1 identifier"
             raise ValueError(msg)
 
         # Variables
@@ -276,6 +291,11 @@ class CitationOverview(Retrieval):
         self._refresh = refresh
         self._view = "STANDARD"
 
+        if len(identifier) > CHUNK_SIZE:
+            self._probe_parts()
+            self._merge_chunks(identifier, id_type, workers, **kwds)
+            return
+
         # Get file content
         kwds.update({id_type: identifier})
         stem = md5("_".join(identifier).encode('utf8')).hexdigest()
@@ -291,6 +311,32 @@ class CitationOverview(Retrieval):
         # citeCountHeader
         self._citeCountHeader = self._data['citeColumnTotalXML']["citeCountHeader"]
 
+    def _merge_chunks(self, identifier, id_type, workers, **kwds):
+        """Download identifiers in chunks and merge the results."""
+        chunks = make_stable_chunks(identifier, CHUNK_SIZE)
+
+        def retrieve(chunk):
+            return CitationOverview(chunk, date=self._date, id_type=id_type,
+                                    refresh=self._refresh,
+                                    citation=self._citation, **kwds)
+
+        parts = map_in_threads(retrieve, chunks, workers)
+
+        self._citeInfoMatrix = [e for p in parts for e in p._citeInfoMatrix]
+        self._identifierlegend = [e for p in parts for e in p._identifierlegend]
+        headers = [p._citeCountHeader for p in parts]
+        column_totals = zip(*[listify(h["columnTotal"]) for h in headers])
+        self._citeCountHeader = {
+            "columnTotal": [{"$": str(sum(int(d["$"]) for d in year))}
+                            for year in column_totals]}
+        for key in ("prevColumnTotal", "rangeColumnTotal",
+                    "laterColumnTotal", "grandTotal"):
+            self._citeCountHeader[key] = str(sum(int(h[key]) for h in headers))
+        totals = sorted(self.rowTotal, reverse=True)
+        h_index = sum(1 for rank, total in enumerate(totals, 1) if total >= rank)
+        self._data = {'h-index': str(h_index)}
+        self._adopt_cache_info(parts)
+
     def __str__(self):
         """Return a summary string."""
         cits_dict = {'exclude-self': 'excluding self-citations',
@@ -835,6 +835,8 @@ class AbstractRetrieval(Retrieval):
         self._view = view
         self._refresh = refresh
         Retrieval.__init__(self, identifier=identifier, id_type=id_type, **kwds)
+
+    def _process_json(self) -> None:
         if self._view in ('META', 'META_ABS', 'REF', 'FULL'):
             self._json = self._json['abstracts-retrieval-response']
         self._head = chained_get(self._json, ["item", "bibrecord", "head"], {})
@@ -179,6 +179,8 @@ class AffiliationRetrieval(Retrieval):
         self._refresh = refresh
         aff_id = str(int(str(aff_id).split('-')[-1]))
         Retrieval.__init__(self, aff_id, **kwds)
+
+    def _process_json(self) -> None:
         if self._view in ('LIGHT', 'STANDARD'):
             self._json = self._json['affiliation-retrieval-response']
         self._profile = self._json.get("institution-profile", {})
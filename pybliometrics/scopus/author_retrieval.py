@@ -1,16 +1,19 @@
 from warnings import warn
 from typing import NamedTuple
-
-from json import loads
+from urllib.parse import parse_qs, urlparse
 
 from .author_search import AuthorSearch
 from .scopus_search import ScopusSearch
 from pybliometrics.superclasses import Retrieval
 from pybliometrics.utils import chained_get, check_parameter_value,\
-    filter_digits, get_content, get_link, html_unescape, listify, make_int_if_possible,\
+    filter_digits, get_link, html_unescape, listify, make_int_if_possible,\
     parse_affiliation, parse_date_created, VIEWS
 
 
+# Number of coauthors per page of the coauthor search
+COAUTHORS_PER_PAGE = 25
+
+
 class Affiliation(NamedTuple):
     id: int | None
     parent: int | None
@@ -329,6 +332,7 @@ class AuthorRetrieval(Retrieval):
         self._refresh = refresh
         Retrieval.__init__(self, identifier=self._id, **kwds)
 
+    def _process_json(self) -> None:
         if self._view in ('METRICS', 'LIGHT', 'STANDARD', 'ENHANCED'):
             # Parse json
             self._json = self._json['author-retrieval-response']
@@ -338,7 +342,7 @@ class AuthorRetrieval(Retrieval):
                 alias_json = listify(self._json['alias']['prism:url'])
                 self._alias = [d['$'].split(':')[-1] for d in alias_json]
                 alias_str = ', '.join(self._alias)
-                text = f'Author profile with ID {author_id} has been merged and '\
+                text = f'Author profile with ID {self._id} has been merged and '\
                     f'the main profile is now one of {alias_str}.  Please update '\
                     'your records manually.  Functionality of this object is '\
                     'reduced.'
@@ -366,47 +370,45 @@ class AuthorRetrieval(Retrieval):
                 f'in {int(self.citation_count):,} document(s)'
         return s
 
-    def get_coauthors(self) -> list[Coauthor] | None:
+    def get_coauthors(self,
+                      refresh: bool | int = False,
+                      workers: int = 4
+                      ) -> list[Coauthor] | None:
         """Retrieves basic information about co-authors as a list of
         namedtuples in the form
         `(surname, given_name, id, areas, affiliation_id, name, city, country)`,
         where areas is a list of subject area codes joined by `"; "`.
-        Note: Method retrieves information via individual queries which will
-        not be cached.  The Scopus API returns 160 coauthors at most.
+        Note: Method retrieves information via an `AuthorSearch()`, whose
+        results are cached.  The Scopus API returns 160 coauthors at most.
+
+        :param refresh: Whether to refresh the cached file if it exists or not.
+                        If int is passed, cached file will be refreshed if the
+                        number of days since last modification exceeds that value.
+        :param workers: The number of result pages to download concurrently.
         """
-        SIZE = 25
-        # Get number of authors to search for
+        # Get query parameters of the coauthor search
         url = self.coauthor_link
         if not url:
             return None
-        res = get_content(url, api="AuthorSearch")
-        data = loads(res.text)['search-results']
-        N = int(data.get('opensearch:totalResults', 0))
+        query = {k: v[0] for k, v in parse_qs(urlparse(url).query).items()}
+        search = AuthorSearch(query, refresh=refresh, workers=workers,
+                              count=COAUTHORS_PER_PAGE)
         # Store information in namedtuples
         coauthors = []
-        # Iterate over search results in chunks of `SIZE` results
-        count = SIZE
-        start = 0
-        while start < N:
-            params = {'start': start, 'count': count, 'accept': 'json'}
-            res = get_content(url, api="AuthorSearch", params=params)
-            data = loads(res.text)['search-results'].get('entry', [])
-            # Extract information for each coauthor
-            for entry in data:
-                aff = entry.get('affiliation-current', {})
-                try:
-                    areas = [a['$'] for a in entry.get('subject-area', [])]
-                except TypeError:  # Only one subject area given
-                    areas = [entry['subject-area']['$']]
-                new = Coauthor(surname=entry['preferred-name']['surname'],
-                    given_name=entry['preferred-name'].get('given-name'),
-                    id=int(entry['dc:identifier'].split(':')[-1]),
-                    areas='; '.join(areas), name=aff.get('affiliation-name'),
-                    affiliation_id=aff.get('affiliation-id'),
-                    city=aff.get('affiliation-city'),
-                    country=aff.get('affiliation-country'))
-                coauthors.append(new)
-            start += SIZE
+        for entry in search._json:
+            aff = entry.get('affiliation-current', {})
+            try:
+                areas = [a['$'] for a in entry.get('subject-area', [])]
+            except TypeError:  # Only one subject area given
+                areas = [entry['subject-area']['$']]
+            new = Coauthor(surname=entry['preferred-name']['surname'],
+                given_name=entry['preferred-name'].get('given-name'),
+                id=int(entry['dc:identifier'].split(':')[-1]),
+                areas='; '.join(areas), name=aff.get('affiliation-name'),
+                affiliation_id=aff.get('affiliation-id'),
+                city=aff.get('affiliation-city'),
+                country=aff.get('affiliation-country'))
+            coauthors.append(new)
         return coauthors or None
 
     def get_documents(self,
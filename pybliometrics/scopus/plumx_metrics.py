@@ -133,6 +133,8 @@ class PlumXMetrics(Retrieval):
         self._refresh = refresh
         self._view = 'ENHANCED'
         Retrieval.__init__(self, identifier=identifier, id_type=id_type, **kwds)
+
+    def _process_json(self) -> None:
         cats = self._json.get('count_categories', [])
         self._count_categories = {d["name"]: d['count_types'] for d in cats}
 
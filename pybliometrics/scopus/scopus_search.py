@@ -1,9 +1,17 @@
-from typing import NamedTuple
+import os
+from hashlib import md5
+from typing import Iterable, NamedTuple
+from urllib.parse import quote_plus
 
 from pybliometrics.superclasses import Search
-from pybliometrics.utils import check_integrity, check_parameter_value, \
-    check_field_consistency, deduplicate, get_freetoread, html_unescape, \
-    listify, make_search_summary, VIEWS
+from pybliometrics.superclasses.base import _check_file_age
+from pybliometrics.superclasses.search import _get_cache_file_path
+from pybliometrics.utils import check_column_integrity, check_integrity, \
+    check_parameter_value, check_field_consistency, deduplicate, \
+    get_credentials, get_freetoread, html_unescape, json_loads, listify, \
+    make_arrow_table, make_search_summary, partition_query, \
+    probe_sizes, run_in_threads, shard_query, RecordStore, \
+    SEARCH_MAX_QUERY_LENGTH, VIEWS
 
 
 class Document(NamedTuple):
@@ -45,7 +53,40 @@ class Document(NamedTuple):
     fund_sponsor: str | None
 
 
+class Lookup(NamedTuple):
+    """Outcome of `ScopusSearch.lookup()`."""
+    found: dict[str, Document]
+    """Requested identifiers mapped to the found documents."""
+    missing: list[str]
+    """Requested identifiers without document."""
+    errors: dict[str, Exception]
+    """Requested identifiers whose query failed, mapped to the error."""
+
+
+# Search fields and result keys of the identifiers for lookups
+_LOOKUP_FIELDS = {
+    'eid': ('EID', 'eid'),
+    'doi': ('DOI', 'prism:doi'),
+    'pubmed_id': ('PMID', 'pubmed-id'),
+}
+
+
+# Types of columns in columnar exports (all other columns are strings)
+_COLUMN_TYPES = {
+    'subtype': 'dictionary',
+    'subtypeDescription': 'dictionary',
+    'coverDate': 'date',
+    'publicationName': 'dictionary',
+    'aggregationType': 'dictionary',
+    'citedby_count': 'int64',
+    'openaccess': 'int64',
+}
+
+
 class ScopusSearch(Search):
+    _document = Document
+    _column_types = _COLUMN_TYPES
+
     @property
     def results(self) -> list[Document] | None:
         """A list of namedtuples in the form `(eid doi pii pubmed_id title
@@ -76,90 +117,70 @@ class ScopusSearch(Search):
 
         The Scopus API returns only the first funding information.
         """
-        # Initiate namedtuple with ordered list of fields
-        fields = 'eid doi pii pubmed_id title subtype subtypeDescription ' \
-                 'creator afid affilname affiliation_city ' \
-                 'affiliation_country author_count author_names author_ids '\
-                 'author_afids coverDate coverDisplayDate publicationName '\
-                 'issn source_id eIssn aggregationType volume '\
-                 'issueIdentifier article_number pageRange description '\
-                 'authkeywords citedby_count openaccess freetoread '\
-                 'freetoreadLabel fund_acr fund_no fund_sponsor'
-        check_field_consistency(self._integrity, fields)
-        # Parse elements one-by-one
-        out = []
-        for item in self._json:
-            info = {}
-            # Parse affiliations
-            for field, key in [('affilname', 'affilname'),
-                               ('afid', 'afid'),
-                               ('aff_city', 'affiliation-city'),
-                               ('aff_country', 'affiliation-country')]:
-                info[field] = _join(item, key, unescape=self.unescape)
-            # Parse authors
-            try:
-                # Deduplicate list of authors
-                authors = deduplicate(item['author'])
-                # Extract information
-                surnames = _replace_none([d['surname'] for d in authors])
-                firstnames = _replace_none([d['given-name'] for d in authors])
-                info["auth_names"] = ";".join([", ".join([t[0], t[1]]) for t in
-                                               zip(surnames, firstnames)])
-                info["auth_ids"] = ";".join([d['authid'] for d in authors])
-                affs = []
-                for auth in authors:
-                    aff = listify(deduplicate(auth.get('afid', [])))
-                    affs.append('-'.join([d['$'] for d in aff]))
-                if [a for a in affs if a]:
-                    info["auth_afid"] = ';'.join(affs)
-                else:
-                    info["auth_afid"] = None
-            except KeyError:
-                pass
-            date = item.get('prism:coverDate')
-            if isinstance(date, list):
-                date = date[0].get('$')
-            freetoread = get_freetoread(item, ["freetoread", "value"])
-            freetoreadLabel = get_freetoread(item, ["freetoreadLabel", "value"])
-            # Get text fields and unescape
-            for key in ['dc:title', 'dc:description', 'authkeywords']:
-                value = item.get(key)
-                info[key] = html_unescape(str(value)) if (self.unescape and value) else value
-            fund_no = item.get('fund-no', '').replace("undefined", "") or None
-            new = Document(article_number=item.get('article-number'),
-                      title=info.get('dc:title'),
-                      fund_no=fund_no,
-                      fund_sponsor=item.get('fund-sponsor'),
-                      subtype=item.get('subtype'), doi=item.get('prism:doi'),
-                      subtypeDescription=item.get('subtypeDescription'),
-                      issn=item.get('prism:issn'), creator=item.get('dc:creator'),
-                      affilname=info.get("affilname"),
-                      author_names=info.get("auth_names"),
-                      coverDate=date, volume=item.get('prism:volume'),
-                      coverDisplayDate=item.get('prism:coverDisplayDate'),
-                      publicationName=item.get('prism:publicationName'),
-                      source_id=item.get('source-id'), author_ids=info.get("auth_ids"),
-                      aggregationType=item.get('prism:aggregationType'),
-                      issueIdentifier=item.get('prism:issueIdentifier'),
-                      pageRange=item.get('prism:pageRange'),
-                      author_afids=info.get("auth_afid"),
-                      affiliation_country=info.get("aff_country"),
-                      citedby_count=int(item['citedby-count']),
-                      openaccess=int(item['openaccess']),
-                      freetoread=freetoread, freetoreadLabel=freetoreadLabel,
-                      eIssn=item.get('prism:eIssn'),
-                      author_count=item.get('author-count', {}).get('$'),
-                      affiliation_city=info.get("aff_city"), afid=info.get("afid"),
-                      description=info.get('dc:description'),
-                      pii=item.get('pii'),
-                      authkeywords=info.get('authkeywords'),
-                      eid=item.get('eid'),
-                      fund_acr=item.get('fund-acr'), pubmed_id=item.get('pubmed-id'))
-            out.append(new)
-        # Finalize
+        check_field_consistency(self._integrity, " ".join(Document._fields))
+        out = [Document._make(_parse_document(item, self.unescape))
+               for item in self._json]
         check_integrity(out, self._integrity, self._action)
         return out or None
 
+    def results_table(self) -> dict[str, list]:
+        """The search results as dictionary of columns, i.e. one list per
+        field of `results`.  Columns are built straight from the downloaded
+        data, which makes conversion into DataFrames much faster than via
+        `results`, e.g. with `pandas.DataFrame(s.results_table())`.
+
+        Raises
+        ------
+        ValueError
+            If the elements provided in `integrity_fields` do not match the
+            actual field names (see `results`).
+        """
+        check_field_consistency(self._integrity, " ".join(Document._fields))
+        rows = [_parse_document(item, self.unescape) for item in self._json]
+        values = zip(*rows) if rows else [[]] * len(Document._fields)
+        columns = {field: list(col) for field, col in zip(Document._fields, values)}
+        check_column_integrity(columns, self._integrity, self._action)
+        return columns
+
+    def results_compact(self) -> RecordStore | None:
+        """The search results as compact, column-wise `RecordStore`, which
+        needs about a fifth of the memory of `results` (in a benchmark with
+        synthetic results); strings unique to each document, like titles
+        and abstracts, take most of it.  It is built while parsing, without
+        creating `results` or `results_table()` first.  With
+        `init(lazy=True)`, it is built from the cached file line by line,
+        without decoding all results at once.
+        Its elements behave like the namedtuples of `results` (indexing,
+        attribute access, iteration and comparison), but are no instances
+        of `tuple`.  Use `.to_records()` to obtain the namedtuples.
+
+        Raises
+        ------
+        ValueError
+            If the elements provided in `integrity_fields` do not match the
+            actual field names (see `results`).
+        """
+        check_field_consistency(self._integrity, " ".join(Document._fields))
+        rows = (_parse_document(item, self.unescape) for item in self._iter_entries())
+        store = RecordStore.from_rows(Document, rows, self._n)
+        if not store:
+            return None
+        columns = {field: store.column(field) for field in self._integrity}
+        check_column_integrity(columns, self._integrity, self._action)
+        return store
+
+    def to_arrow(self):
+        """The search results as `pyarrow.Table` with typed columns:
+        `citedby_count` and `openaccess` are int64, `coverDate` is a date,
+        and `subtype`, `subtypeDescription`, `publicationName` and
+        `aggregationType` are dictionary-encoded.  All other fields are
+        strings.
+
+        Requires `pyarrow`, which you can install via
+        `pip install pybliometrics[arrow]`.
+        """
+        return make_arrow_table(self.results_table(), self._column_types)
+
     def __init__(self,
                  query: str,
                  refresh: bool | int = False,
@@ -170,6 +191,8 @@ class ScopusSearch(Search):
                  integrity_action: str = "raise",
                  subscriber: bool = True,
                  unescape: bool = True,
+                 partition: bool = False,
+                 shards: int | None = None,
                  **kwds: str
                  ) -> None:
         """Interaction with the Scopus Search API.
@@ -206,6 +229,20 @@ class ScopusSearch(Search):
                            corresponding view.
         :param unescape: Convert named and numeric characters in the `results` to
                          their corresponding Unicode characters.
+        :param partition: Whether to split the query into parts with at most
+                          5000 results each (by publication year and, if
+                          necessary, by subject area), to download the parts
+                          concurrently with `workers` threads (default: 4)
+                          and to merge them into one result de-duplicated by
+                          EID.  This overcomes the limit of 5000 results
+                          without cursor.  Has no effect if `download=False`.
+        :param shards: For subscribers, the number of disjoint windows of
+                       publication years and load dates into which to split
+                       the query, to crawl them concurrently with one cursor
+                       each (with `workers` threads, default: `shards`).  If
+                       several API keys are configured, each window uses
+                       one of them, in turn.  The windows are merged into
+                       one result.  Has no effect if `download=False`.
         :param kwds: Keywords passed on as query parameters.  Must contain
                      fields and values mentioned in the API specification at
                      https://dev.elsevier.com/documentation/ScopusSearchAPI.wadl.
@@ -213,7 +250,9 @@ class ScopusSearch(Search):
         Raises
         ------
         ScopusQueryError
-            For non-subscribers, if the number of search results exceeds 5000.
+            For non-subscribers, if the number of search results exceeds 5000
+            and `download=True`.  With `partition=True`, if one part still
+            exceeds 5000 results.
 
         ValueError
             If any of the parameters `integrity_action`, `refresh` or `view`
@@ -247,6 +286,11 @@ class ScopusSearch(Search):
         self._refresh = refresh
         self._query = query
         self._view = view
+        if (partition or shards) and download:
+            self._cache_file_path = _get_cache_file_path('ScopusSearch', view, query)
+            if _check_file_age(self)[0]:
+                self._download_in_parts(query, view, verbose, shards, **kwds)
+            self._refresh = False
         Search.__init__(self, query=query,
                         cursor=subscriber, download=download,
                         verbose=verbose, **kwds)
@@ -260,6 +304,254 @@ class ScopusSearch(Search):
         """EIDs of retrieved documents."""
         return [d['eid'] for d in self._json]
 
+    def _download_in_parts(self, query, view, verbose, shards=None,
+                           workers=None, **kwds):
+        """Split a query with `shard_query()` (if `shards` is given) or with
+        `partition_query()`, download the parts concurrently and write their
+        results, de-duplicated by EID, to the cache file of the query.  The
+        cached file of each part is appended as soon as it and all parts
+        before it are complete, and removed then, so that neither the
+        results of all parts are held in memory nor stored twice.
+        """
+        def count(part):
+            # Concurrent probes rotate the API keys across calls
+            return probe_sizes([part], 'ScopusSearch', workers=1,
+                               refresh=self._refresh, **kwds)[part]
+
+        def download(args):
+            _, part, credentials = args
+            res = ScopusSearch(part, refresh=self._refresh, view=view,
+                               cursor=bool(shards), **credentials, **kwds)
+            return res._cache_file_path
+
+        if shards:
+            workers = workers or shards
+            parts = [p for p, _ in shard_query(query, count, shards, workers)]
+            # Rotate API keys (with their InstTokens) among the windows
+            credentials = get_credentials()
+        else:
+            workers = workers or 4
+            parts = [p for p, _ in partition_query(query, count, workers=workers)]
+            credentials = [{}]
+        parts = [(i, p, credentials[i % len(credentials)]) for i, p in enumerate(parts)]
+        if verbose:
+            print(f'Downloading results for query "{query}" in {len(parts)} parts:')
+        from tqdm import tqdm
+        fname = self._cache_file_path
+        fname.parent.mkdir(parents=True, exist_ok=True)
+        merged = fname.with_name(fname.name + '.part')
+        seen, done, errors, following = set(), {}, [], 0
+        try:
+            with merged.open('wb') as out, \
+                    tqdm(total=len(parts), disable=not verbose) as progress:
+                for (i, _, _), path, error in run_in_threads(download, parts, workers):
+                    progress.update()
+                    if error:
+                        errors.append(error)
+                        continue
+                    # Append parts in their order, so that results are stable
+                    done[i] = path
+                    while not errors and following in done:
+                        _append_entries(out, done.pop(following), seen)
+                        following += 1
+            if errors:
+                raise errors[0]
+            os.replace(merged, fname)
+        finally:
+            merged.unlink(missing_ok=True)
+
+    @classmethod
+    def lookup(cls,
+               identifiers: Iterable[str],
+               id_type: str = 'eid',
+               workers: int = 4,
+               max_length: int = SEARCH_MAX_QUERY_LENGTH,
+               refresh: bool | int = False,
+               **kwds
+               ) -> Lookup:
+        """Look up the search results of many documents with few requests.
+
+        Packs the identifiers into queries like `EID(a) OR EID(b) OR ...`
+        whose URL-encoded length stays below `max_length`, and runs them
+        concurrently.  Each page of results contains up to 25 documents
+        (view `COMPLETE`), so this needs a fraction of the requests of
+        retrieving each document with `AbstractRetrieval()`.  Identifiers are
+        sorted before packing, and batches end at boundaries depending on
+        the identifiers only, so that repeated lookups of mostly the same
+        identifiers read the cached queries.  Identifiers containing braces
+        or quotes cannot be packed and are reported as errors.
+
+        :param identifiers: The identifiers of the documents.
+        :param id_type: The type of the identifiers.  Allowed values: `eid`,
+                        `doi`, `pubmed_id`.
+        :param workers: The number of concurrent queries.
+        :param max_length: The maximum length of a URL-encoded query.
+        :param refresh: Whether to refresh the cached files if they exist or
+                        not.  If int is passed, cached files will be refreshed
+                        if the number of days since last modification exceeds
+                        that value.
+        :param kwds: Keywords passed on to `ScopusSearch()`, e.g. `view`.
+
+        :returns: Namedtuple `Lookup(found, missing, errors)`, where `found`
+                  maps identifiers to the `Document` namedtuples of `results`,
+                  `missing` lists identifiers without result and `errors`
+                  maps identifiers of failed queries to the exception.
+                  DOIs are matched case-insensitively.
+
+        Raises
+        ------
+        ValueError
+            If `id_type` is not one of the allowed values.
+        """
+        check_parameter_value(id_type, tuple(_LOOKUP_FIELDS), "id_type")
+        field, key = _LOOKUP_FIELDS[id_type]
+        normalize = str.lower if id_type == 'doi' else str
+        requested = {}
+        for identifier in identifiers:
+            requested.setdefault(normalize(str(identifier).strip()), identifier)
+        batches, invalid = _pack_queries(sorted(requested), field, max_length)
+        batch_values = dict(batches)
+
+        def search(query):
+            return cls(query, refresh=refresh, **kwds)
+
+        found = {}
+        errors = {requested[v]: ValueError(f'Identifier "{requested[v]}" cannot '
+                                           'be used in a query.') for v in invalid}
+        for query, res, error in run_in_threads(search, batch_values, workers):
+            if error:
+                errors.update({requested[v]: error for v in batch_values[query]})
+                continue
+            for item, doc in zip(res._json, res.results or []):
+                identifier = requested.get(normalize(item.get(key) or ''))
+                if identifier is not None:
+                    found.setdefault(identifier, doc)
+        missing = [identifier for identifier in requested.values()
+                   if identifier not in found and identifier not in errors]
+        return Lookup(found=found, missing=missing, errors=errors)
+
+
+def _parse_document(item, unescape):
+    """Auxiliary function to parse one search result into a tuple whose
+    elements are ordered like the fields of `Document`.
+    """
+    info = {}
+    # Parse affiliations
+    for field, key in [('affilname', 'affilname'),
+                       ('afid', 'afid'),
+                       ('aff_city', 'affiliation-city'),
+                       ('aff_country', 'affiliation-country')]:
+        info[field] = _join(item, key, unescape=unescape)
+    # Parse authors
+    try:
+        # Deduplicate list of authors
+        authors = deduplicate(item['author'])
+        # Extract information
+        surnames = _replace_none([d['surname'] for d in authors])
+        firstnames = _replace_none([d['given-name'] for d in authors])
+        info["auth_names"] = ";".join([", ".join([t[0], t[1]]) for t in
+                                       zip(surnames, firstnames)])
+        info["auth_ids"] = ";".join([d['authid'] for d in authors])
+        affs = []
+        for auth in authors:
+            aff = listify(deduplicate(auth.get('afid', [])))
+            affs.append('-'.join([d['$'] for d in aff]))
+        if [a for a in affs if a]:
+            info["auth_afid"] = ';'.join(affs)
+        else:
+            info["auth_afid"] = None
+    except KeyError:
+        pass
+    date = item.get('prism:coverDate')
+    if isinstance(date, list):
+        date = date[0].get('$')
+    # Get text fields and unescape
+    for key in ['dc:title', 'dc:description', 'authkeywords']:
+        value = item.get(key)
+        info[key] = html_unescape(str(value)) if (unescape and value) else value
+    fund_no = item.get('fund-no', '').replace("undefined", "") or None
+    return (item.get('eid'), item.get('prism:doi'), item.get('pii'),
+            item.get('pubmed-id'), info.get('dc:title'), item.get('subtype'),
+            item.get('subtypeDescription'), item.get('dc:creator'),
+            info.get("afid"), info.get("affilname"), info.get("aff_city"),
+            info.get("aff_country"), item.get('author-count', {}).get('$'),
+            info.get("auth_names"), info.get("auth_ids"),
+            info.get("auth_afid"), date, item.get('prism:coverDisplayDate'),
+            item.get('prism:publicationName'), item.get('prism:issn'),
+            item.get('source-id'), item.get('prism:eIssn'),
+            item.get('prism:aggregationType'), item.get('prism:volume'),
+            item.get('prism:issueIdentifier'), item.get('article-number'),
+            item.get('prism:pageRange'), info.get('dc:description'),
+            info.get('authkeywords'), int(item['citedby-count']),
+            int(item['openaccess']),
+            get_freetoread(item, ["freetoread", "value"]),
+            get_freetoread(item, ["freetoreadLabel", "value"]),
+            item.get('fund-acr'), fund_no, item.get('fund-sponsor'))
+
+
+def _pack_queries(values, field, max_length):
+    """Auxiliary function to pack sorted values into OR-queries on `field`
+    whose URL-encoded length does not exceed `max_length`.
+
+    A batch ends after each value whose hash marks a boundary, or before
+    a value that does not fit any more.  Thus adding or removing a value
+    changes its own batch only, and the cached queries of all other
+    batches remain valid.  Values containing braces or quotes cannot be
+    packed safely.
+
+    Returns a list of tuples `(query, values)` and a list of the values
+    that cannot be packed.
+    """
+    # Expected number of values per batch, about half of what fits
+    expected = max(1, max_length // 64)
+    batches, invalid, batch, length = [], [], [], 0
+    for value in values:
+        if any(c in value for c in '{}"'):
+            invalid.append(value)
+            continue
+        term_length = len(quote_plus(_make_term(field, value))) + len("+OR+")
+        if batch and length + term_length > max_length:
+            batches.append(batch)
+            batch, length = [], 0
+        batch.append(value)
+        length += term_length
+        if int(md5(value.encode('utf8')).hexdigest(), 16) % expected == 0:
+            batches.append(batch)
+            batch, length = [], 0
+    if batch:
+        batches.append(batch)
+    queries = [" OR ".join(_make_term(field, v) for v in batch) for batch in batches]
+    return list(zip(queries, batches)), invalid
+
+
+def _append_entries(out, fname, seen):
+    """Auxiliary function to append the cached results in `fname` to the
+    open file `out`, skipping those whose EID is in `seen`, and to remove
+    `fname` then.
+    """
+    with fname.open('rb') as f:
+        for line in f:
+            line = line.rstrip(b"\n")
+            if not line.strip():
+                continue
+            eid = json_loads(line).get('eid')
+            if eid in seen:
+                continue
+            seen.add(eid)
+            if out.tell():
+                out.write(b"\n")
+            out.write(line)
+    fname.unlink()
+
+
+def _make_term(field, value):
+    """Auxiliary function to restrict `field` to `value`, which is enclosed
+    in braces (exact match) if it contains parentheses or spaces.
+    """
+    if any(c in value for c in '() '):
+        value = "{" + value + "}"
+    return f"{field}({value})"
+
 
 def _join(item, key, sep=";", unescape=False):
     """Auxiliary function to join same elements of a list of dictionaries if
@@ -260,6 +260,7 @@ class SerialTitleISSN(Retrieval):
         self._years = years
         Retrieval.__init__(self, identifier=self._id, date=years, **kwds)
 
+    def _process_json(self) -> None:
         # Parse json
         self._json = self._json['serial-metadata-response']
         self._entry = self._json['entry'][0]
@@ -529,6 +529,17 @@ def test_title():
     assert ar10.title is None
 
 
+def test_bulk():
+    eids = ["2-s2.0-84930616647", "2-s2.0-0029486824", "2-s2.0-0"]
+    received = list(AbstractRetrieval.bulk(eids, view="FULL", refresh=30))
+    assert len(received) == 3
+    results = {item.identifier: item for item in received}
+    assert results["2-s2.0-84930616647"].result.title == ab1.title
+    assert results["2-s2.0-0029486824"].error is None
+    assert results["2-s2.0-0"].result is None
+    assert results["2-s2.0-0"].error is not None
+
+
 def test_url():
     expected = 'https://api.elsevier.com/content/abstract/scopus_id/84930616647'
     assert ab1.url == expected
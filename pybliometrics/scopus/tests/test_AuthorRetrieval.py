@@ -163,6 +163,11 @@ def get_coauthors():
     assert expected in received
 
 
+def test_get_coauthors_cached():
+    received = enhanced.get_coauthors(refresh=30)
+    assert enhanced.get_coauthors(refresh=30, workers=1) == received
+
+
 def test_get_documents():
     subtypes = {'re', 'ed', 'no'}
     received = enhanced.get_documents(subtypes)
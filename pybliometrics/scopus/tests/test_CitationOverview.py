@@ -1,6 +1,6 @@
 """Tests for `scopus.CitationOverview` module."""
 
-from pybliometrics.scopus import init
+from pybliometrics.scopus import abstract_citation, init
 from pybliometrics.scopus.abstract_citation import Author, CitationOverview
 
 init()
@@ -152,3 +152,15 @@ def test_url():
 def test_volume():
     assert co_eid.volume == ['10', '5']
     assert co_doi.volume == ['10']
+
+
+def test_chunks(monkeypatch):
+    monkeypatch.setattr(abstract_citation, 'CHUNK_SIZE', 1)
+    co_chunks = CitationOverview(["84930616647", "85068268027"],
+                                 refresh=30, date="2016-2020")
+    assert sorted(co_chunks.scopus_id) == sorted(co_eid.scopus_id)
+    assert sorted(co_chunks.rowTotal) == sorted(co_eid.rowTotal)
+    assert co_chunks.columnTotal == co_eid.columnTotal
+    assert co_chunks.rangeColumnTotal == co_eid.rangeColumnTotal
+    assert co_chunks.grandTotal == co_eid.grandTotal
+    assert co_chunks.h_index == co_eid.h_index
@@ -1,7 +1,9 @@
 """Tests for `scopus.ScopusSearch` module."""
 
+import pytest
+
 from pybliometrics.scopus import ScopusSearch, init
-from pybliometrics.scopus.scopus_search import Document
+from pybliometrics.scopus.scopus_search import Document, _pack_queries
 
 init()
 
@@ -97,3 +99,66 @@ def test_results_empty():
 def test_results_unescape():
     assert s_d.results[0].afid.count(";") == 14
     assert '&' in s_d.results[0].affilname
+
+
+def test_results_table():
+    received = s_j.results_table()
+    assert list(received.keys()) == list(Document._fields)
+    assert list(zip(*received.values())) == s_j.results
+    empty = s_empty.results_table()
+    assert all(col == [] for col in empty.values())
+
+
+def test_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+    received = s_j.to_arrow()
+    assert received.num_rows == 118
+    assert received.column_names == list(Document._fields)
+    assert received.schema.field('citedby_count').type == pa.int64()
+    assert received.schema.field('coverDate').type == pa.date32()
+    assert pa.types.is_dictionary(received.schema.field('publicationName').type)
+
+
+def test_parquet(tmp_path):
+    pytest.importorskip("pyarrow")
+    s_au.to_parquet(tmp_path)
+    s_j.to_parquet(tmp_path)
+    received = ScopusSearch.read_parquet(tmp_path, columns=['eid', 'year'],
+                                         filters=[('year', '<', 2000)])
+    assert received.to_pylist() == [{'eid': '2-s2.0-26444452434', 'year': 1992}]
+    received = ScopusSearch.read_parquet(tmp_path, columns=['eid'],
+                                         filters=[('query_hash', '=', s_j._cache_file_path.name)])
+    assert received.num_rows == 118
+
+
+def test_results_compact():
+    received = s_j.results_compact()
+    assert len(received) == 118
+    assert list(received) == s_j.results
+    assert received[104].title == s_j.results[104].title
+    assert s_empty.results_compact() is None
+
+
+def test_pack_queries():
+    dois = ['10.1/a OR b', '10.1/{x}', '10.1/c']
+    batches, invalid = _pack_queries(dois, 'DOI', 1000)
+    assert batches == [('DOI({10.1/a OR b}) OR DOI(10.1/c)', ['10.1/a OR b', '10.1/c'])]
+    assert invalid == ['10.1/{x}']
+    # Adding a value changes one batch only
+    eids = [f'2-s2.0-{i:011}' for i in range(0, 3000, 10)]
+    before = {q for q, _ in _pack_queries(eids, 'EID', 1000)[0]}
+    after = {q for q, _ in _pack_queries(sorted(eids + ['2-s2.0-00000001505']), 'EID', 1000)[0]}
+    assert len(before - after) == 1
+    assert all(len(q) <= 1000 for q in after)
+
+
+def test_lookup():
+    eids = s_au.get_eids() + ['2-s2.0-0']
+    received = ScopusSearch.lookup(eids, max_length=100, refresh=30)
+    assert set(received.found) == set(s_au.get_eids())
+    assert received.found['2-s2.0-26444452434'] == s_au.results[-1]
+    assert received.missing == ['2-s2.0-0']
+    assert received.errors == {}
+    doi = '10.1016/0014-2921(92)90085-b'
+    received = ScopusSearch.lookup([doi], id_type='doi', refresh=30)
+    assert received.found[doi].eid == '2-s2.0-26444452434'
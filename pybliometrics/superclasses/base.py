@@ -1,24 +1,41 @@
 """Base class object for superclasses."""
 
-from json import dumps, loads
+import os
 from math import ceil
-from time import localtime, strftime, time
+from threading import RLock
+from time import localtime, perf_counter, strftime, time
 
 from urllib.parse import parse_qs, urlparse
 
-from tqdm import tqdm
-
 from pybliometrics.exception import ScopusQueryError
-from pybliometrics.utils import get_content, parse_content, SEARCH_MAX_ENTRIES
-from pybliometrics.utils import listify
+from pybliometrics.utils import get_content, parse_content, SEARCH_MAX_ENTRIES, \
+    STREAM_CHUNK_SIZE
+from pybliometrics.utils import get_lazy_parsing, json_dumps, json_loads, listify, \
+    run_in_threads
+from pybliometrics.utils.events import emit, has_subscribers, CacheLookup, \
+    CacheRead, CacheWrite, PageDownloaded
+from pybliometrics.utils.tracing import start_span
+
+
+class _CacheProbe(Exception):
+    """Raised instead of reading or downloading when only the presence of
+    the cached file is probed.
+    """
+    def __init__(self, fname, hit: bool) -> None:
+        super().__init__(fname)
+        self.hit = hit
 
 
 class Base:
+    # Whether to raise _CacheProbe instead of reading or downloading
+    _probe_cache = False
+
     def __init__(self,
                  params: dict,
                  url: str,
                  download: bool = True,
                  verbose: bool = False,
+                 workers: int = 1,
                  **kwds: str
                  ) -> None:
         """Class intended as base class for superclasses.
@@ -28,6 +45,9 @@ class Base:
         :param download: Whether to download the query or not.  Has no effect
                          for retrieval requests.
         :param verbose: Whether to print a download progress bar.
+        :param workers: The number of result pages of search requests to
+                        download concurrently.  Has no effect for requests
+                        using a cursor, whose pages depend on each other.
         :param kwds: Keywords passed on `get_content()`
 
         Raises
@@ -45,12 +65,23 @@ class Base:
 
         # Compare age of file to test whether we refresh
         self._refresh, mod_ts = _check_file_age(self)
+        if self._probe_cache:
+            raise _CacheProbe(self._cache_file_path, mod_ts is not None and not self._refresh)
 
         # Read or download, possibly with caching
         fname = self._cache_file_path
+        view = params.get('view')
+        # Check if full text retrieval (body stored separately)
+        body_retrieval = (api == 'ArticleRetrieval') and (view == 'FULL')
+        if body_retrieval and mod_ts is not None and not self._refresh and \
+                not _body_file_path(fname).exists() and not _split_body(fname):
+            self._refresh = True  # Metadata without body count as stale
+        if has_subscribers():
+            result = 'miss' if mod_ts is None else 'stale' if self._refresh else 'hit'
+            emit(CacheLookup(api, view, str(fname), result))
 
-        # Check if search request
-        search_request = "query" in params
+        # Check if search request (coauthor searches have no query)
+        search_request = "query" in params or "co-author" in params
         # Check if ref retrieval for abstract
         ab_ref_retrieval = (api == 'AbstractRetrieval') and (params['view'] == 'REF')
         # Check if object retrieval
@@ -60,19 +91,20 @@ class Base:
 
         if fname.exists() and not self._refresh:
             self._mdate = mod_ts
-            if search_request:
-                self._json = [loads(line) for line in
-                              fname.read_text().split("\n") if line]
-                self._n = len(self._json)
-            elif serial_search:
-                self._json = loads(fname.read_text())
-                self._n = len(self._json['serial-metadata-response'].get('entry', []))
-            elif obj_retrieval:
-                self._object = fname.read_bytes()
+            if obj_retrieval:
+                pass  # Objects are read from the cached file on demand
+            elif get_lazy_parsing():
+                self._pending_cache = (search_request, serial_search)
+                self._pending_lock = RLock()
+                if search_request:
+                    # Only decoding is deferred: counting results reads the file
+                    content = fname.read_bytes()
+                    self._n = content.count(b"\n") + 1 if content else 0
+                return
             else:
-                self._json = loads(fname.read_text())
+                self._read_cache(search_request, serial_search)
         else:
-            resp = get_content(url, api, params, **kwds)
+            resp = get_content(url, api, params, stream=obj_retrieval, **kwds)
             header = resp.headers
 
             if ab_ref_retrieval:
@@ -87,7 +119,7 @@ class Base:
                 data = [self._json]
             elif search_request:
                 # Get number of results
-                res = resp.json()
+                res = json_loads(resp.content)
                 n = int(res['search-results'].get('opensearch:totalResults', 0) or 0)
                 self._n = n
                 # Results size check
@@ -108,28 +140,37 @@ class Base:
                         start = params["start"]
                     # Download the remaining information in chunks
                     if verbose:
-                        print(f'Downloading results for query "{params["query"]}":')
+                        print(f'Downloading results for query "{params.get("query")}":')
                     n_chunks = ceil(n/params['count'])
-                    for i in tqdm(range(1, n_chunks), disable=not verbose,
-                                  initial=1, total=n_chunks):
-                        if cursor_exists:
-                            cursor = res['search-results']['cursor']['@next']
-                            params.update({'cursor': cursor})
-                        else:
-                            start += params["count"]
-                            params.update({'start': start})
-                        resp = get_content(url, api, params, **kwds)
-                        res = resp.json()
-                        data.extend(res.get('search-results', {}).get('entry', []))
-                    header = resp.headers  # Use header of final call
+                    from tqdm import tqdm
+                    if not cursor_exists and workers > 1 and n_chunks > 1:
+                        starts = [start + i*params["count"] for i in range(1, n_chunks)]
+                        pages, header = _get_pages(url, api, params, starts,
+                                                   workers, verbose, **kwds)
+                        for page in pages:
+                            data.extend(page)
+                    else:
+                        for i in tqdm(range(1, n_chunks), disable=not verbose,
+                                      initial=1, total=n_chunks):
+                            if cursor_exists:
+                                cursor = res['search-results']['cursor']['@next']
+                                params.update({'cursor': cursor})
+                            else:
+                                start += params["count"]
+                                params.update({'start': start})
+                            with start_span(f'{api} page', api=api, page=i):
+                                resp = get_content(url, api, params, **kwds)
+                                res = json_loads(resp.content)
+                            data.extend(res.get('search-results', {}).get('entry', []))
+                            _page_downloaded(api, i + 1, n_chunks)
+                        header = resp.headers  # Use header of final call
                     self._json = data
                 else:
                     data = None
             elif obj_retrieval:
-                self._object = resp.content
                 data = []
             else:
-                data = loads(resp.text)
+                data = json_loads(resp.content)
                 self._json = data
                 data = [data]
             # Set private variables
@@ -137,11 +178,74 @@ class Base:
             self._header = header
             # Finally write data unless download=False
             if download:
-                if obj_retrieval:
-                    fname.write_bytes(self._object)
-                else:
-                    text = [dumps(item, separators=(',', ':')) for item in data]
-                    fname.write_text("\n".join(text))
+                started = perf_counter()
+                with start_span(f'{api} cache write', api=api, view=view):
+                    if mod_ts is not None:
+                        self._release_cache_file()
+                    fname.parent.mkdir(parents=True, exist_ok=True)
+                    if obj_retrieval:
+                        _stream_to_file(resp, fname)
+                    elif body_retrieval:
+                        _write_with_body(fname, data[0])
+                    else:
+                        fname.write_bytes(b"\n".join(json_dumps(item) for item in data))
+                if has_subscribers():
+                    size = fname.stat().st_size
+                    if body_retrieval:
+                        size += _body_file_path(fname).stat().st_size
+                    emit(CacheWrite(api, view, str(fname), size,
+                                    perf_counter() - started))
+        self._process_json()
+
+    def __getattr__(self, name):
+        """Read the cached file on first access to an attribute derived from
+        it, if its parsing has been deferred (see `init(lazy=True)`).  The
+        file is read once, even if several threads access the object.
+        """
+        lock = self.__dict__.get('_pending_lock')
+        if lock is None or name.startswith('__') or name == '_header':
+            msg = f"'{type(self).__name__}' object has no attribute '{name}'"
+            raise AttributeError(msg, name=name, obj=self)
+        with lock:
+            pending = self.__dict__.pop('_pending_cache', None)
+            if pending is not None:
+                try:
+                    self._read_cache(*pending)
+                    self._process_json()
+                except Exception:
+                    self._pending_cache = pending  # Raise again on next access
+                    raise
+        # Also if another thread has completed reading in the meantime
+        return object.__getattribute__(self, name)
+
+    def _process_json(self) -> None:
+        """Derive attributes from `self._json` once it is available.  Meant
+        to be overridden by subclasses.
+        """
+
+    def _release_cache_file(self) -> None:
+        """Release resources using the cached file before it is replaced.
+        Meant to be overridden by subclasses.
+        """
+
+    def _read_cache(self, search_request: bool, serial_search: bool) -> None:
+        """Read and parse the cached file."""
+        fname = self._cache_file_path
+        api = self.__class__.__name__
+        started = perf_counter()
+        with start_span(f'{api} cache read', api=api):
+            content = fname.read_bytes()
+            if search_request:
+                self._json = [json_loads(line) for line in content.split(b"\n") if line]
+                self._n = len(self._json)
+            elif serial_search:
+                self._json = json_loads(content)
+                self._n = len(self._json['serial-metadata-response'].get('entry', []))
+            else:
+                self._json = json_loads(content)
+        if has_subscribers():
+            emit(CacheRead(api, getattr(self, '_view', None), str(fname),
+                           len(content), perf_counter() - started))
 
     def get_cache_file_age(self) -> int:
         """Return the age of the cached file in days."""
@@ -172,6 +276,64 @@ class Base:
             return None
 
 
+def _page_downloaded(api: str, page: int, pages: int) -> None:
+    """Auxiliary function to emit the progress of a paginated download."""
+    if has_subscribers():
+        emit(PageDownloaded(api, page, pages))
+
+
+def _body_file_path(fname):
+    """Auxiliary function to get the path of the file storing the body of
+    a full text, next to the file storing its metadata.
+    """
+    return fname.with_name(fname.name + '.body')
+
+
+def _write_with_body(fname, data):
+    """Write a full text retrieval response as two files: the metadata
+    without `originalText`, and the value of `originalText` as body file.
+    The body is written first, so that the metadata file only exists
+    together with its body.
+    """
+    response = data.get('full-text-retrieval-response', {})
+    metadata = {k: v for k, v in response.items() if k != 'originalText'}
+    _body_file_path(fname).write_bytes(json_dumps(response.get('originalText')))
+    fname.write_bytes(json_dumps({'full-text-retrieval-response': metadata}))
+
+
+def _split_body(fname):
+    """Auxiliary function to split a full text cached in one file (before
+    bodies were stored separately) into metadata and body file, keeping
+    its modification date.  Returns False if the file contains no body.
+    """
+    data = json_loads(fname.read_bytes())
+    if 'originalText' not in data.get('full-text-retrieval-response', {}):
+        return False
+    stat = fname.stat()
+    _write_with_body(fname, data)
+    for path in (fname, _body_file_path(fname)):
+        os.utime(path, (stat.st_atime, stat.st_mtime))
+    return True
+
+
+def _stream_to_file(resp, fname):
+    """Write the body of a streamed response to a file in chunks.  Writes to
+    a temporary file first so that interrupted downloads leave no partial
+    file in the cache.
+    """
+    part = fname.with_name(fname.name + '.part')
+    try:
+        with part.open('wb') as f:
+            for chunk in resp.iter_content(chunk_size=STREAM_CHUNK_SIZE):
+                f.write(chunk)
+        os.replace(part, fname)
+    except BaseException:
+        part.unlink(missing_ok=True)
+        raise
+    finally:
+        resp.close()
+
+
 def _check_file_age(self):
     """Whether a file needs to be refreshed based on its age."""
     refresh = self._refresh
@@ -188,12 +350,37 @@ def _check_file_age(self):
     return refresh, mod_ts
 
 
+def _get_pages(url: str, api: str, params: dict, starts: list[int],
+               workers: int, verbose: bool, **kwds) -> tuple[list, dict]:
+    """Download pages of search results concurrently, one for each value
+    in `starts`.  Returns the lists of entries in the order of `starts`,
+    and the header of the final page.
+    """
+    def download(start):
+        page = (start - params['start']) // params['count']
+        with start_span(f'{api} page', api=api, page=page):
+            resp = get_content(url, api, {**params, 'start': start}, **kwds)
+            entries = json_loads(resp.content).get('search-results', {}).get('entry', [])
+        return entries, resp.headers
+
+    from tqdm import tqdm
+    pages = {}
+    done = run_in_threads(download, starts, workers)
+    for start, result, error in tqdm(done, disable=not verbose, initial=1,
+                                     total=len(starts) + 1):
+        if error:
+            raise error
+        pages[start] = result
+        _page_downloaded(api, len(pages) + 1, len(starts) + 1)
+    return [pages[s][0] for s in starts], pages[starts[-1]][1]
+
+
 def _get_all_refs(url: str, params: dict, verbose: bool, resp: dict, **kwds) -> dict:
     """Get all references for `AbstractRetrieval` with view `REF`."""
     # startref starts at 1 (0 does not work)
     # Max refs per query are 40
     # Use of refcount leads to errors
-    res = resp.json()
+    res = json_loads(resp.content)
     path_total_references = ['abstracts-retrieval-response', 'references', '@total-references']
     try:
         n = int(parse_content.chained_get(res, path_total_references))
@@ -205,16 +392,19 @@ def _get_all_refs(url: str, params: dict, verbose: bool, resp: dict, **kwds) ->
     ref_len = len(parse_content.chained_get(data, path_reference))
     n_chunks = ceil(n/ref_len)
 
+    from tqdm import tqdm
     for i in tqdm(range(1, n_chunks), disable=not verbose,
                   initial=1, total=n_chunks):
         # Increment startref
         kwds['startref'] = str(int(kwds['startref']) + ref_len)
         # Get
-        resp = get_content(url, 'AbstractRetrieval', params, **kwds)
-        res = resp.json()
+        with start_span('AbstractRetrieval page', api='AbstractRetrieval', page=i):
+            resp = get_content(url, 'AbstractRetrieval', params, **kwds)
+            res = json_loads(resp.content)
         res = parse_content.chained_get(res, path_reference)
         # Append
         data['abstracts-retrieval-response']['references']['reference'].extend(listify(res))
+        _page_downloaded('AbstractRetrieval', i + 1, n_chunks)
         if verbose:
             print(f'Extracted:\n\tFrom: {kwds["startref"]}\n\tTo:{len(parse_content.chained_get(data, ["abstracts-retrieval-response", "references", "reference"]))}')
 
@@ -226,7 +416,7 @@ def _get_all_refs(url: str, params: dict, verbose: bool, resp: dict, **kwds) ->
 
 def _get_all_serial_results(url: str, params: dict, verbose: bool, resp, **kwds) -> list:
     """Get all results for `SerialTitleSearch` with pagination."""
-    res = resp.json()
+    res = json_loads(resp.content)
     data = res.get('serial-metadata-response', {}).get('entry', [])
     
     # Check for 'next' link to determine if pagination is needed
@@ -244,12 +434,15 @@ def _get_all_serial_results(url: str, params: dict, verbose: bool, resp, **kwds)
     count = int(parsed.get('count', [params['count']])[0])
     n_total = last_start + count
     n_chunks = ceil(n_total / count)
-    
+
+    from tqdm import tqdm
     for i in tqdm(range(1, n_chunks), disable=not verbose, initial=1, total=n_chunks):
         params['start'] = i * count
-        resp = get_content(url, 'SerialTitleSearch', params, **kwds)
-        res = resp.json()
+        with start_span('SerialTitleSearch page', api='SerialTitleSearch', page=i):
+            resp = get_content(url, 'SerialTitleSearch', params, **kwds)
+            res = json_loads(resp.content)
         entries = res.get('serial-metadata-response', {}).get('entry', [])
         data.extend(entries)
+        _page_downloaded('SerialTitleSearch', i + 1, n_chunks)
     
     return data
@@ -2,9 +2,20 @@
 
 import hashlib
 from pathlib import Path
+from typing import Any, Iterable, Iterator, NamedTuple
 
 from pybliometrics.superclasses import Base
-from pybliometrics.utils import APIS_NO_ID_IN_URL, APIS_WITH_ID_TYPE, get_config, URLS
+from pybliometrics.superclasses.base import _CacheProbe
+from pybliometrics.utils import APIS_NO_ID_IN_URL, APIS_WITH_ID_TYPE, get_config, \
+    run_in_threads, start_span, URLS
+
+
+class BulkItem(NamedTuple):
+    """Outcome of one retrieval in `Retrieval.bulk()`."""
+    identifier: Any
+    result: Any
+    """The retrieval object, or None if an error occurred."""
+    error: Exception | None
 
 
 class Retrieval(Base):
@@ -52,4 +63,79 @@ class Retrieval(Base):
 
         # Parse file contents
         params = {'view': self._view, **kwds}
-        Base.__init__(self, params=params, url=url)
+        with start_span(api, api=api, view=self._view):
+            Base.__init__(self, params=params, url=url)
+
+    def _probe_parts(self) -> None:
+        """Auxiliary function for objects merged from several retrievals:
+        count them as not cached while probing, because their parts
+        would be retrieved.
+        """
+        if self._probe_cache:
+            raise _CacheProbe(None, hit=False)
+
+    def _adopt_cache_info(self, parts: list) -> None:
+        """Auxiliary function for objects merged from several retrievals:
+        take over the cache file and date of the oldest part, and the
+        header of the last downloaded part.
+        """
+        oldest = min(parts, key=lambda p: p._mdate)
+        self._cache_file_path = oldest._cache_file_path
+        self._mdate = oldest._mdate
+        downloaded = [p for p in parts if hasattr(p, '_header')]
+        if downloaded:
+            self._header = downloaded[-1]._header
+
+    @classmethod
+    def bulk(cls,
+             identifiers: Iterable,
+             workers: int = 4,
+             refresh: bool | int = False,
+             **kwds
+             ) -> Iterator[BulkItem]:
+        """Retrieve many identifiers at once.
+
+        All objects are built by `workers` threads, which share the rate
+        limit of the API.  Identifiers whose cached file exists are started
+        first, in the order of `identifiers`; the others are downloaded
+        afterwards.  Results are served as they complete.  Errors do not
+        abort the batch but are returned with the identifier.
+
+        :param identifiers: The identifiers to retrieve.
+        :param workers: The number of concurrent downloads.
+        :param refresh: Whether to refresh the cached files if they exist or
+                        not.  If int is passed, cached files will be refreshed
+                        if the number of days since last modification exceeds
+                        that value.
+        :param kwds: Keywords passed on to the class, e.g. `view` or `id_type`.
+
+        :returns: Generator of `BulkItem(identifier, result, error)`, where
+                  `result` is the instance of the class (or None) and `error`
+                  the exception raised (or None).
+
+        Examples
+        --------
+        >>> for item in AbstractRetrieval.bulk(eids, view="FULL", workers=8):
+        ...     if item.error:
+        ...         print(item.identifier, item.error)
+        """
+        def retrieve(identifier):
+            return cls(identifier, refresh=refresh, **kwds)
+
+        # Only probe for cached files, without reading or downloading
+        hits, misses = [], []
+        for identifier in identifiers:
+            obj = cls.__new__(cls)
+            obj._probe_cache = True
+            try:
+                obj.__init__(identifier, refresh=refresh, **kwds)
+            except _CacheProbe as probe:
+                if probe.hit:
+                    hits.append(identifier)
+                    continue
+            except Exception:
+                pass  # The error recurs when the object is built
+            misses.append(identifier)
+
+        for identifier, result, error in run_in_threads(retrieve, hits + misses, workers):
+            yield BulkItem(identifier, result, error)
@@ -4,7 +4,8 @@ from hashlib import md5
 from pathlib import Path
 
 from pybliometrics.superclasses import Base
-from pybliometrics.utils import get_config, COUNTS, URLS
+from pybliometrics.utils import get_config, json_loads, make_arrow_schema, \
+    read_parquet_dataset, start_span, write_parquet_dataset, COUNTS, URLS
 
 
 class Search(Base):
@@ -13,6 +14,7 @@ class Search(Base):
                  cursor: bool = False,
                  download: bool = True,
                  verbose: bool = False,
+                 workers: int = 1,
                  **kwds: str
                  ) -> None:
         """Class intended as superclass to perform a search query.
@@ -25,6 +27,8 @@ class Search(Base):
         :param download: Whether to download results (if they have not been
                          cached) or not.
         :param verbose: Whether to print a download progress bar.
+        :param workers: The number of result pages to download concurrently.
+                        Has no effect if `cursor` is True.
         :param kwds: Keywords passed on to requests header.  Must contain
                      fields and values specified in the respective API specification.
 
@@ -50,15 +54,71 @@ class Search(Base):
                 params['start'] = 0
 
         # Construct cache file path
-        stem = md5(name.encode('utf8')).hexdigest()
-        # Get cache file path
-        config = get_config()
-        parent = Path(config.get('Directories', api))
-        self._cache_file_path = parent/self._view/stem
+        self._cache_file_path = _get_cache_file_path(api, self._view, name)
 
         # Init
-        Base.__init__(self, params=params, url=URLS[api], download=download, verbose=verbose)
+        with start_span(api, api=api, view=self._view, download=download):
+            Base.__init__(self, params=params, url=URLS[api], download=download,
+                          verbose=verbose, workers=workers)
 
     def get_results_size(self) -> int:
         """Return the number of results (works even if download=False)."""
         return self._n
+
+    def _iter_entries(self):
+        """Iterate over the raw search results.  If parsing of the cached
+        file is deferred (see `init(lazy=True)`), decode the file line by
+        line without keeping the results, so that they are never held in
+        memory all at once.
+        """
+        if '_pending_cache' not in self.__dict__:
+            yield from self._json
+            return
+        with self._cache_file_path.open('rb') as f:
+            for line in f:
+                if line.strip():
+                    yield json_loads(line)
+
+    def to_parquet(self, root: str | Path) -> None:
+        """Write the results to a Parquet dataset in directory `root`,
+        partitioned by the hash of the query (the name of the cache file)
+        and the year of the publication.  Results of many queries may
+        share the same root; writing a query again replaces its data.
+
+        Requires `pyarrow`, which you can install via
+        `pip install pybliometrics[arrow]`.
+
+        :param root: The directory of the dataset.
+        """
+        write_parquet_dataset(self.to_arrow(), root,
+                              query_hash=self._cache_file_path.name)
+
+    @classmethod
+    def read_parquet(cls,
+                     root: str | Path,
+                     columns: list[str] | None = None,
+                     filters: list[tuple] | None = None):
+        """Read results written by `to_parquet()` as `pyarrow.Table`.
+        Besides the fields of `results`, the table contains the
+        partition columns `query_hash` and `year`.
+
+        Requires `pyarrow`, which you can install via
+        `pip install pybliometrics[arrow]`.
+
+        :param root: The directory of the dataset.
+        :param columns: The columns to read.  If `None`, reads all columns.
+        :param filters: Predicates in the form of a list of tuples
+                        (e.g. `[('year', '>=', 2020)]`) or as
+                        `pyarrow.compute.Expression`.  Rows not satisfying
+                        the predicates are skipped and predicates on
+                        `query_hash` and `year` prune entire partitions.
+        """
+        schema = make_arrow_schema(cls._document._fields, cls._column_types)
+        return read_parquet_dataset(root, schema, columns=columns, filters=filters)
+
+
+def _get_cache_file_path(api: str, view: str, name: str) -> Path:
+    """Auxiliary function to get the path of the cached results of a query."""
+    stem = md5(name.encode('utf8')).hexdigest()
+    parent = Path(get_config().get('Directories', api))
+    return parent/view/stem
@@ -1,7 +1,18 @@
 from pybliometrics.utils.checks import *
+from pybliometrics.utils.columnar import *
 from pybliometrics.utils.constants import *
 from pybliometrics.utils.create_config import *
+from pybliometrics.utils.eid_map import *
+from pybliometrics.utils.events import *
 from pybliometrics.utils.get_content import *
+from pybliometrics.utils.json_codec import *
+from pybliometrics.utils.metrics import *
+from pybliometrics.utils.parallel import *
+from pybliometrics.utils.partition import *
 from pybliometrics.utils.parse_content import *
 from pybliometrics.utils.parse_metrics import *
+from pybliometrics.utils.probe import *
+from pybliometrics.utils.profiling import *
+from pybliometrics.utils.records import *
 from pybliometrics.utils.startup import *
+from pybliometrics.utils.tracing import *
@@ -0,0 +1,120 @@
+"""Auxiliary functions to export parsed search results into columnar formats."""
+from datetime import date
+from pathlib import Path
+from shutil import rmtree
+
+# Columns by which Parquet datasets are partitioned
+PARTITION_FIELDS = {'query_hash': 'string', 'year': 'int32'}
+
+
+def import_pyarrow():
+    """Import the optional dependency `pyarrow` or raise an informative
+    ImportError.
+    """
+    try:
+        import pyarrow
+    except ImportError:
+        msg = "This functionality requires pyarrow.  Install it with "\
+              "`pip install pybliometrics[arrow]`."
+        raise ImportError(msg) from None
+    return pyarrow
+
+
+def make_arrow_schema(fields, types):
+    """Create a `pyarrow.Schema` for the given fields, whose type is looked
+    up in `types` (defaulting to string).
+
+    Parameters
+    ----------
+    fields : iterable of str
+        The names of the columns in order.
+
+    types : dict
+        Mapping of field names to one of `"int32"`, `"int64"`, `"bool"`, `"date"`,
+        `"dictionary"` and `"string"`.
+    """
+    pa = import_pyarrow()
+    mapping = {'int32': pa.int32(), 'int64': pa.int64(), 'bool': pa.bool_(), 'date': pa.date32(),
+               'dictionary': pa.dictionary(pa.int32(), pa.string()),
+               'string': pa.string()}
+    return pa.schema([(field, mapping[types.get(field, 'string')])
+                      for field in fields])
+
+
+def make_arrow_table(columns, types):
+    """Create a `pyarrow.Table` from a dictionary of columns, converting
+    each column according to `types` (see `make_arrow_schema()`).
+    """
+    pa = import_pyarrow()
+    schema = make_arrow_schema(columns.keys(), types)
+    arrays = []
+    for field in schema:
+        values = columns[field.name]
+        if pa.types.is_date(field.type):
+            values = [_parse_date(v) for v in values]
+        if pa.types.is_dictionary(field.type):
+            array = pa.array(values, type=pa.string()).dictionary_encode()
+        else:
+            array = pa.array(values, type=field.type)
+        arrays.append(array)
+    return pa.Table.from_arrays(arrays, schema=schema)
+
+
+def write_parquet_dataset(table, root, query_hash):
+    """Write a table of search results to a Parquet dataset partitioned
+    by `query_hash` and the year of `coverDate` (Hive-style, i.e.
+    `{root}/query_hash={hash}/year={year}/`).  Existing data for the same
+    query hash is replaced.
+    """
+    pa = import_pyarrow()
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+
+    # Remove all partitions of the query, including years no longer present
+    rmtree(Path(root) / f'query_hash={query_hash}', ignore_errors=True)
+    years = pc.cast(pc.year(table['coverDate']), pa.int32())
+    hashes = pa.array([query_hash] * table.num_rows, type=pa.string())
+    table = table.append_column('query_hash', hashes).append_column('year', years)
+    partitioning = ds.partitioning(make_arrow_schema(PARTITION_FIELDS, PARTITION_FIELDS),
+                                   flavor='hive')
+    ds.write_dataset(table, root, format='parquet', partitioning=partitioning,
+                     basename_template=f'{query_hash}-{{i}}.parquet',
+                     existing_data_behavior='overwrite_or_ignore')
+
+
+def read_parquet_dataset(root, schema, columns=None, filters=None):
+    """Read a Parquet dataset written by `write_parquet_dataset()`.
+
+    Parameters
+    ----------
+    root : str or pathlib.Path
+        The root directory of the dataset.
+
+    schema : pyarrow.Schema
+        Schema of the results, excluding the partition columns.
+
+    columns : list of str (optional, default=None)
+        The columns to read.  If None, reads all columns.
+
+    filters : pyarrow.compute.Expression or list of tuples (optional, default=None)
+        Rows which do not match the filter predicate will be skipped,
+        e.g. `[('year', '>=', 2020)]`.  Filters on the partition columns
+        `query_hash` and `year` prune entire partitions.
+    """
+    pa = import_pyarrow()
+    import pyarrow.parquet as pq
+
+    partition_schema = make_arrow_schema(PARTITION_FIELDS, PARTITION_FIELDS)
+    schema = pa.unify_schemas([schema, partition_schema])
+    return pq.read_table(root, columns=columns, filters=filters, schema=schema,
+                         partitioning='hive')
+
+
+def _parse_date(s):
+    """Auxiliary function to convert an ISO date string to a date, if
+    possible.
+    """
+    try:
+        return date.fromisoformat(s)
+    except (TypeError, ValueError):
+        return None
@@ -42,6 +42,8 @@ DEFAULT_PATHS = {
     'SerialTitleSearch': CACHE_PATH / "Scopus" / 'serial_search',
     'SerialTitleISSN': CACHE_PATH / "Scopus" / 'serial_title',
     'SubjectClassifications': CACHE_PATH / "Scopus" / 'subject_classification',
+    # Not an API: maps document identifiers to EIDs
+    'EIDMap': CACHE_PATH / "ScienceDirect" / 'eid_map',
 }
 
 # URLs for all classes
@@ -206,3 +208,16 @@ RATELIMITS = {
 
 # Other API restrictions
 SEARCH_MAX_ENTRIES = 5_000
+# Maximum length of URL-encoded queries (longer ones risk a 414 error)
+SEARCH_MAX_QUERY_LENGTH = 2_000
+# Maximum number of entities per request to the SciVal metrics APIs
+SCIVAL_MAX_ENTITIES = 100
+
+# Size in bytes of the chunks in which binary objects are written to disk
+STREAM_CHUNK_SIZE = 1 << 20
+
+# Codes of the subject areas accepted by SUBJAREA() in Scopus queries
+SUBJECT_AREAS = ('AGRI', 'ARTS', 'BIOC', 'BUSI', 'CENG', 'CHEM', 'COMP', 'DECI',
+                 'DENT', 'EART', 'ECON', 'ENER', 'ENGI', 'ENVI', 'HEAL', 'IMMU',
+                 'MATE', 'MATH', 'MEDI', 'MULT', 'NEUR', 'NURS', 'PHAR', 'PHYS',
+                 'PSYC', 'SOCI', 'VETE')
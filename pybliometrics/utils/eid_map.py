@@ -0,0 +1,59 @@
+"""Persistent map of document identifiers (DOI, PII, Scopus ID, PubMed ID)
+to EIDs, shared by all classes that need to resolve an identifier.  Each
+identifier is stored in a small file of its own, so that the map can be
+read and written by several processes at once.
+"""
+import os
+from contextlib import suppress
+from pathlib import Path
+
+from pybliometrics.utils.startup import get_config
+
+
+def lookup_eid(identifier: str, id_type: str) -> str | None:
+    """Return the EID of a document previously stored via `remember_eid()`,
+    or None if the identifier has not been resolved yet.
+
+    :param identifier: The identifier of the document.
+    :param id_type: The type of the identifier, e.g. `doi` or `pii`.
+    """
+    if id_type == 'eid':
+        return identifier
+    try:
+        return _map_file(identifier, id_type).read_text().strip() or None
+    except OSError:
+        return None
+
+
+def remember_eid(identifier: str, id_type: str, eid: str | None) -> None:
+    """Store the EID of a document under one of its identifiers.
+
+    :param identifier: The identifier of the document.
+    :param id_type: The type of the identifier, e.g. `doi` or `pii`.
+    :param eid: The EID of the document.  Nothing is stored if it is empty,
+                if `id_type` is `eid`, or if the map already stores it.
+
+    Storing is best-effort: if the file cannot be written (e.g. because the
+    folder is read-only or the identifier makes an invalid file name), the
+    EID is not stored.
+    """
+    if not eid or id_type == 'eid' or lookup_eid(identifier, id_type) == eid:
+        return
+    fname = _map_file(identifier, id_type)
+    part = fname.with_name(f'{fname.name}.{os.getpid()}.part')
+    try:
+        fname.parent.mkdir(parents=True, exist_ok=True)
+        part.write_text(eid)
+        os.replace(part, fname)
+    except OSError:
+        with suppress(OSError):
+            part.unlink()
+
+
+def _map_file(identifier: str, id_type: str) -> Path:
+    """Auxiliary function to get the file storing the EID of an identifier."""
+    identifier = str(identifier).strip()
+    if id_type == 'doi':
+        identifier = identifier.lower()  # DOIs are case-insensitive
+    parent = Path(get_config().get('Directories', 'EIDMap'))
+    return parent / id_type / identifier.replace('/', '_')
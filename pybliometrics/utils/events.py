@@ -0,0 +1,128 @@
+"""Typed events emitted by requests and cache accesses, for instrumentation."""
+from hashlib import md5
+from threading import Lock
+from typing import Callable, NamedTuple
+from warnings import warn
+
+
+class RequestStart(NamedTuple):
+    """A request is about to be sent (after waiting for the rate limit)."""
+    api: str
+    url: str
+    key_id: str
+    """Hash of the API key, see `key_id()`."""
+
+
+class RequestEnd(NamedTuple):
+    """A request received its final response."""
+    api: str
+    url: str
+    status: int
+    latency: float
+    """Seconds from sending the first request to the final response."""
+    bytes: int | None
+    """Size of the body, or None for streamed responses of unknown size."""
+    key_id: str
+    """Hash of the API key of the final response, see `key_id()`."""
+    retries: int
+    """Number of repeated requests, with other keys or after server errors."""
+    throttle_wait: float
+    """Seconds waited for the rate limit before sending the request."""
+    quota_remaining: str | None
+    """Value of header `X-RateLimit-Remaining` of the final response."""
+    rate_limited: int = 0
+    """Number of responses with status 429 (too many requests)."""
+
+
+class CacheLookup(NamedTuple):
+    """A class looked up its cached file."""
+    api: str
+    view: str | None
+    path: str
+    result: str
+    """'hit' if the file is used, 'stale' if it is too old or a refresh
+    was requested, and 'miss' if it does not exist.
+    """
+
+
+class CacheRead(NamedTuple):
+    """A class read and decoded its cached file."""
+    api: str
+    view: str | None
+    path: str
+    bytes: int
+    duration: float
+    """Seconds spent reading and decoding."""
+
+
+class CacheWrite(NamedTuple):
+    """A class wrote its cached file."""
+    api: str
+    view: str | None
+    path: str
+    bytes: int
+    duration: float
+    """Seconds spent writing."""
+
+
+class PageDownloaded(NamedTuple):
+    """One page of a paginated response has been downloaded."""
+    api: str
+    page: int
+    """Number of pages downloaded so far, including the first."""
+    pages: int
+    """Total number of pages."""
+
+
+Event = RequestStart | RequestEnd | CacheLookup | CacheRead | CacheWrite | \
+    PageDownloaded
+
+# Pairs of callback and event types, replaced as a whole on change
+_subscribers: tuple[tuple[Callable, tuple[type, ...]], ...] = ()
+_subscribers_lock = Lock()
+
+
+def subscribe(callback: Callable[[Event], None], *event_types: type) -> Callable:
+    """Call `callback(event)` for every emitted event, or only for events
+    of the given types.  Callbacks run synchronously in the thread emitting
+    the event, so they should return quickly.  Exceptions they raise are
+    turned into warnings.
+
+    :param callback: The function to call with each event.
+    :param event_types: The event classes to subscribe to.  Subscribes to
+                        all events if none are given.
+
+    :returns: `callback`, so that `subscribe()` can be used as decorator.
+    """
+    global _subscribers
+    with _subscribers_lock:
+        _subscribers += ((callback, event_types),)
+    return callback
+
+
+def unsubscribe(callback: Callable) -> None:
+    """Stop calling `callback` for emitted events."""
+    global _subscribers
+    with _subscribers_lock:
+        _subscribers = tuple(s for s in _subscribers if s[0] != callback)
+
+
+def has_subscribers() -> bool:
+    """Whether any callback is subscribed, to skip building unused events."""
+    return bool(_subscribers)
+
+
+def emit(event: Event) -> None:
+    """Pass `event` to all callbacks subscribed to its type."""
+    for callback, event_types in _subscribers:
+        if event_types and not isinstance(event, event_types):
+            continue
+        try:
+            callback(event)
+        except Exception as e:
+            warn(f"Event subscriber {callback!r} failed: {e!r}", RuntimeWarning)
+
+
+def key_id(key: str | None) -> str:
+    """Return a short hash identifying an API key without revealing it."""
+    return md5(str(key).encode('utf8')).hexdigest()[:8]
@@ -1,11 +1,20 @@
-from requests import Session
-from requests.adapters import HTTPAdapter
-from requests.exceptions import JSONDecodeError
-from urllib3.util import Retry
+from collections import deque
+from random import shuffle
+from threading import local, Lock
+from time import perf_counter, sleep, time
+from typing import TYPE_CHECKING
 
 from pybliometrics import __version__
 from pybliometrics import exception
-from pybliometrics.utils.startup import get_config, get_insttokens, get_keys, _throttling_params
+from pybliometrics.utils.constants import RATELIMITS
+from pybliometrics.utils.events import emit, has_subscribers, key_id, \
+    RequestEnd, RequestStart
+from pybliometrics.utils.startup import get_request_context, _throttling_locks, \
+    _throttling_params
+from pybliometrics.utils.tracing import set_span_attributes, start_span
+
+if TYPE_CHECKING:
+    from requests import Session
 
 # Define user agent string for HTTP requests
 user_agent = 'pybliometrics-v' + __version__
@@ -15,22 +24,32 @@ errors = {400: exception.Scopus400Error, 401: exception.Scopus401Error,
           407: exception.Scopus407Error, 413: exception.Scopus413Error, 
           414: exception.Scopus414Error, 429: exception.Scopus429Error}
 
+# One session per thread, reused as long as the request context is unchanged
+_sessions = local()
+
+
+def get_session() -> "Session":
+    """Auxiliary function to get the session of the current thread."""
+    context = get_request_context()
+    if getattr(_sessions, 'context', None) is context:
+        return _sessions.session
 
-def get_session() -> Session:
-    """Auxiliary function to create a session"""
-    config = get_config()
+    # requests and urllib3 are imported here because they are slow to import
+    from requests import Session
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
 
-    _retries = config.getint("Requests", "Retries", fallback=5)
-    retry = Retry(total=_retries, backoff_factor=0.1,
+    retry = Retry(total=context.retries, backoff_factor=0.1,
                   status_forcelist=[500, 501, 502, 503, 504, 524])
     adapter = HTTPAdapter(max_retries=retry)
     session = Session()
     session.mount('http://', adapter)
     session.mount('https://', adapter)
+    _sessions.context, _sessions.session = context, session
     return session
 
 
-def get_content(url, api, params=None, **kwds):
+def get_content(url, api, params=None, stream=False, **kwds):
     """Helper function to download a file and return its content.
 
     Parameters
@@ -46,6 +65,10 @@ def get_content(url, api, params=None, **kwds):
         and accepted values see e.g.
         https://api.elsevier.com/documentation/AuthorRetrievalAPI.wadl
 
+    stream : bool (optional)
+        Whether to defer downloading the body of a successful response
+        until it is read, e.g. via `resp.iter_content()`.
+
     **kwds : key-value parings, optional
         Keywords passed on to as query parameters.  Must contain fields
         and values specified in the respective API specification.
@@ -63,27 +86,18 @@ def get_content(url, api, params=None, **kwds):
     resp : byte-like object
         The content of the file, which needs to be serialized.
     """
-    from random import shuffle
-    from time import sleep, time
+    from requests.exceptions import JSONDecodeError
 
     # Get needed ressources for query
-    config = get_config()
-
-    keys = get_keys()
-
-    # Get tokens and zip with keys
-    insttokens = get_insttokens()
-    insttokens = list(zip(keys, insttokens))
-
-    # Keep keys that are not insttokens
-    keys = keys[len(insttokens):]
+    context = get_request_context()
+    keys = list(context.keys)
+    insttokens = list(context.insttokens)
 
     session = get_session()
 
-    params = params or {}
-    params.update(**kwds)
-    proxies = dict(config._sections.get("Proxy", {}))
-    timeout = config.getint("Requests", "Timeout", fallback=20)
+    params = {**(params or {}), **kwds}  # Keep the caller's dict intact
+    proxies = dict(context.proxies)
+    timeout = context.timeout
 
     # Get keys/tokens and create header
     token_key, insttoken = None, None
@@ -101,61 +115,117 @@ def get_content(url, api, params=None, **kwds):
               'User-Agent': user_agent,
               'X-ELS-APIKey': token_key or key}
 
-    # Eventually wait bc of throttling
-    if len(_throttling_params[api]) == _throttling_params[api].maxlen:
-        try:
-            sleep(1 - (time() - _throttling_params[api][0]))
-        except (IndexError, ValueError):
-            pass
-
-    # Use insttoken if available
-    if insttoken:
-        header['X-ELS-Insttoken'] = insttoken
-        resp = session.get(url, headers=header, params=params, timeout=timeout)
-    else:
-        resp = session.get(url, headers=header, params=params, timeout=timeout, proxies=proxies)
-
-    # If 429 try other tokens
-    while (resp.status_code == 429) or (resp.status_code == 401):
-        try:
-            token_key, token = insttokens.pop(0) # Get and remove current key
-            header['X-ELS-APIKey'] = token_key
-            header['X-ELS-Insttoken'] = token
-            shuffle(insttokens)
-            resp = session.get(url, headers=header, params=params, timeout=timeout)
-        except IndexError:  # All tokens depleted
-            break
-
-   # Remove Insttoken from header (if present)
-    if 'X-ELS-Insttoken' in header:
-        del header['X-ELS-Insttoken']
-
-    # If 429 try other keys
-    while (resp.status_code == 429) or (resp.status_code == 401):
-        try:
-            key = keys.pop(0)  # Remove current key
-            header['X-ELS-APIKey'] = key
-            shuffle(keys)
-            resp = session.get(url, headers=header, proxies=proxies, params=params, timeout=timeout)
-        except IndexError:  # All keys depleted
-            break
-
-    _throttling_params[api].append(time())
+    with start_span(f'{api} request', api=api, url=url) as span:
+        # Eventually wait bc of throttling
+        throttle_wait = _wait_for_slot(api, token_key or key)
+        observed = has_subscribers()
+        if observed:
+            emit(RequestStart(api, url, key_id(token_key or key)))
+        started = perf_counter()
+        retries = 0
+
+        # Use insttoken if available
+        if insttoken:
+            header['X-ELS-Insttoken'] = insttoken
+            resp = session.get(url, headers=header, params=params, timeout=timeout,
+                               stream=stream)
+        else:
+            resp = session.get(url, headers=header, params=params, timeout=timeout,
+                               proxies=proxies, stream=stream)
+        rate_limited = int(resp.status_code == 429)
 
-    # Eventually raise error, if possible with supplied error message
-    try:
-        error_type = errors[resp.status_code]
+        # If 429 try other tokens
+        while (resp.status_code == 429) or (resp.status_code == 401):
+            try:
+                token_key, token = insttokens.pop(0) # Get and remove current key
+                header['X-ELS-APIKey'] = token_key
+                header['X-ELS-Insttoken'] = token
+                shuffle(insttokens)
+                retries += 1
+                resp.close()  # Release the connection of a streamed response
+                resp = session.get(url, headers=header, params=params, timeout=timeout,
+                                   stream=stream)
+                rate_limited += resp.status_code == 429
+            except IndexError:  # All tokens depleted
+                break
+
+       # Remove Insttoken from header (if present)
+        if 'X-ELS-Insttoken' in header:
+            del header['X-ELS-Insttoken']
+
+        # If 429 try other keys
+        while (resp.status_code == 429) or (resp.status_code == 401):
+            try:
+                key = keys.pop(0)  # Remove current key
+                header['X-ELS-APIKey'] = key
+                shuffle(keys)
+                retries += 1
+                resp.close()
+                resp = session.get(url, headers=header, proxies=proxies, params=params,
+                                   timeout=timeout, stream=stream)
+                rate_limited += resp.status_code == 429
+            except IndexError:  # All keys depleted
+                break
+
+        set_span_attributes(span, status=resp.status_code, retries=retries,
+                            rate_limited=rate_limited, throttle_wait=throttle_wait)
+        if observed:
+            emit(_request_end(api, url, resp, perf_counter() - started, stream,
+                              header['X-ELS-APIKey'], retries, rate_limited,
+                              throttle_wait))
+
+        # Eventually raise error, if possible with supplied error message
         try:
-            reason = resp.json()['service-error']['status']['statusText']
-        except KeyError:
+            error_type = errors[resp.status_code]
             try:
-                reason = resp.json()['message']
-            except:
-                reason = ""
-        raise error_type(reason)
-    except (JSONDecodeError, KeyError):
-        resp.raise_for_status()
-    return resp
+                reason = resp.json()['service-error']['status']['statusText']
+            except KeyError:
+                try:
+                    reason = resp.json()['message']
+                except:
+                    reason = ""
+            raise error_type(reason)
+        except (JSONDecodeError, KeyError):
+            resp.raise_for_status()
+        return resp
+
+
+def _request_end(api, url, resp, latency, stream, key, retries, rate_limited,
+                 throttle_wait):
+    """Auxiliary function to build the event for a final response."""
+    if stream:
+        size = resp.headers.get('Content-Length')
+        size = int(size) if size else None
+    else:
+        size = len(resp.content)
+    # Repetitions by urllib3 after server errors
+    history = getattr(getattr(resp.raw, 'retries', None), 'history', None) or ()
+    return RequestEnd(api, url, resp.status_code, latency, size, key_id(key),
+                      retries + len(history), throttle_wait,
+                      resp.headers.get('X-RateLimit-Remaining'), rate_limited)
+
+
+def _wait_for_slot(api: str, key: str) -> float:
+    """Auxiliary function to wait until the rate limit of `api` for API key
+    `key` allows another request, and to book it.  Thread-safe.  Returns
+    the seconds waited.
+    """
+    limit = RATELIMITS.get(api)
+    if not limit:
+        return 0.0
+    if (api, key) not in _throttling_locks:
+        _throttling_params.setdefault((api, key), deque(maxlen=limit))
+        _throttling_locks.setdefault((api, key), Lock())
+    timestamps = _throttling_params[(api, key)]
+    wait = 0.0
+    with _throttling_locks[(api, key)]:
+        if len(timestamps) == timestamps.maxlen:
+            wait = max(1 - (time() - timestamps[0]), 0.0)
+            if wait:
+                with start_span(f'{api} throttle', api=api, wait=wait):
+                    sleep(wait)
+        timestamps.append(time())
+    return wait
 
 
 def detect_id_type(sid):
@@ -0,0 +1,62 @@
+"""Pluggable JSON codec used to decode responses and to read and write
+cached files.  Uses orjson or msgspec if installed, and the standard
+library otherwise.
+"""
+import json
+from importlib import import_module
+
+# Backends in order of preference
+JSON_BACKENDS = ('orjson', 'msgspec', 'json')
+
+_codec = {}
+
+
+def get_json_backend() -> str:
+    """Return the name of the JSON backend in use."""
+    if not _codec:
+        set_json_backend()
+    return _codec['name']
+
+
+def set_json_backend(name: str | None = None) -> None:
+    """Set the JSON backend used by pybliometrics.
+
+    :param name: One of `"orjson"`, `"msgspec"` and `"json"`.  If `None`,
+                 uses the first installed backend in that order.
+
+    :raises ValueError: If `name` is not one of the allowed values.
+    :raises ImportError: If the requested backend is not installed.
+    """
+    if name is None:
+        for candidate in JSON_BACKENDS:
+            try:
+                return set_json_backend(candidate)
+            except ImportError:
+                continue
+    if name not in JSON_BACKENDS:
+        raise ValueError(f"Parameter 'name' must be one of {', '.join(JSON_BACKENDS)}.")
+    if name == 'orjson':
+        orjson = import_module('orjson')
+        loads, dumps = orjson.loads, orjson.dumps
+    elif name == 'msgspec':
+        msgspec_json = import_module('msgspec.json')
+        loads, dumps = msgspec_json.decode, msgspec_json.encode
+    else:
+        loads = json.loads
+        def dumps(obj):
+            return json.dumps(obj, separators=(',', ':')).encode()
+    _codec.update(name=name, loads=loads, dumps=dumps)
+
+
+def json_loads(data: bytes | str):
+    """Deserialize JSON from bytes or str."""
+    if not _codec:
+        set_json_backend()
+    return _codec['loads'](data)
+
+
+def json_dumps(obj) -> bytes:
+    """Serialize an object to compact JSON encoded as UTF-8 bytes."""
+    if not _codec:
+        set_json_backend()
+    return _codec['dumps'](obj)
@@ -0,0 +1,230 @@
+"""Aggregation of events into metrics in Prometheus text format."""
+import os
+from pathlib import Path
+from threading import Lock, Thread
+
+from pybliometrics.utils.events import subscribe, unsubscribe, CacheLookup, \
+    CacheRead, CacheWrite, RequestEnd
+
+# Upper bounds of the buckets of latency histograms, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+# Upper bounds of the buckets of cache read and write histograms, in seconds
+CACHE_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1)
+
+
+class MetricsRegistry:
+    """Counters, gauges and histograms aggregated from the events emitted
+    by requests and cache accesses (see `subscribe()`), once enabled.
+
+    All metrics have the prefix `pybliometrics_` and labels `api` plus,
+    where applicable, `status`, `view`, `result` or `key_id`.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._metrics = {}
+        self._enabled = False
+
+    def __repr__(self) -> str:
+        state = "enabled" if self._enabled else "disabled"
+        return f"MetricsRegistry({state}, {len(self._metrics)} metrics)"
+
+    def enable(self) -> "MetricsRegistry":
+        """Start aggregating events.  Returns the registry."""
+        if not self._enabled:
+            subscribe(self._observe, RequestEnd, CacheLookup, CacheRead, CacheWrite)
+            self._enabled = True
+        return self
+
+    def disable(self) -> None:
+        """Stop aggregating events.  Aggregated values are kept."""
+        unsubscribe(self._observe)
+        self._enabled = False
+
+    def reset(self) -> None:
+        """Drop all aggregated values."""
+        with self._lock:
+            self._metrics.clear()
+
+    def get(self, name: str, **labels: str) -> float | None:
+        """Return the value of a counter or gauge, or the number of
+        observations of a histogram, for the given labels.
+
+        :param name: The name of the metric without prefix `pybliometrics_`.
+        :param labels: The values of all labels of the metric.
+        """
+        with self._lock:
+            try:
+                _, kind, values = self._metrics[name]
+                value = values[tuple(sorted(labels.items()))]
+            except KeyError:
+                return None
+        return value[-1] if kind == 'histogram' else value
+
+    def cache_hit_ratio(self, api: str, view: str | None = None) -> float | None:
+        """Return the share of cache lookups of `api` (and `view`) that used
+        the cached file, or None without lookups.
+        """
+        counts = {}
+        with self._lock:
+            values = self._metrics.get('cache_lookups_total', (None, None, {}))[2]
+            for labels, value in values.items():
+                labels = dict(labels)
+                if labels['api'] == api and (view is None or labels['view'] == str(view)):
+                    counts[labels['result']] = counts.get(labels['result'], 0) + value
+        total = sum(counts.values())
+        return counts.get('hit', 0) / total if total else None
+
+    def to_prometheus(self) -> str:
+        """Return all metrics in the Prometheus text exposition format."""
+        lines = []
+        with self._lock:
+            for name, (doc, kind, values) in sorted(self._metrics.items()):
+                name = 'pybliometrics_' + name
+                lines.append(f"# HELP {name} {doc}")
+                lines.append(f"# TYPE {name} {kind}")
+                for labels, value in sorted(values.items()):
+                    if kind == 'histogram':
+                        lines.extend(_histogram_lines(name, labels, value))
+                    else:
+                        lines.append(f"{name}{_labels(labels)} {_number(value)}")
+        return "".join(line + "\n" for line in lines)
+
+    def write_prometheus(self, path: str | Path) -> None:
+        """Write all metrics in the Prometheus text exposition format to
+        a file, e.g. for the textfile collector of the node exporter.  The
+        file is replaced atomically.
+        """
+        path = Path(path)
+        temp = path.with_name(path.name + '.part')
+        temp.write_text(self.to_prometheus(), encoding='utf8')
+        os.replace(temp, path)
+
+    def serve_prometheus(self, port: int = 9464, host: str = '127.0.0.1'):
+        """Serve all metrics in the Prometheus text exposition format over
+        HTTP in a background thread.
+
+        :param port: The port to listen on.  Use 0 for any free port.
+        :param host: The address to listen on.
+
+        :returns: The server, whose `server_port` attribute is the port and
+                  whose `shutdown()` method stops serving.
+        """
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = registry.to_prometheus().encode('utf8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+    def _observe(self, event) -> None:
+        """Update the metrics affected by one event."""
+        with self._lock:
+            if isinstance(event, RequestEnd):
+                api = {'api': event.api}
+                self._add('requests_total', "Requests by API and final status.",
+                          status=str(event.status), **api)
+                self._observe_histogram('request_latency_seconds',
+                                        "Latency of requests.", LATENCY_BUCKETS,
+                                        event.latency, **api)
+                self._add('retries_total', "Repeated requests.", event.retries, **api)
+                self._add('rate_limited_total', "Responses with status 429.",
+                          event.rate_limited, **api)
+                self._add('throttle_wait_seconds_total',
+                          "Time waited for the rate limit.", event.throttle_wait, **api)
+                self._add('downloaded_bytes_total', "Size of response bodies.",
+                          event.bytes or 0, **api)
+                if event.quota_remaining is not None:
+                    self._set('quota_remaining',
+                              "Remaining requests of an API key as of the last response.",
+                              float(event.quota_remaining), key_id=event.key_id, **api)
+            elif isinstance(event, CacheLookup):
+                self._add('cache_lookups_total',
+                          "Lookups of cached files by result (hit, miss, stale).",
+                          api=event.api, view=str(event.view), result=event.result)
+            elif isinstance(event, CacheRead):
+                self._observe_histogram('cache_read_seconds',
+                                        "Time spent reading and decoding cache files.",
+                                        CACHE_BUCKETS, event.duration,
+                                        api=event.api, view=str(event.view))
+            elif isinstance(event, CacheWrite):
+                labels = {'api': event.api, 'view': str(event.view)}
+                self._add('cache_written_bytes_total', "Size of written cache files.",
+                          event.bytes, **labels)
+                self._observe_histogram('cache_write_seconds',
+                                        "Time spent writing cache files.",
+                                        CACHE_BUCKETS, event.duration, **labels)
+
+    def _values(self, name, doc, kind):
+        """Auxiliary function to get the values of a metric by labels."""
+        return self._metrics.setdefault(name, (doc, kind, {}))[2]
+
+    def _add(self, name, doc, amount=1, **labels):
+        """Auxiliary function to increase a counter."""
+        values = self._values(name, doc, 'counter')
+        key = tuple(sorted(labels.items()))
+        values[key] = values.get(key, 0) + amount
+
+    def _set(self, name, doc, value, **labels):
+        """Auxiliary function to set a gauge."""
+        self._values(name, doc, 'gauge')[tuple(sorted(labels.items()))] = value
+
+    def _observe_histogram(self, name, doc, buckets, value, **labels):
+        """Auxiliary function to record a value in a histogram, stored as
+        list of the buckets' upper bounds and cumulative counts, the sum
+        and the count.
+        """
+        values = self._values(name, doc, 'histogram')
+        key = tuple(sorted(labels.items()))
+        if key not in values:
+            values[key] = [buckets, [0] * len(buckets), 0.0, 0]
+        hist = values[key]
+        for i, bound in enumerate(buckets):
+            if value <= bound:
+                hist[1][i] += 1
+        hist[2] += value
+        hist[3] += 1
+
+
+def _labels(labels, **extra) -> str:
+    """Auxiliary function to format labels."""
+    pairs = [*labels, *extra.items()]
+    if not pairs:
+        return ""
+    escaped = (f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + ",".join(escaped) + "}"
+
+
+def _escape(value) -> str:
+    """Auxiliary function to escape a label value."""
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _number(value) -> str:
+    """Auxiliary function to format a value."""
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _histogram_lines(name, labels, value) -> list[str]:
+    """Auxiliary function to format the buckets, sum and count of a
+    histogram.
+    """
+    buckets, counts, total, count = value
+    lines = [f"{name}_bucket{_labels(labels, le=str(b))} {n}"
+             for b, n in zip(buckets, counts)]
+    lines.append(f"{name}_bucket{_labels(labels, le='+Inf')} {count}")
+    lines.append(f"{name}_sum{_labels(labels)} {_number(total)}")
+    lines.append(f"{name}_count{_labels(labels)} {count}")
+    return lines
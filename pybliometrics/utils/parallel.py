@@ -0,0 +1,64 @@
+"""Helper to run many API requests concurrently."""
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from typing import Callable, Iterable, Iterator
+
+
+def run_in_threads(func: Callable, items: Iterable,
+                   workers: int = 4) -> Iterator[tuple]:
+    """Call `func(item)` for all items in a pool of threads.
+
+    Yields tuples `(item, result, error)` in the order in which the calls
+    complete, where `error` is the exception raised by the call (and
+    `result` then is None).  At most `2 * workers` calls are pending at
+    any time, so `items` may be a long or lazy iterable.  Calls run in a
+    copy of the caller's context, so that e.g. tracing spans nest.
+
+    :param func: The function to call with each item.
+    :param items: The items to call `func` with.
+    :param workers: The number of threads.
+
+    :raises ValueError: If `workers` is smaller than 1.
+    """
+    if workers < 1:
+        raise ValueError("Parameter 'workers' must be at least 1.")
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        while True:
+            for item in items:
+                pending[executor.submit(copy_context().run, func, item)] = item
+                if len(pending) >= 2 * workers:
+                    break
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                result = None if error else future.result()
+                yield item, result, error
+
+
+def map_in_threads(func: Callable, items: Iterable, workers: int = 4) -> list:
+    """Call `func(item)` for all items in a pool of threads and return
+    the results in the order of `items`.
+
+    :param func: The function to call with each item.
+    :param items: The items to call `func` with.
+    :param workers: The number of threads.
+
+    :raises Exception: The first exception raised by a call, once all
+                       calls are finished.
+    """
+    items = list(items)
+    results = [None] * len(items)
+    errors = []
+    indexed = run_in_threads(lambda i: func(items[i]), range(len(items)), workers)
+    for i, result, error in indexed:
+        if error:
+            errors.append(error)
+        results[i] = result
+    if errors:
+        raise errors[0]
+    return results
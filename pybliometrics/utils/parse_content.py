@@ -55,9 +55,16 @@ def check_integrity(tuples, fields, action):
     """Check integrity of specific fields in a list of tuples and perfom
     provided action.
     """
+    columns = {field: [getattr(e, field) for e in tuples] for field in fields}
+    check_column_integrity(columns, fields, action)
+
+
+def check_column_integrity(columns, fields, action):
+    """Check integrity of specific fields in a dictionary of columns and
+    perfom provided action.
+    """
     for field in fields:
-        elements = [getattr(e, field) for e in tuples]
-        if None not in elements:
+        if None not in columns[field]:
             continue
         msg = "Parsed information doesn't pass integrity check because of "\
               f"incomplete information in field '{field}'"
@@ -77,12 +84,41 @@ def check_field_consistency(needles, haystack):
 
 
 def deduplicate(lst):
-    """Auxiliary function to deduplicate a list while preserving its order."""
-    new = reduce(lambda x, y: x + y if y[0] not in x else x,
-                 map(lambda x: [x], lst),
-                 [])
+    """Auxiliary function to deduplicate a list while preserving its order.
+
+    Elements are compared by equality in linear time: Dictionaries and
+    lists (e.g. author information) are compared via hashable
+    representations, and other unhashable elements via a linear search.
+    """
+    seen = set()
+    unhashable = []
+    new = []
+    for item in lst:
+        try:
+            key = _hashable(item)
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            if item in unhashable:
+                continue
+            unhashable.append(item)
+        new.append(item)
     return new
 
+
+def _hashable(obj):
+    """Auxiliary function to create a hashable representation of an
+    object that compares equal if and only if the objects compare equal.
+    """
+    if isinstance(obj, dict):
+        return (dict, frozenset((k, _hashable(v)) for k, v in obj.items()))
+    if isinstance(obj, list):
+        return (list, tuple(_hashable(v) for v in obj))
+    hash(obj)
+    return obj
+
+
 def get_and_aggregate_subjects(fields):
     """Get and aggregate subject areas from Scopus AuthorSearch."""
     frequencies = {}
@@ -1,4 +1,5 @@
 """Utility functions to parse and extract metrics data from JSON responses."""
+from hashlib import md5
 from typing import NamedTuple
 
 from pybliometrics.utils import make_int_if_possible
@@ -14,6 +15,79 @@ class MetricData(NamedTuple):
     threshold: int | None = None
 
 
+def split_values(values: str | int | list | None) -> list[str]:
+    """Auxiliary function to turn a list or a comma-separated string of
+    values into a list of strings.
+    """
+    if values is None:
+        return []
+    if isinstance(values, (list, tuple)):
+        return [str(v).strip() for v in values]
+    return [v.strip() for v in str(values).split(",") if v.strip()]
+
+
+def make_chunks(values: list, size: int | None) -> list[list]:
+    """Auxiliary function to split a list into chunks of at most `size`
+    elements (one chunk if `size` is None).
+    """
+    if not size or len(values) <= size:
+        return [values]
+    return [values[i:i+size] for i in range(0, len(values), size)]
+
+
+def make_stable_chunks(values: list, size: int) -> list[list]:
+    """Auxiliary function to split a list into chunks of at most `size`
+    elements, about half as many on average, whose boundaries depend on
+    the values themselves: a chunk ends after each value whose hash marks
+    a boundary, or when it is full.  Thus adding or removing a value
+    changes its own chunk only (mostly), and overlapping lists share
+    most chunks, e.g. to reuse cached requests.
+    """
+    if len(values) <= size:
+        return [values]
+    expected = max(1, size // 2)
+    chunks, chunk = [], []
+    for value in values:
+        chunk.append(value)
+        digest = md5(str(value).encode('utf8')).hexdigest()
+        if len(chunk) == size or int(digest, 16) % expected == 0:
+            chunks.append(chunk)
+            chunk = []
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def merge_metric_results(parts: list[dict], entity_type: str) -> dict:
+    """Merge the JSON responses of several requests to a SciVal metrics
+    API.  Entities appear in order of their first occurrence; metrics
+    of the same entity from different responses are concatenated.
+
+    Parameters
+    ----------
+    parts : list of dict
+        The JSON responses
+    entity_type : str
+        The type of entity ("author", "institution", or "topic")
+
+    Returns
+    -------
+    dict
+        A JSON response with all results
+    """
+    merged = {}
+    for part in parts:
+        for result in part.get('results', []):
+            entity_id = result.get(entity_type, {}).get('id')
+            try:
+                metrics = merged[entity_id]['metrics']
+            except KeyError:
+                merged[entity_id] = {**result, 'metrics': list(result.get('metrics', []))}
+                continue
+            metrics.extend(result.get('metrics', []))
+    return {'results': list(merged.values())}
+
+
 def extract_metric_data(json_data, metric_type: str, by_year: bool, entity_type: str):
     """Helper function to extract metric data for a specific metric type.
     
@@ -0,0 +1,169 @@
+"""Query planner to split searches with too many results into parts."""
+from datetime import date, timedelta
+from math import ceil
+from time import localtime
+from typing import Callable
+
+from pybliometrics.exception import ScopusQueryError
+from pybliometrics.utils.constants import SEARCH_MAX_ENTRIES, SUBJECT_AREAS
+from pybliometrics.utils.parallel import map_in_threads
+
+# Earliest publication year to bisect; earlier years form one range
+FIRST_YEAR = 1900
+# Earliest load date to bisect; earlier dates form one range
+FIRST_LOAD_DATE = date(2000, 1, 1)
+# Placeholder for the part of a query outside all subject areas
+_OTHER_AREAS = 'other'
+
+
+def partition_query(query: str,
+                    count: Callable[[str], int],
+                    max_results: int = SEARCH_MAX_ENTRIES,
+                    workers: int = 4
+                    ) -> list[tuple[str, int]]:
+    """Split a Scopus query into parts with at most `max_results` results.
+
+    Parts whose size exceeds `max_results` are split in two halves of their
+    range of publication years (`PUBYEAR`), and parts covering one year only
+    are split by subject area (`SUBJAREA`), plus one part for documents
+    without any of these areas.  The sizes of all parts of one round are
+    probed concurrently.  Documents belonging to several subject areas
+    appear in several parts, so the results need to be de-duplicated.
+
+    :param query: The query to split.
+    :param count: A function returning the number of results of a query.
+    :param max_results: The maximum number of results per part.
+    :param workers: The number of concurrent calls of `count`.
+
+    :returns: A list of tuples `(query, size)` for all parts with results.
+              If the query needs no split, it is returned unchanged.
+
+    :raises ScopusQueryError: If the results of one year in one subject
+                              area still exceed `max_results`.
+    """
+    def split(part, part_query, size):
+        children = _split_years(part)
+        if children:
+            return children
+        if part[2] is None:
+            return [part[:2] + (a, None) for a in SUBJECT_AREAS + (_OTHER_AREAS,)]
+        text = f'Query "{part_query}" has {size:,} results and cannot be split '\
+               f'further, but at most {max_results:,} results are allowed.'
+        raise ScopusQueryError(text)
+
+    return _plan(query, count, max_results, workers, split)
+
+
+def shard_query(query: str,
+                count: Callable[[str], int],
+                shards: int,
+                workers: int = 4
+                ) -> list[tuple[str, int]]:
+    """Split a Scopus query into disjoint windows of similar size, e.g. to
+    crawl them concurrently with one cursor each.
+
+    Windows with more than `1/shards` of all results are split in two halves
+    of their range of publication years (`PUBYEAR`), and windows covering
+    one year only in two halves of their range of load dates (`LOAD-DATE`).
+    Windows of one day are not split further.  Hence there may be more
+    windows than `shards`, and windows may be larger than intended.
+
+    :param query: The query to split.
+    :param count: A function returning the number of results of a query.
+    :param shards: The number of windows to aim for.
+    :param workers: The number of concurrent calls of `count`.
+
+    :returns: A list of tuples `(query, size)` for all windows with results.
+              If the query needs no split, it is returned unchanged.
+    """
+    total = count(query)
+
+    def counted(part_query):
+        return total if part_query == query else count(part_query)
+
+    def split(part, part_query, size):
+        return _split_years(part) or _split_load_dates(part)
+
+    max_results = max(ceil(total / shards), 1)
+    return _plan(query, counted, max_results, workers, split)
+
+
+def _plan(query, count, max_results, workers, split):
+    """Auxiliary function to split parts of a query with `split()` until all
+    have at most `max_results` results or cannot be split any more.
+    Parts are tuples `(first year, last year, subject area, load dates)`.
+    """
+    parts = []
+    pending = [(None, None, None, None)]
+    while pending:
+        queries = [_make_query(query, *part) for part in pending]
+        sizes = map_in_threads(count, queries, workers)
+        splits = []
+        for part, part_query, size in zip(pending, queries, sizes):
+            children = split(part, part_query, size) if size > max_results else []
+            if children:
+                splits.extend(children)
+            elif size:
+                parts.append((part_query, size))
+        pending = splits
+    return parts
+
+
+def _make_query(query, first, last, area, loaded):
+    """Auxiliary function to restrict a query to a range of publication
+    years, a subject area and a range of load dates.  Open ranges are
+    denoted by None.
+    """
+    clauses = []
+    if first is not None and first == last:
+        clauses.append(f"PUBYEAR IS {first}")
+    else:
+        if first is not None:
+            clauses.append(f"PUBYEAR > {first - 1}")
+        if last is not None:
+            clauses.append(f"PUBYEAR < {last + 1}")
+    if loaded:
+        start, end = loaded
+        if start is not None:
+            clauses.append(f"LOAD-DATE AFT {start - timedelta(days=1):%Y%m%d}")
+        if end is not None:
+            clauses.append(f"LOAD-DATE BEF {end + timedelta(days=1):%Y%m%d}")
+    if area == _OTHER_AREAS:
+        # AND NOT has the lowest precedence and thus must come last
+        areas = " OR ".join(f"SUBJAREA({a})" for a in SUBJECT_AREAS)
+        clauses.append(f"NOT ({areas})")
+    elif area:
+        clauses.append(f"SUBJAREA({area})")
+    if not clauses:
+        return query
+    return " AND ".join([f"({query})"] + clauses)
+
+
+def _split_years(part):
+    """Auxiliary function to split a part in two ranges of years, unless
+    it covers one year only or is restricted otherwise already.
+    """
+    first, last, area, loaded = part
+    if area is not None or loaded is not None:
+        return []
+    lower = FIRST_YEAR if first is None else first
+    upper = localtime().tm_year + 1 if last is None else last
+    if lower >= upper:
+        return []
+    middle = (lower + upper) // 2
+    return [(first, middle, None, None), (middle + 1, last, None, None)]
+
+
+def _split_load_dates(part):
+    """Auxiliary function to split a part in two ranges of load dates,
+    unless it covers one day only.
+    """
+    first, last, area, loaded = part
+    start, end = loaded or (None, None)
+    lower = FIRST_LOAD_DATE if start is None else start
+    upper = date.today() + timedelta(days=1) if end is None else end
+    if lower >= upper:
+        return []
+    middle = lower + (upper - lower) // 2
+    return [(first, last, area, (start, middle)),
+            (first, last, area, (middle + timedelta(days=1), end))]
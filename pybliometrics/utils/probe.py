@@ -0,0 +1,88 @@
+"""Concurrent probing of the number of results of many search queries."""
+from hashlib import md5
+from itertools import count
+from pathlib import Path
+from time import time
+from typing import Iterable
+
+from pybliometrics.utils.checks import check_parameter_value
+from pybliometrics.utils.constants import URLS
+from pybliometrics.utils.get_content import get_content
+from pybliometrics.utils.json_codec import json_loads
+from pybliometrics.utils.parallel import map_in_threads
+from pybliometrics.utils.startup import get_config, get_credentials
+
+# Search APIs whose responses contain the number of results
+PROBE_APIS = ('AffiliationSearch', 'ArticleMetadata', 'AuthorSearch',
+              'ScienceDirectSearch', 'ScopusSearch')
+
+# Position in the rotation of API keys, shared by all calls
+_rotation = count()
+
+
+def probe_sizes(queries: Iterable[str],
+                api: str = 'ScopusSearch',
+                workers: int = 4,
+                refresh: bool | int = False,
+                **kwds: str
+                ) -> dict[str, int]:
+    """Return the number of results of many search queries, like
+    `get_results_size()` of the search classes with `download=False`.
+
+    Each query needs one request for one result only, and requests run
+    concurrently, rotating all configured API keys.  The rotation continues
+    across calls, so that concurrent calls with one query each (like those
+    of the query planners) use all keys as well.  The numbers are cached in
+    folder `sizes` of the cache directory of `api`, where the modification
+    date of each file tells the age of the number.
+
+    :param queries: The queries to probe.
+    :param api: The search API to query.  Allowed values: `AffiliationSearch`,
+                `ArticleMetadata`, `AuthorSearch`, `ScienceDirectSearch`,
+                `ScopusSearch`.
+    :param workers: The number of concurrent requests.
+    :param refresh: Whether to refresh cached numbers.  If int is passed,
+                    numbers older than that many days will be refreshed.
+    :param kwds: Keywords passed on as query parameters, e.g. `date`.
+
+    :returns: A dictionary mapping each query to its number of results.
+
+    :raises ValueError: If `api` is not one of the allowed values.
+    :raises Exception: The first error of a request, once all requests are
+                       finished.  Numbers obtained until then are cached.
+    """
+    check_parameter_value(api, PROBE_APIS, "api")
+    kwds.pop('count', None)
+    parent = Path(get_config().get('Directories', api), 'sizes')
+    url = URLS[api]
+    credentials = get_credentials()
+
+    def probe(args):
+        query, credential = args
+        params = {**kwds, 'query': query}
+        fname = parent / md5(str(sorted(params.items())).encode('utf8')).hexdigest()
+        if not _is_outdated(fname, refresh):
+            return int(fname.read_text())
+        resp = get_content(url, api, {**params, **credential, 'count': 1})
+        res = json_loads(resp.content).get('search-results', {})
+        size = int(res.get('opensearch:totalResults', 0) or 0)
+        parent.mkdir(parents=True, exist_ok=True)
+        fname.write_text(str(size))
+        return size
+
+    queries = list(dict.fromkeys(queries))
+    args = [(q, credentials[next(_rotation) % len(credentials)]) for q in queries]
+    return dict(zip(queries, map_in_threads(probe, args, workers)))
+
+
+def _is_outdated(fname: Path, refresh: bool | int) -> bool:
+    """Auxiliary function to check whether a cached file does not exist or
+    is older than allowed by `refresh`.
+    """
+    try:
+        mod_ts = fname.stat().st_mtime
+    except FileNotFoundError:
+        return True
+    if isinstance(refresh, bool):
+        return refresh
+    return int(refresh) < int((time() - mod_ts) / 86400) + 1
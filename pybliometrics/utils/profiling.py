@@ -0,0 +1,337 @@
+"""Opt-in profiling of the phases of downloading, caching and parsing."""
+import os
+import sys
+from contextvars import ContextVar
+from pathlib import Path
+from threading import Lock, local
+from time import perf_counter
+
+from pybliometrics.utils import json_codec
+from pybliometrics.utils.events import subscribe, unsubscribe, CacheRead, \
+    CacheWrite, RequestEnd
+
+# Phases reported per API, in order of the columns of the report
+PHASES = ('total', 'fetch', 'throttle', 'decode', 'cache read', 'cache write', 'parse')
+# Subpackages whose classes are profiled
+_PACKAGES = ('pybliometrics.scopus', 'pybliometrics.sciencedirect', 'pybliometrics.scival')
+
+# The API class whose code currently runs
+_current_api = ContextVar('pybliometrics_current_api', default=None)
+# The active profile, only one at a time, except that a profile may run
+# within the profile of the entire process
+_active = None
+_active_lock = Lock()
+# The profile of the entire process (see `_profile_from_environment()`)
+_environment_profile = None
+
+
+class Profile:
+    """Timings of the phases of creating and using objects, aggregated per
+    API class.  Use as context manager, see `profile()`.
+
+    Phases are: `total` (construction of objects), `fetch` (requests,
+    excluding waits for the rate limit), `throttle` (waits for the rate
+    limit), `decode` (JSON decoding of responses and cached files),
+    `cache read` (reading and decoding cached files), `cache write` and
+    `parse` (properties and the parsing of downloaded or cached content).
+    Phases overlap: `total` includes all others except parsing by
+    properties, and `cache read` includes decoding.
+    """
+
+    def __init__(self,
+                 cprofile: bool = False,
+                 tracemalloc: bool = False,
+                 dump_dir: str | Path | None = None
+                 ) -> None:
+        """Set up the profile.
+
+        :param cprofile: Whether to run objects' code under `cProfile`, one
+                         profiler per API class.  Requires `dump_dir`.
+        :param tracemalloc: Whether to trace memory allocations.  The report
+                            then shows the memory held by allocations made
+                            by the code of each API class.
+        :param dump_dir: Folder to write a `cProfile` dump `<API>.prof`
+                         and a `tracemalloc` snapshot `<API>.tracemalloc`
+                         per API class to, on exit.
+        """
+        if cprofile and dump_dir is None:
+            raise ValueError("Parameter 'cprofile' requires 'dump_dir'.")
+        self.phases = {}
+        """Dictionary mapping `(api, phase)` to lists `[calls, seconds, max]`."""
+        self.properties = {}
+        """Dictionary mapping `(api, property)` to lists `[calls, seconds, max]`."""
+        self.memory = {}
+        """Dictionary mapping API classes to bytes held (with `tracemalloc`)."""
+        self._cprofile = cprofile
+        self._tracemalloc = tracemalloc
+        self._dump_dir = Path(dump_dir) if dump_dir is not None else None
+        self._lock = Lock()
+        self._profilers = {}
+        self._profiler_lock = Lock()
+        self._depth = local()
+        self._patched = []
+        self._loads = None
+        self._started_tracemalloc = False
+        self._outer = None
+
+    def __enter__(self) -> "Profile":
+        global _active
+        with _active_lock:
+            if _active is not None and _active is not _environment_profile:
+                raise RuntimeError("Another profile is active already.")
+            self._outer = _active
+            _active = self
+        if self._tracemalloc:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(25)
+                self._started_tracemalloc = True
+        self._patch_classes()
+        if not json_codec._codec:
+            json_codec.set_json_backend()
+        self._loads = json_codec._codec['loads']
+        json_codec._codec['loads'] = self._timed_loads
+        subscribe(self._observe, RequestEnd, CacheRead, CacheWrite)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        global _active
+        unsubscribe(self._observe)
+        if json_codec._codec.get('loads') == self._timed_loads:
+            json_codec._codec['loads'] = self._loads
+        for cls, name, attribute in reversed(self._patched):
+            setattr(cls, name, attribute)
+        self._patched.clear()
+        if self._tracemalloc:
+            self._measure_memory()
+        if self._dump_dir is not None:
+            self._dump_dir.mkdir(parents=True, exist_ok=True)
+            for api, profiler in self._profilers.items():
+                profiler.dump_stats(self._dump_dir / f'{api}.prof')
+        with _active_lock:
+            _active = self._outer
+            self._outer = None
+
+    def report(self, top: int = 10) -> str:
+        """Return tables of the seconds spent per API class and phase, and
+        of the `top` properties taking the most time.
+        """
+        apis = sorted({api for api, _ in self.phases} | {api for api, _ in self.properties})
+        header = ['API', 'objects'] + [f'{p} s' for p in PHASES]
+        if self.memory:
+            header.append('MiB held')
+        rows = []
+        for api in apis:
+            row = [api, self.phases.get((api, 'total'), [0])[0]]
+            row += [self.phases.get((api, p), [0, 0.0])[1] for p in PHASES]
+            if self.memory:
+                row.append(self.memory.get(api, 0) / 2**20)
+            rows.append(row)
+        lines = _table(header, rows)
+        if self.properties:
+            ranked = sorted(self.properties.items(), key=lambda t: -t[1][1])[:top]
+            rows = [[f'{api}.{name}', calls, total, maximum * 1000]
+                    for (api, name), (calls, total, maximum) in ranked]
+            lines += [''] + _table(['property', 'calls', 'total s', 'max ms'], rows)
+        return "\n".join(lines)
+
+    def _record(self, stats, key, seconds) -> None:
+        """Auxiliary function to add one timing."""
+        with self._lock:
+            entry = stats.setdefault(key, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def _observe(self, event) -> None:
+        """Record the timings of one event."""
+        if isinstance(event, RequestEnd):
+            self._record(self.phases, (event.api, 'fetch'), event.latency)
+            if event.throttle_wait:
+                self._record(self.phases, (event.api, 'throttle'), event.throttle_wait)
+        elif isinstance(event, CacheRead):
+            self._record(self.phases, (event.api, 'cache read'), event.duration)
+        elif isinstance(event, CacheWrite):
+            self._record(self.phases, (event.api, 'cache write'), event.duration)
+
+    def _timed_loads(self, data):
+        """JSON decoder of the profile, timing the decoder it replaces."""
+        started = perf_counter()
+        try:
+            return self._loads(data)
+        finally:
+            api = _current_api.get() or 'other'
+            self._record(self.phases, (api, 'decode'), perf_counter() - started)
+
+    def _patch_classes(self) -> None:
+        """Replace the constructor of `Base`, and properties and method
+        `_process_json()` of all API classes, by timed versions.
+        """
+        from importlib import import_module
+        for package in _PACKAGES:
+            import_module(package)
+        from pybliometrics.superclasses import Base
+
+        init = Base.__init__
+        self._patched.append((Base, '__init__', init))
+        Base.__init__ = self._timed(init, 'total')
+        classes, seen = [Base], set()
+        while classes:
+            cls = classes.pop()
+            if cls in seen:
+                continue
+            seen.add(cls)
+            classes.extend(cls.__subclasses__())
+            for name, attribute in list(vars(cls).items()):
+                if isinstance(attribute, property) and attribute.fget is not None:
+                    timed = property(self._timed(attribute.fget, name), attribute.fset,
+                                     attribute.fdel, attribute.__doc__)
+                elif name == '_process_json' and callable(attribute):
+                    timed = self._timed(attribute, name)
+                else:
+                    continue
+                self._patched.append((cls, name, attribute))
+                setattr(cls, name, timed)
+
+    def _timed(self, func, name):
+        """Wrap a constructor, property getter or method of an API class to
+        record its time, and to run it under the class's `cProfile`.  Parsing
+        nested in parsing counts for phase `parse` once.
+        """
+        profile = self
+        parsing = name != 'total'
+
+        def timed(obj, *args, **kwds):
+            api = type(obj).__name__
+            depth = getattr(profile._depth, 'calls', 0)
+            parse_depth = getattr(profile._depth, 'parsing', 0)
+            token = _current_api.set(api)
+            profiler = profile._start_profiler(api) if depth == 0 else None
+            profile._depth.calls = depth + 1
+            profile._depth.parsing = parse_depth + parsing
+            started = perf_counter()
+            try:
+                return func(obj, *args, **kwds)
+            finally:
+                seconds = perf_counter() - started
+                profile._depth.calls = depth
+                profile._depth.parsing = parse_depth
+                if profiler is not None:
+                    profiler.disable()
+                    profile._profiler_lock.release()
+                _current_api.reset(token)
+                if name == 'total':
+                    profile._record(profile.phases, (api, 'total'), seconds)
+                else:
+                    profile._record(profile.properties, (api, name), seconds)
+                    if parse_depth == 0:
+                        profile._record(profile.phases, (api, 'parse'), seconds)
+
+        timed.__name__ = getattr(func, '__name__', name)
+        timed.__doc__ = func.__doc__
+        return timed
+
+    def _start_profiler(self, api):
+        """Enable the `cProfile` profiler of `api`, unless profiling is off
+        or another thread or profile is profiled (only one profiler may be
+        active).
+        """
+        if not self._cprofile or not self._profiler_lock.acquire(blocking=False):
+            return None
+        if sys.getprofile() is not None:  # Profiler of the enclosing profile
+            self._profiler_lock.release()
+            return None
+        from cProfile import Profile as CProfile
+        profiler = self._profilers.setdefault(api, CProfile())
+        try:
+            profiler.enable()
+        except ValueError:  # Another profiler is active
+            self._profiler_lock.release()
+            return None
+        return profiler
+
+    def _measure_memory(self) -> None:
+        """Sum up the memory held by allocations made by the code of each
+        API class, and write snapshots restricted to them.
+        """
+        import tracemalloc
+        snapshot = tracemalloc.take_snapshot()
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        apis = {api for api, _ in self.phases} | {api for api, _ in self.properties}
+        for api in apis:
+            fname = _module_file(api)
+            if fname is None:
+                continue
+            selected = snapshot.filter_traces([tracemalloc.Filter(True, fname, all_frames=True)])
+            self.memory[api] = sum(s.size for s in selected.statistics('filename'))
+            if self._dump_dir is not None:
+                self._dump_dir.mkdir(parents=True, exist_ok=True)
+                selected.dump(str(self._dump_dir / f'{api}.tracemalloc'))
+
+
+def profile(cprofile: bool = False,
+            tracemalloc: bool = False,
+            dump_dir: str | Path | None = None
+            ) -> Profile:
+    """Profile the phases of creating and using objects of all API classes
+    while in a `with` block, and return the profile.  Alternatively, set
+    environment variable `PYBLIOMETRICS_PROFILE` to `1` (or a folder for
+    the dumps) to profile the entire process and print the report to
+    stderr on exit.  Profiles in `with` blocks then run within the profile
+    of the process, and both record the block.
+
+    Example:
+        >>> with pybliometrics.profile() as prof:
+        ...     ab = AbstractRetrieval('2-s2.0-85068268027', view='FULL')
+        ...     refs = ab.references
+        >>> print(prof.report())
+
+    See `Profile()` for the parameters.
+    """
+    return Profile(cprofile=cprofile, tracemalloc=tracemalloc, dump_dir=dump_dir)
+
+
+def _profile_from_environment() -> None:
+    """Start a profile of the entire process if environment variable
+    `PYBLIOMETRICS_PROFILE` is set, and print its report on exit.
+    """
+    global _environment_profile
+    value = os.environ.get('PYBLIOMETRICS_PROFILE', '')
+    if value in ('', '0') or _active is not None:
+        return
+    dump_dir = None if value == '1' else value
+    prof = Profile(cprofile=dump_dir is not None, dump_dir=dump_dir)
+    _environment_profile = prof
+    prof.__enter__()
+
+    def finish():
+        global _environment_profile
+        prof.__exit__(None, None, None)
+        _environment_profile = None
+        print(prof.report(), file=sys.stderr)
+
+    from atexit import register
+    register(finish)
+
+
+def _module_file(api: str) -> str | None:
+    """Auxiliary function to find the file defining an API class."""
+    for package in _PACKAGES:
+        cls = getattr(sys.modules.get(package), api, None)
+        if cls is not None:
+            return getattr(sys.modules.get(cls.__module__), '__file__', None)
+    return None
+
+
+def _table(header: list, rows: list) -> list[str]:
+    """Auxiliary function to format a table with aligned columns."""
+    cells = [[f'{v:.3f}' if isinstance(v, float) else str(v) for v in row] for row in rows]
+    widths = [max([len(str(h)), *(len(r[i]) for r in cells)]) for i, h in enumerate(header)]
+    lines = ["  ".join(str(h).ljust(w) if i == 0 else str(h).rjust(w)
+                       for i, (h, w) in enumerate(zip(header, widths)))]
+    lines.append("  ".join("-" * w for w in widths))
+    for row in cells:
+        lines.append("  ".join(v.ljust(w) if i == 0 else v.rjust(w)
+                               for i, (v, w) in enumerate(zip(row, widths))))
+    return lines
@@ -0,0 +1,335 @@
+"""Compact, column-wise storage of search results."""
+from array import array
+from collections.abc import Iterable, Sequence
+from itertools import accumulate
+
+# Sentinel for missing values in integer columns
+_INT_NONE = -2**63
+
+
+class RecordStore(Sequence):
+    """Read-only sequence of records stored column-wise.
+
+    Integer fields are stored in arrays, fields with few distinct values
+    in tables of unique values plus arrays of codes, and all other
+    string fields as one UTF-8 encoded buffer plus an array of offsets.
+    Rows behave like the namedtuple they were built from (indexing,
+    attribute access, iteration, comparison), at a fraction of the memory,
+    but are no instances of `tuple`.
+    Stores can be pickled; rows are pickled as namedtuples.
+    """
+    __slots__ = ('_record_type', '_columns', '_length', '_row_type')
+
+    def __init__(self, record_type: type, columns: dict[str, list]) -> None:
+        """Build the store.
+
+        :param record_type: The namedtuple class whose fields are stored.
+        :param columns: A dictionary with one list of values per field of
+                        `record_type`, as returned by `results_table()`.
+        """
+        self._record_type = record_type
+        self._columns = [_make_column(columns[field]) for field in record_type._fields]
+        self._length = len(columns[record_type._fields[0]]) if record_type._fields else 0
+        self._row_type = _row_type(record_type)
+
+    @classmethod
+    def from_rows(cls, record_type: type, rows: Iterable[tuple],
+                  length: int) -> "RecordStore":
+        """Build the store from rows, e.g. from a generator parsing one
+        result at a time.  Values are encoded as they arrive, so that
+        neither the rows nor the columns are held as Python objects.
+
+        :param record_type: The namedtuple class whose fields are stored.
+        :param rows: Tuples of values ordered like the fields of `record_type`.
+        :param length: The (expected) number of rows, used to choose the
+                       column types early.  Use 0 if unknown.
+        """
+        builders = [_ColumnBuilder(length // 2 or None) for _ in record_type._fields]
+        count = 0
+        for row in rows:
+            for builder, value in zip(builders, row):
+                builder.append(value)
+            count += 1
+        store = cls.__new__(cls)
+        store._record_type = record_type
+        store._columns = [builder.build() for builder in builders]
+        store._length = count
+        store._row_type = _row_type(record_type)
+        return store
+
+    def __getstate__(self):
+        return self._record_type, self._columns, self._length
+
+    def __setstate__(self, state) -> None:
+        self._record_type, self._columns, self._length = state
+        self._row_type = _row_type(self._record_type)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("RecordStore index out of range")
+        return self._row_type(self, index)
+
+    def __iter__(self):
+        row_type = self._row_type
+        return (row_type(self, i) for i in range(self._length))
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"RecordStore({self._record_type.__name__}, {self._length:,} records)"
+
+    def column(self, field: str) -> list:
+        """Return all values of one field as list."""
+        column = self._columns[self._record_type._fields.index(field)]
+        return [column[i] for i in range(self._length)]
+
+    def nbytes(self) -> int:
+        """Approximate number of bytes used by the stored values."""
+        return sum(column.nbytes() for column in self._columns)
+
+    def to_records(self) -> list:
+        """Return the records as list of namedtuples."""
+        make = self._record_type._make
+        return [make(row) for row in self]
+
+
+class Record(Sequence):
+    """View on one row of a `RecordStore` that mimics a namedtuple."""
+    __slots__ = ('_store', '_index')
+    _fields = ()
+
+    def __init__(self, store: RecordStore, index: int) -> None:
+        self._store = store
+        self._index = index
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return tuple(self)[index]
+        return self._store._columns[index][self._index]
+
+    def __iter__(self):
+        idx = self._index
+        return (column[idx] for column in self._store._columns)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (tuple, Record)):
+            return tuple(self) == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(tuple(self))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{f}={v!r}" for f, v in zip(self._fields, self))
+        return f"{self._store._record_type.__name__}({values})"
+
+    def __reduce__(self):
+        return self._store._record_type._make, (tuple(self),)
+
+    def _asdict(self) -> dict:
+        return dict(zip(self._fields, self))
+
+    def _replace(self, **kwds):
+        return self._store._record_type._make(self)._replace(**kwds)
+
+
+class _IntColumn:
+    """Integers (or None) stored in a 64-bit array."""
+    __slots__ = ('_values',)
+
+    def __init__(self, values: array) -> None:
+        self._values = values
+
+    @classmethod
+    def from_values(cls, values: list) -> "_IntColumn":
+        return cls(array('q', [_INT_NONE if v is None else v for v in values]))
+
+    def __getitem__(self, index: int):
+        value = self._values[index]
+        return None if value == _INT_NONE else value
+
+    def nbytes(self) -> int:
+        return self._values.itemsize * len(self._values)
+
+
+class _DictColumn:
+    """Hashable values stored once, referenced by integer codes."""
+    __slots__ = ('_table', '_codes')
+
+    def __init__(self, codes, table: dict) -> None:
+        """Store values by their codes in `table`, a dictionary mapping
+        pairs of type and value to codes (so that e.g. `1` and `True`
+        remain distinct).
+        """
+        self._table = [value for _, value in table]
+        typecode = 'B' if len(table) < 2**8 else 'H' if len(table) < 2**16 else 'L'
+        self._codes = array(typecode, codes)
+
+    def __getitem__(self, index: int):
+        return self._table[self._codes[index]]
+
+    def nbytes(self) -> int:
+        strings = sum(len(v) for v in self._table if isinstance(v, str))
+        return self._codes.itemsize * len(self._codes) + strings
+
+
+class _StringColumn:
+    """Strings (or None) stored in one UTF-8 encoded buffer."""
+    __slots__ = ('_buffer', '_offsets', '_missing')
+
+    def __init__(self, buffer: bytes | bytearray, offsets: array,
+                 missing: bytearray | None) -> None:
+        self._buffer = buffer
+        self._offsets = offsets
+        self._missing = missing if missing and any(missing) else None
+
+    @classmethod
+    def from_values(cls, values: list) -> "_StringColumn":
+        encoded = [b'' if v is None else v.encode('utf-8') for v in values]
+        offsets = array('Q', accumulate((len(b) for b in encoded), initial=0))
+        missing = bytearray(v is None for v in values) if None in values else None
+        return cls(b''.join(encoded), offsets, missing)
+
+    def __getitem__(self, index: int):
+        if self._missing and self._missing[index]:
+            return None
+        start, end = self._offsets[index], self._offsets[index + 1]
+        return self._buffer[start:end].decode('utf-8')
+
+    def nbytes(self) -> int:
+        missing = len(self._missing) if self._missing else 0
+        return len(self._buffer) + self._offsets.itemsize * len(self._offsets) + missing
+
+
+def _make_column(values: list):
+    """Auxiliary function to choose the most compact column type."""
+    if any(v is not None for v in values) and all(_fits_int(v) for v in values):
+        return _IntColumn.from_values(values)
+    table = {}
+    codes = [table.setdefault((type(v), v), len(table)) for v in values]
+    if len(table) <= len(values) // 2 or \
+            not all(v is None or isinstance(v, str) for _, v in table):
+        return _DictColumn(codes, table)
+    return _StringColumn.from_values(values)
+
+
+def _fits_int(value) -> bool:
+    """Auxiliary function to check whether a value fits an `_IntColumn`."""
+    return value is None or (type(value) is int and abs(value) < 2**63)
+
+
+class _ColumnBuilder:
+    """Values of one column collected one at a time, choosing the column
+    type like `_make_column()`.  The values are held in one representation
+    at a time, integers, table of unique values or string buffer, which
+    is converted when a value does not fit.
+    """
+    __slots__ = ('_max_distinct', '_count', '_any', '_strings_only', '_ints',
+                 '_table', '_codes', '_buffer', '_offsets', '_missing')
+
+    def __init__(self, max_distinct: int | None) -> None:
+        self._max_distinct = max_distinct
+        self._count = 0
+        self._any = False  # Whether any value is not None
+        self._strings_only = True  # Whether all values are strings or None
+        self._ints = array('q')
+        self._table = self._codes = None
+        self._buffer = self._offsets = self._missing = None
+
+    def append(self, value) -> None:
+        self._count += 1
+        if value is not None:
+            self._any = True
+            self._strings_only = self._strings_only and isinstance(value, str)
+        if self._ints is not None:
+            if _fits_int(value):
+                self._ints.append(_INT_NONE if value is None else value)
+                return
+            self._to_table()
+        elif self._buffer is not None:
+            if self._strings_only:
+                self._add_string(value)
+                return
+            self._to_table()
+        self._add_code(value)
+        # Mostly unique strings go into a buffer, like in `_make_column()`;
+        # decide on a sample to drop the table early
+        distinct = len(self._table)
+        too_many = self._max_distinct is not None and distinct > self._max_distinct
+        if self._strings_only and (too_many or
+                                   (self._count >= 1000 and distinct > self._count // 2)):
+            self._to_buffer()
+
+    def build(self):
+        if self._ints is not None:
+            if self._any:
+                return _IntColumn(self._ints)
+            self._to_table()
+        if self._table is not None and self._strings_only and \
+                len(self._table) > self._count // 2:
+            self._to_buffer()
+        if self._table is not None:
+            return _DictColumn(self._codes, self._table)
+        return _StringColumn(self._buffer, self._offsets, self._missing)
+
+    def _add_code(self, value) -> None:
+        self._codes.append(self._table.setdefault((type(value), value), len(self._table)))
+
+    def _add_string(self, value) -> None:
+        if value is not None:
+            self._buffer += value.encode('utf-8')
+        self._offsets.append(len(self._buffer))
+        self._missing.append(value is None)
+
+    def _values(self):
+        """Iterator over the values collected so far."""
+        if self._ints is not None:
+            ints = self._ints
+            return (None if v == _INT_NONE else v for v in ints)
+        if self._buffer is not None:
+            strings = _StringColumn(self._buffer, self._offsets, self._missing)
+            return (strings[i] for i in range(len(self._offsets) - 1))
+        table = list(self._table)
+        return (table[code][1] for code in self._codes)
+
+    def _to_table(self) -> None:
+        values = self._values()
+        self._table, self._codes = {}, array('I')
+        for value in values:
+            self._add_code(value)
+        self._ints = self._buffer = self._offsets = self._missing = None
+
+    def _to_buffer(self) -> None:
+        values = self._values()
+        self._buffer, self._offsets, self._missing = bytearray(), array('Q', [0]), bytearray()
+        for value in values:
+            self._add_string(value)
+        self._table = self._codes = None
+
+
+_ROW_TYPES = {}
+
+
+def _row_type(record_type: type) -> type:
+    """Auxiliary function to create (once) a subclass of `Record` with one
+    property per field of `record_type`.
+    """
+    try:
+        return _ROW_TYPES[record_type]
+    except KeyError:
+        pass
+    namespace = {'__slots__': (), '_fields': record_type._fields}
+    for pos, field in enumerate(record_type._fields):
+        namespace[field] = property(
+            lambda self, pos=pos: self._store._columns[pos][self._index])
+    new = type(f'{record_type.__name__}Record', (Record,), namespace)
+    _ROW_TYPES[record_type] = new
+    return new
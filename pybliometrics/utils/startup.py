@@ -1,22 +1,56 @@
+import os
 import warnings
 from configparser import ConfigParser, NoOptionError, NoSectionError
-from collections import deque
 from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple
 
-from pybliometrics.utils.constants import CONFIG_FILE, RATELIMITS, DEFAULT_PATHS, VIEWS
+from pybliometrics.utils.constants import CACHE_PATH, CONFIG_FILE, DEFAULT_PATHS, VIEWS
 from pybliometrics.utils.create_config import create_config
 
 CONFIG = None
 CUSTOM_KEYS = None
 CUSTOM_INSTTOKENS = None
+REQUEST_CONTEXT = None
+LAZY_PARSING = False
 
-_throttling_params = {k: deque(maxlen=v) for k, v in RATELIMITS.items()}
+# Timestamps of recent requests and their locks per API and API key
+_throttling_params = {}
+_throttling_locks = {}
+# Whether init() checked environment variable PYBLIOMETRICS_PROFILE already
+_profile_checked = False
+
+# Environment variables read by init(from_env=True) and the config options they set
+ENV_VARIABLES = {
+    'PYBLIOMETRICS_APIKEY': ('Authentication', 'APIKey'),
+    'PYBLIOMETRICS_INSTTOKEN': ('Authentication', 'InstToken'),
+    'PYBLIOMETRICS_HTTP_PROXY': ('Proxy', 'http'),
+    'PYBLIOMETRICS_HTTPS_PROXY': ('Proxy', 'https'),
+    'PYBLIOMETRICS_TIMEOUT': ('Requests', 'Timeout'),
+    'PYBLIOMETRICS_RETRIES': ('Requests', 'Retries'),
+}
+# Environment variable that replaces the root of all default cache paths
+ENV_CACHE_DIR = 'PYBLIOMETRICS_CACHE_DIR'
+
+
+class RequestContext(NamedTuple):
+    """Immutable request parameters derived from the configuration."""
+    keys: tuple[str, ...]
+    """API keys without InstToken."""
+    insttokens: tuple[tuple[str, str], ...]
+    """Pairs of API key and corresponding InstToken."""
+    proxies: MappingProxyType
+    timeout: int
+    retries: int
 
 
 def init(config_path: str | Path | None = None,
          keys: list[str] | None = None,
          inst_tokens: list[str] | None = None,
-         config_dir: str | Path | None = None) -> None:
+         config_dir: str | Path | None = None,
+         config: dict | None = None,
+         from_env: bool = False,
+         lazy: bool = False) -> None:
     """
     Function to initialize the pybliometrics library. For more information refer to the
     `official documentation <https://pybliometrics.readthedocs.io/en/stable/configuration.html>`_.
@@ -27,6 +61,22 @@ def init(config_path: str | Path | None = None,
     :param inst_tokens: List of corresponding InstTokens. The order must match that
                         of `keys` to avoid errors.
     :param config_dir: (Deprecated) Path to the configuration file. Use `config_path` instead.
+    :param config: Configuration as dictionary of sections, e.g.
+                   `{'Authentication': {'APIKey': 'key1, key2'}}`.  If given,
+                   or if `from_env` is True, pybliometrics neither reads nor
+                   writes a configuration file, and creates cache folders only
+                   when it first writes to them.  Missing directories and
+                   request parameters take their default values.
+    :param from_env: Whether to read the configuration from environment
+                     variables (see `ENV_VARIABLES` and `ENV_CACHE_DIR`)
+                     instead of a file.  Values from the environment take
+                     precedence over those in `config`.
+    :param lazy: Whether objects read from the cache should decode the
+                 cached file only when a parsed attribute is first
+                 accessed.  Search classes still read the file during
+                 construction to count the results.  Errors in the cached
+                 data then surface at that access instead of during
+                 construction.
 
     :raises NoSectionError: If the required sections (Directories, Authentication, Request)
                             do not exist.
@@ -35,6 +85,9 @@ def init(config_path: str | Path | None = None,
     global CONFIG
     global CUSTOM_KEYS
     global CUSTOM_INSTTOKENS
+    global REQUEST_CONTEXT
+    global LAZY_PARSING
+    global _profile_checked
 
     # Deprecation inserted in 4.2
     if config_dir is not None:
@@ -44,24 +97,36 @@ def init(config_path: str | Path | None = None,
         if config_path is None:
             config_path = config_dir
 
-    if not config_path:
-        config_path = CONFIG_FILE
-    config_path = Path(config_path)
-
-    if not config_path.exists():
-        CONFIG = create_config(config_path, keys, inst_tokens)
+    if config is not None or from_env:
+        CONFIG = make_config(config, from_env)
+        check_sections(CONFIG)
     else:
-        CONFIG = ConfigParser()
-        CONFIG.optionxform = str
-        CONFIG.read(config_path)
+        if not config_path:
+            config_path = CONFIG_FILE
+        config_path = Path(config_path)
+
+        if not config_path.exists():
+            CONFIG = create_config(config_path, keys, inst_tokens)
+        else:
+            CONFIG = ConfigParser()
+            CONFIG.optionxform = str
+            CONFIG.read(config_path)
 
-    check_sections(CONFIG)
-    check_default_paths(CONFIG, config_path)
-    create_cache_folders(CONFIG)
+        check_sections(CONFIG)
+        check_default_paths(CONFIG, config_path)
+        create_cache_folders(CONFIG)
 
     CUSTOM_KEYS = keys
     CUSTOM_INSTTOKENS = inst_tokens
     check_keys_tokens()
+    REQUEST_CONTEXT = make_request_context()
+    LAZY_PARSING = lazy
+
+    # Profile the entire process if requested via PYBLIOMETRICS_PROFILE
+    if not _profile_checked:
+        _profile_checked = True
+        from pybliometrics.utils.profiling import _profile_from_environment
+        _profile_from_environment()
 
 
 def check_sections(config: ConfigParser) -> None:
@@ -75,11 +140,14 @@ def check_default_paths(config: ConfigParser, config_path: Path) -> None:
     """Auxiliary function to check if default cache paths exist.
     If not, the paths are writen in the config.
     """
+    missing = False
     for api, path in DEFAULT_PATHS.items():
         if not config.has_option('Directories', api):
             config.set('Directories', api, str(path))
-            with open(config_path, 'w', encoding='utf-8') as ouf:
-                config.write(ouf)
+            missing = True
+    if missing:
+        with open(config_path, 'w', encoding='utf-8') as ouf:
+            config.write(ouf)
 
 
 def check_keys_tokens() -> None:
@@ -119,6 +187,37 @@ def create_cache_folders(config: ConfigParser) -> None:
             view_path.mkdir(parents=True, exist_ok=True)
 
 
+def make_config(config: dict | None = None, from_env: bool = False) -> ConfigParser:
+    """Auxiliary function to build the config parser in memory from a
+    dictionary and/or environment variables, filled up with default values.
+    """
+    cache_root = os.environ.get(ENV_CACHE_DIR) if from_env else None
+    parser = ConfigParser()
+    parser.optionxform = str
+    parser.read_dict({
+        'Directories': {api: str(Path(cache_root, path.relative_to(CACHE_PATH))
+                                 if cache_root else path)
+                        for api, path in DEFAULT_PATHS.items()},
+        'Authentication': {},
+        'Requests': {'Timeout': '20', 'Retries': '5'}
+    })
+    for section, options in (config or {}).items():
+        if not parser.has_section(section):
+            parser.add_section(section)
+        for option, value in options.items():
+            if isinstance(value, (list, tuple)):
+                value = ", ".join(value)
+            parser.set(section, option, str(value))
+    if from_env:
+        for variable, (section, option) in ENV_VARIABLES.items():
+            if variable not in os.environ:
+                continue
+            if not parser.has_section(section):
+                parser.add_section(section)
+            parser.set(section, option, os.environ[variable])
+    return parser
+
+
 def get_config() -> ConfigParser:
     """Function to get the config parser."""
     if not CONFIG:
@@ -129,6 +228,47 @@ def get_config() -> ConfigParser:
     return CONFIG
 
 
+def make_request_context() -> RequestContext:
+    """Auxiliary function to derive the request parameters from the
+    configuration and the custom keys and InstTokens.
+    """
+    config = get_config()
+    keys = get_keys()
+    insttokens = tuple(zip(keys, get_insttokens()))
+    proxies = dict(config.items('Proxy', raw=True)) if config.has_section('Proxy') else {}
+    return RequestContext(keys=tuple(keys[len(insttokens):]),
+                          insttokens=insttokens,
+                          proxies=MappingProxyType(proxies),
+                          timeout=config.getint('Requests', 'Timeout', fallback=20),
+                          retries=config.getint('Requests', 'Retries', fallback=5))
+
+
+def get_lazy_parsing() -> bool:
+    """Function to get whether cached files are parsed lazily (see `init()`)."""
+    return LAZY_PARSING
+
+
+def get_request_context() -> RequestContext:
+    """Function to get the request parameters built in `init()`."""
+    if REQUEST_CONTEXT is None:
+        get_config()  # Raises informative error if not initialized
+    return REQUEST_CONTEXT
+
+
+def get_credentials() -> list[dict[str, str]]:
+    """Function to get one set of request parameters per API key (with its
+    InstToken, if any), to rotate keys among concurrent requests.  Returns
+    one empty set if there is only one key.
+    """
+    context = get_request_context()
+    credentials = [{'apikey': key, 'insttoken': token}
+                   for key, token in context.insttokens]
+    credentials += [{'apikey': key} for key in context.keys]
+    if len(credentials) < 2:
+        credentials = [{}]
+    return credentials
+
+
 def get_insttokens() -> list[tuple[str, str]]:
     """Function to get the InstToken and overwrite InstToken in config if needed."""
     inst_tokens = []
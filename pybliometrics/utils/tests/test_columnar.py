@@ -0,0 +1,26 @@
+"""Tests for the columnar module."""
+import pytest
+
+from pybliometrics.utils import make_arrow_schema, make_arrow_table, \
+    read_parquet_dataset, write_parquet_dataset
+
+TYPES = {'coverDate': 'date'}
+
+
+def _table(*dates):
+    columns = {'eid': [f'2-s2.0-{i}' for i in range(len(dates))],
+               'coverDate': list(dates)}
+    return make_arrow_table(columns, TYPES)
+
+
+def test_write_parquet_dataset_replaces_query(tmp_path):
+    pytest.importorskip("pyarrow")
+    schema = make_arrow_schema(['eid', 'coverDate'], TYPES)
+    write_parquet_dataset(_table('2019-05-01', '2020-01-01'), tmp_path, 'a')
+    write_parquet_dataset(_table('2018-01-01'), tmp_path, 'b')
+    # Rewriting with fewer years drops the partitions of the other years
+    write_parquet_dataset(_table('2020-02-01'), tmp_path, 'a')
+    received = read_parquet_dataset(tmp_path, schema).to_pydict()
+    assert sorted(zip(received['query_hash'], received['year'])) == \
+        [('a', 2020), ('b', 2018)]
+    assert not (tmp_path / 'query_hash=a' / 'year=2019').exists()
@@ -0,0 +1,33 @@
+"""Tests for the eid_map module."""
+
+from pybliometrics.utils import init, lookup_eid, remember_eid
+
+
+def test_eid_map(tmp_path):
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'EIDMap': str(tmp_path)}})
+    assert lookup_eid('10.1016/J.RCIM.2020.102086', 'doi') is None
+    remember_eid('10.1016/J.RCIM.2020.102086', 'doi', '1-s2.0-S0736584520302969')
+    remember_eid('S0736584520302969', 'pii', None)
+    remember_eid('1-s2.0-S0736584520302969', 'eid', '1-s2.0-S0736584520302969')
+    assert lookup_eid('10.1016/j.rcim.2020.102086', 'doi') == '1-s2.0-S0736584520302969'
+    assert lookup_eid('S0736584520302969', 'pii') is None
+    assert lookup_eid('1-s2.0-S0736584520302969', 'eid') == '1-s2.0-S0736584520302969'
+    assert [p.name for p in tmp_path.rglob('*') if p.is_file()] == ['10.1016_j.rcim.2020.102086']
+    init()
+
+
+def test_remember_eid_best_effort(tmp_path):
+    folder = tmp_path / 'EIDMap'
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'EIDMap': str(folder)}})
+    remember_eid('S0736584520302969', 'pii', '1-s2.0-S0736584520302969')
+    fname = folder / 'pii' / 'S0736584520302969'
+    mtime = fname.stat().st_mtime_ns
+    # Storing a known EID does not rewrite the file
+    remember_eid('S0736584520302969', 'pii', '1-s2.0-S0736584520302969')
+    assert fname.stat().st_mtime_ns == mtime
+    # Unwritable files are skipped
+    remember_eid('10.1000/' + 'x' * 300, 'doi', '1-s2.0-S0736584520302969')
+    assert lookup_eid('10.1000/' + 'x' * 300, 'doi') is None
+    init()
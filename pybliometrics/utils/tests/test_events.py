@@ -0,0 +1,65 @@
+"""Tests for the events module."""
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from pybliometrics.utils import CacheLookup, emit, get_content, init, key_id, \
+    RequestEnd, RequestStart, subscribe, unsubscribe
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = b'{"x": 1}'
+        self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('X-RateLimit-Remaining', '99')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def test_subscribe():
+    received, lookups = [], []
+    subscribe(received.append)
+    subscribe(lookups.append, CacheLookup)
+    lookup = CacheLookup('AbstractRetrieval', 'META', 'path', 'hit')
+    emit(lookup)
+    emit(RequestStart('AbstractRetrieval', 'url', key_id('abc')))
+    unsubscribe(received.append)
+    emit(lookup)
+    unsubscribe(lookups.append)
+    assert len(received) == 2
+    assert lookups == [lookup, lookup]
+    assert len(key_id('abc')) == 8 and key_id('abc') != key_id('abd')
+
+
+def test_subscriber_error():
+    def fail(event):
+        raise KeyError(event)
+    subscribe(fail)
+    with pytest.warns(RuntimeWarning):
+        emit(CacheLookup('AbstractRetrieval', 'META', 'path', 'miss'))
+    unsubscribe(fail)
+
+
+def test_request_events():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    init(config={'Authentication': {'APIKey': 'abc'}})
+    received = []
+    subscribe(received.append)
+    try:
+        get_content(f'http://127.0.0.1:{server.server_port}/', 'AbstractRetrieval')
+    finally:
+        unsubscribe(received.append)
+        server.shutdown()
+    start, end = received
+    assert start == RequestStart('AbstractRetrieval', start.url, key_id('abc'))
+    assert isinstance(end, RequestEnd)
+    assert (end.status, end.bytes, end.retries, end.quota_remaining) == (200, 8, 0, '99')
+    assert end.key_id == key_id('abc')
+    assert end.latency > 0
+    init()
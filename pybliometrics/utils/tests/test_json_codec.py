@@ -0,0 +1,35 @@
+"""Tests for the JSON codec module."""
+
+import pytest
+
+from pybliometrics.utils import JSON_BACKENDS, get_json_backend, json_dumps, \
+    json_loads, set_json_backend
+
+PAYLOAD = {'search-results': {'entry': [{'dc:title': 'Universität & Co', 'n': 1,
+                                          'flag': True, 'none': None}]}}
+
+
+@pytest.mark.parametrize("backend", JSON_BACKENDS)
+def test_roundtrip(backend):
+    try:
+        set_json_backend(backend)
+    except ImportError:
+        pytest.skip(f"{backend} not installed")
+    assert get_json_backend() == backend
+    encoded = json_dumps(PAYLOAD)
+    assert isinstance(encoded, bytes)
+    assert b'\n' not in encoded
+    assert json_loads(encoded) == PAYLOAD
+    assert json_loads(encoded.decode()) == PAYLOAD
+    set_json_backend()
+
+
+def test_stdlib_compact():
+    set_json_backend('json')
+    assert json_dumps({'a': [1, 2]}) == b'{"a":[1,2]}'
+    set_json_backend()
+
+
+def test_wrong_backend():
+    with pytest.raises(ValueError):
+        set_json_backend('simplejson')
@@ -0,0 +1,42 @@
+"""Tests for the metrics module."""
+from urllib.request import urlopen
+
+from pybliometrics.utils import CacheLookup, CacheWrite, emit, MetricsRegistry, \
+    RequestEnd
+
+
+def test_metrics_registry(tmp_path):
+    registry = MetricsRegistry().enable()
+    emit(RequestEnd('ScopusSearch', 'url', 200, 0.3, 1000, 'abcd1234', 2, 0.5, '17', 1))
+    emit(RequestEnd('ScopusSearch', 'url', 429, 0.07, 10, 'abcd1234', 0, 0.0, None, 1))
+    emit(CacheLookup('ScopusSearch', 'STANDARD', 'path', 'hit'))
+    emit(CacheLookup('ScopusSearch', 'STANDARD', 'path', 'hit'))
+    emit(CacheLookup('ScopusSearch', 'STANDARD', 'path', 'stale'))
+    emit(CacheWrite('ScopusSearch', 'STANDARD', 'path', 2048, 0.002))
+    registry.disable()
+    emit(CacheLookup('ScopusSearch', 'STANDARD', 'path', 'miss'))
+    assert registry.get('requests_total', api='ScopusSearch', status='200') == 1
+    assert registry.get('rate_limited_total', api='ScopusSearch') == 2
+    assert registry.get('retries_total', api='ScopusSearch') == 2
+    assert registry.get('downloaded_bytes_total', api='ScopusSearch') == 1010
+    assert registry.get('request_latency_seconds', api='ScopusSearch') == 2
+    assert registry.get('quota_remaining', api='ScopusSearch', key_id='abcd1234') == 17
+    assert registry.cache_hit_ratio('ScopusSearch') == 2 / 3
+    assert registry.cache_hit_ratio('ScopusSearch', 'COMPLETE') is None
+    text = registry.to_prometheus()
+    assert '# TYPE pybliometrics_requests_total counter\n' in text
+    assert 'pybliometrics_requests_total{api="ScopusSearch",status="429"} 1\n' in text
+    assert 'pybliometrics_request_latency_seconds_bucket{api="ScopusSearch",le="0.1"} 1\n' in text
+    assert 'pybliometrics_request_latency_seconds_bucket{api="ScopusSearch",le="+Inf"} 2\n' in text
+    assert 'pybliometrics_throttle_wait_seconds_total{api="ScopusSearch"} 0.5\n' in text
+    fname = tmp_path / 'pybliometrics.prom'
+    registry.write_prometheus(fname)
+    assert fname.read_text() == text
+    server = registry.serve_prometheus(port=0)
+    try:
+        with urlopen(f'http://127.0.0.1:{server.server_port}/metrics') as resp:
+            assert resp.read().decode() == text
+    finally:
+        server.shutdown()
+    registry.reset()
+    assert registry.to_prometheus() == ''
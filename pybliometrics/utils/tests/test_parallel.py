@@ -0,0 +1,25 @@
+"""Tests for the parallel module."""
+
+import pytest
+
+from pybliometrics.utils import run_in_threads
+
+
+def _invert(x):
+    return 1 / x
+
+
+def test_run_in_threads():
+    received = list(run_in_threads(_invert, iter(range(-20, 21)), workers=3))
+    assert len(received) == 41
+    results = {item: result for item, result, error in received if not error}
+    assert results == {x: 1 / x for x in range(-20, 21) if x}
+    errors = [(item, error) for item, _, error in received if error]
+    assert len(errors) == 1
+    assert errors[0][0] == 0
+    assert isinstance(errors[0][1], ZeroDivisionError)
+
+
+def test_run_in_threads_workers():
+    with pytest.raises(ValueError):
+        list(run_in_threads(_invert, [1], workers=0))
@@ -0,0 +1,22 @@
+"""Tests for the parse_content module."""
+
+from pybliometrics.utils import deduplicate
+
+
+def test_deduplicate_hashable():
+    assert deduplicate([3, 1, 3, 2, 1]) == [3, 1, 2]
+    assert deduplicate([]) == []
+
+
+def test_deduplicate_dicts():
+    authors = [{'authid': '1', 'afid': [{'$': '10'}, {'$': '11'}]},
+               {'authid': '2', 'afid': [{'$': '10'}]},
+               {'afid': [{'$': '10'}, {'$': '11'}], 'authid': '1'},
+               {'authid': '1', 'afid': [{'$': '11'}, {'$': '10'}]}]
+    expected = [authors[0], authors[1], authors[3]]
+    assert deduplicate(authors) == expected
+
+
+def test_deduplicate_unhashable():
+    lst = [{1, 2}, [1, 2], (1, 2), {2, 1}, [1, 2], {'a': {3}}, {'a': {3}}]
+    assert deduplicate(lst) == [{1, 2}, [1, 2], (1, 2), {'a': {3}}]
@@ -0,0 +1,46 @@
+"""Tests for the parse_metrics module."""
+
+from pybliometrics.utils import make_chunks, make_stable_chunks, merge_metric_results, \
+    split_values
+
+
+def test_make_chunks():
+    assert make_chunks([1, 2, 3], None) == [[1, 2, 3]]
+    assert make_chunks([1, 2, 3], 3) == [[1, 2, 3]]
+    assert make_chunks([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+
+
+
+def test_make_stable_chunks():
+    ids = sorted(str(i) for i in range(1000))
+    chunks = make_stable_chunks(ids, 100)
+    assert [i for chunk in chunks for i in chunk] == ids
+    assert all(len(chunk) <= 100 for chunk in chunks)
+    assert make_stable_chunks(ids[:3], 100) == [ids[:3]]
+    # Adding an ID leaves all other chunks unchanged
+    keys = {tuple(chunk) for chunk in chunks}
+    changed = {tuple(chunk) for chunk in make_stable_chunks(sorted(ids + ['5000']), 100)}
+    assert len(keys - changed) <= 2
+    assert len(keys & changed) >= len(keys) - 2
+
+
+def test_merge_metric_results():
+    def result(entity_id, *metrics):
+        return {'author': {'id': entity_id, 'name': f'Author {entity_id}'},
+                'metrics': [{'metricType': m, 'value': 1} for m in metrics]}
+    parts = [{'results': [result(1, 'CitationCount'), result(2, 'CitationCount')]},
+             {'results': [result(1, 'HIndices'), result(2, 'HIndices')]},
+             {'results': [result(3, 'CitationCount', 'HIndices')]},
+             {}]
+    merged = merge_metric_results(parts, 'author')
+    assert [r['author']['id'] for r in merged['results']] == [1, 2, 3]
+    assert [[m['metricType'] for m in r['metrics']] for r in merged['results']] == \
+        [['CitationCount', 'HIndices']] * 3
+    assert len(parts[0]['results'][0]['metrics']) == 1
+
+
+def test_split_values():
+    assert split_values(None) == []
+    assert split_values(123) == ['123']
+    assert split_values('1, 2,3,') == ['1', '2', '3']
+    assert split_values([1, '2']) == ['1', '2']
@@ -0,0 +1,99 @@
+"""Tests for the partition module."""
+
+import re
+from datetime import date, timedelta
+from hashlib import md5
+from types import SimpleNamespace
+
+import pytest
+
+from pybliometrics.exception import ScopusQueryError
+from pybliometrics.utils import init, json_dumps, partition_query, shard_query, \
+    SUBJECT_AREAS
+
+# Number of results per publication year of a fictitious query
+YEARS = {1950: 40, 2000: 30, 2010: 80, 2011: 5}
+
+
+def _count(query):
+    """Count results of queries restricted by PUBYEAR and SUBJAREA."""
+    first, last, n = 0, 9999, 0
+    for op, year in re.findall(r'PUBYEAR (>|<|IS) (\d+)', query):
+        year = int(year)
+        if op == '>':
+            first = year + 1
+        elif op == '<':
+            last = year - 1
+        else:
+            first = last = year
+    for year, size in YEARS.items():
+        if first <= year <= last:
+            n += size
+    if 'NOT (' in query:
+        return 1
+    if 'SUBJAREA(' in query:
+        return n // 10 + 1
+    return n
+
+
+def test_partition_query():
+    assert partition_query('TITLE(x)', _count, max_results=200) == [('TITLE(x)', 155)]
+    parts = partition_query('TITLE(x)', _count, max_results=50, workers=2)
+    assert all(size <= 50 for _, size in parts)
+    assert sum(size for query, size in parts if 'SUBJAREA' not in query) == 75
+    assert ('(TITLE(x)) AND PUBYEAR IS 2010 AND SUBJAREA(MEDI)', 9) in parts
+    assert '(TITLE(x)) AND PUBYEAR < 1901' not in dict(parts)
+    areas = " OR ".join(f"SUBJAREA({a})" for a in SUBJECT_AREAS)
+    assert (f'(TITLE(x)) AND PUBYEAR IS 2010 AND NOT ({areas})', 1) in parts
+    with pytest.raises(ScopusQueryError):
+        partition_query('TITLE(x)', _count, max_results=5)
+
+
+def test_shard_query():
+    # Documents as (publication year, load date), one year being heavy
+    docs = [(2000 + i % 20, date(2005, 1, 1) + timedelta(days=i)) for i in range(2000)]
+    docs += [(2020, date(2021, 1, 1) + timedelta(days=i % 300)) for i in range(3000)]
+
+    def count(query):
+        conditions = re.findall(r'(PUBYEAR|LOAD-DATE) (>|<|IS|AFT|BEF) (\d+)', query)
+        n = 0
+        for year, loaded in docs:
+            values = {'PUBYEAR': year, 'LOAD-DATE': int(f'{loaded:%Y%m%d}')}
+            n += all({'>': values[field] > int(value), 'AFT': values[field] > int(value),
+                      '<': values[field] < int(value), 'BEF': values[field] < int(value),
+                      'IS': values[field] == int(value)}[op]
+                     for field, op, value in conditions)
+        return n
+
+    shards = shard_query('TITLE(x)', count, shards=5, workers=2)
+    assert sum(size for _, size in shards) == len(docs)
+    assert all(size <= 1000 for _, size in shards)
+    assert any('LOAD-DATE' in query for query, _ in shards)
+    assert shard_query('TITLE(x)', count, shards=1) == [('TITLE(x)', 5000)]
+
+
+def test_download_in_parts(tmp_path, monkeypatch):
+    from pybliometrics.scopus import scopus_search, ScopusSearch
+    from pybliometrics.superclasses import base
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'ScopusSearch': str(tmp_path)}})
+    monkeypatch.setattr(scopus_search, 'probe_sizes',
+                        lambda queries, *args, **kwds: {q: 100 * _count(q) for q in queries})
+
+    def get_content(url, api, params, **kwds):
+        # One result per part, and one that all parts share
+        eid = '2-s2.0-' + md5(params['query'].encode()).hexdigest()
+        entries = [{'eid': eid, 'citedby-count': '0', 'openaccess': '0'},
+                   {'eid': '2-s2.0-0', 'citedby-count': '0', 'openaccess': '0'}]
+        res = {'search-results': {'opensearch:totalResults': '2', 'entry': entries}}
+        return SimpleNamespace(content=json_dumps(res), headers={})
+
+    monkeypatch.setattr(base, 'get_content', get_content)
+    s = ScopusSearch('TITLE(x)', partition=True)
+    eids = s.get_eids()
+    assert len(eids) == len(set(eids)) > 10
+    assert eids.count('2-s2.0-0') == 1
+    # Only the merged result remains cached
+    assert [f.name for f in (tmp_path / 'COMPLETE').iterdir()] == [s._cache_file_path.name]
+    assert ScopusSearch('TITLE(x)', partition=True).get_eids() == eids
+    init()
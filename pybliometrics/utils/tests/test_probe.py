@@ -0,0 +1,48 @@
+"""Tests for the probe module."""
+from types import SimpleNamespace
+
+from pybliometrics.utils import init, json_dumps, probe
+from pybliometrics.utils.probe import probe_sizes
+
+
+def test_probe_sizes(tmp_path, monkeypatch):
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'ScopusSearch': str(tmp_path)}})
+    calls = []
+
+    def get_content(url, api, params):
+        calls.append(params)
+        size = len(params['query'])
+        res = {'search-results': {'opensearch:totalResults': str(size)}}
+        return SimpleNamespace(content=json_dumps(res))
+
+    monkeypatch.setattr(probe, 'get_content', get_content)
+    queries = ['AU-ID(1)', 'TITLE(xy)', 'AU-ID(1)', 'KEY(abcdef)']
+    expected = {'AU-ID(1)': 8, 'TITLE(xy)': 9, 'KEY(abcdef)': 11}
+    assert probe_sizes(queries, date='2020', count=25) == expected
+    assert len(calls) == 3
+    assert all(c['count'] == 1 and c['date'] == '2020' for c in calls)
+    assert probe_sizes(queries, date='2020') == expected
+    assert len(calls) == 3
+    assert probe_sizes(queries[:1], refresh=True, date='2020') == {'AU-ID(1)': 8}
+    assert probe_sizes(queries[:1]) == {'AU-ID(1)': 8}
+    assert len(calls) == 5
+    init()
+
+
+def test_probe_sizes_rotates_keys(tmp_path, monkeypatch):
+    init(config={'Authentication': {'APIKey': 'k1, k2, k3'},
+                 'Directories': {'ScopusSearch': str(tmp_path)}})
+    keys = []
+
+    def get_content(url, api, params):
+        keys.append(params['apikey'])
+        res = {'search-results': {'opensearch:totalResults': '1'}}
+        return SimpleNamespace(content=json_dumps(res))
+
+    monkeypatch.setattr(probe, 'get_content', get_content)
+    # One query per call, like the query planners
+    for i in range(6):
+        probe_sizes([f'AU-ID({i})'], workers=1)
+    assert sorted(keys) == ['k1', 'k1', 'k2', 'k2', 'k3', 'k3']
+    init()
@@ -0,0 +1,61 @@
+"""Tests for the profiling module."""
+import pytest
+
+from pybliometrics.superclasses.search import _get_cache_file_path
+from pybliometrics.utils import init, json_dumps, profile
+
+
+def test_profile(tmp_path):
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'ScopusSearch': str(tmp_path)}})
+    from pybliometrics.scopus import ScopusSearch
+    fname = _get_cache_file_path('ScopusSearch', 'STANDARD', 'TITLE(x)')
+    fname.parent.mkdir(parents=True)
+    entries = [{'eid': f'2-s2.0-{i}', 'citedby-count': '1', 'openaccess': '0'}
+               for i in range(5)]
+    fname.write_bytes(b"\n".join(json_dumps(e) for e in entries))
+    getter = ScopusSearch.results.fget
+    with profile(cprofile=True, dump_dir=tmp_path / 'prof') as prof:
+        s = ScopusSearch('TITLE(x)', subscriber=False)
+        assert len(s.results) == 5
+        with pytest.raises(RuntimeError):
+            profile().__enter__()
+    assert ScopusSearch.results.fget is getter
+    assert prof.phases[('ScopusSearch', 'total')][0] == 1
+    assert prof.phases[('ScopusSearch', 'cache read')][0] == 1
+    assert prof.phases[('ScopusSearch', 'decode')][0] == 5
+    assert prof.properties[('ScopusSearch', 'results')][0] == 1
+    assert prof.phases[('ScopusSearch', 'parse')][0] == 2
+    assert (tmp_path / 'prof' / 'ScopusSearch.prof').exists()
+    report = prof.report().splitlines()
+    assert report[0].split()[:3] == ['API', 'objects', 'total']
+    assert report[2].split()[:2] == ['ScopusSearch', '1']
+    init()
+
+
+def test_profile_from_environment(tmp_path, monkeypatch):
+    import atexit
+    from pybliometrics.utils import profiling, startup
+    finish = []
+    monkeypatch.setattr(atexit, 'register', finish.append)
+    monkeypatch.setattr(startup, '_profile_checked', False)
+    monkeypatch.setenv('PYBLIOMETRICS_PROFILE', '1')
+    config = {'Authentication': {'APIKey': '1'},
+              'Directories': {'ScopusSearch': str(tmp_path)}}
+    init(config=config)
+    init(config=config)
+    assert len(finish) == 1
+    from pybliometrics.scopus import ScopusSearch
+    fname = _get_cache_file_path('ScopusSearch', 'STANDARD', 'TITLE(x)')
+    fname.parent.mkdir(parents=True)
+    fname.write_bytes(json_dumps({'eid': '2-s2.0-1'}))
+    outer = profiling._active
+    with profile() as prof:
+        assert profiling._active is prof
+        ScopusSearch('TITLE(x)', subscriber=False)
+    assert profiling._active is outer
+    assert prof.phases[('ScopusSearch', 'total')][0] == 1
+    assert outer.phases[('ScopusSearch', 'total')][0] == 1
+    finish[0]()
+    assert profiling._active is None
+    init()
@@ -0,0 +1,98 @@
+"""Tests for the records module."""
+
+import pickle
+from collections.abc import Sequence
+from typing import NamedTuple
+
+import pytest
+
+from pybliometrics.utils import RecordStore
+
+
+class Item(NamedTuple):
+    eid: str | None
+    title: str | None
+    subtype: str | None
+    count: int | None
+    flag: bool | None
+
+
+ITEMS = [Item('2-s2.0-1', 'Über', 'ar', 3, True),
+         Item('2-s2.0-2', None, 'ar', None, False),
+         Item('2-s2.0-3', '', 're', -2**62, None),
+         Item(None, 'Title', 'ar', 0, True)]
+COLUMNS = {field: list(col) for field, col in zip(Item._fields, zip(*ITEMS))}
+STORE = RecordStore(Item, COLUMNS)
+
+
+def test_rows():
+    assert len(STORE) == 4
+    assert list(STORE) == ITEMS
+    assert STORE.to_records() == ITEMS
+    assert STORE[-1] == ITEMS[-1]
+    assert STORE[1:3] == ITEMS[1:3]
+    with pytest.raises(IndexError):
+        STORE[4]
+
+
+def test_row_access():
+    row = STORE[0]
+    assert row.title == 'Über'
+    assert row[3] == 3
+    assert row[1:3] == ('Über', 'ar')
+    assert tuple(row) == tuple(ITEMS[0])
+    assert row._asdict() == ITEMS[0]._asdict()
+    assert row._replace(count=1) == ITEMS[0]._replace(count=1)
+    assert hash(row) == hash(ITEMS[0])
+    assert repr(row) == repr(ITEMS[0])
+    with pytest.raises(AttributeError):
+        row.title = 'x'
+
+
+def test_column():
+    assert STORE.column('count') == [3, None, -2**62, 0]
+    assert STORE.column('eid') == COLUMNS['eid']
+
+
+def test_empty():
+    store = RecordStore(Item, {field: [] for field in Item._fields})
+    assert len(store) == 0
+    assert list(store) == []
+
+
+def test_from_rows():
+    store = RecordStore.from_rows(Item, iter(ITEMS), len(ITEMS))
+    assert list(store) == ITEMS
+    assert store.column('count') == STORE.column('count')
+    # Titles look unique strings until the end, subtypes mix types
+    mixed = [Item(str(i), str(i) if i < 1400 else i, 'ar' if i % 2 else 1, i, None)
+             for i in range(1500)]
+    store = RecordStore.from_rows(Item, mixed, 0)
+    assert list(store) == mixed
+    # Without the expected length, repeated strings remain in a table
+    store = RecordStore.from_rows(Item, ITEMS * 10, 0)
+    assert type(store._columns[2]).__name__ == '_DictColumn'
+
+
+def test_mixed_types():
+    values = [1, True, 1, True, 0, False, None]
+    store = RecordStore(Item, {field: values for field in Item._fields})
+    received = store.column('flag')
+    assert received == values
+    assert [type(v) for v in received] == [type(v) for v in values]
+
+
+def test_sequence_and_pickle():
+    assert isinstance(STORE, Sequence)
+    assert isinstance(STORE[0], Sequence)
+    assert STORE[0].index('ar') == 2
+    received = pickle.loads(pickle.dumps(STORE))
+    assert list(received) == ITEMS
+    assert pickle.loads(pickle.dumps(STORE[0])) == ITEMS[0]
+
+
+def test_dataframe():
+    pd = pytest.importorskip("pandas")
+    df = pd.DataFrame(STORE)
+    assert list(df.columns) == list(Item._fields)
+    assert df.shape == (4, 5)
@@ -1,11 +1,14 @@
 """Tests for the startup and configuration module."""
 
+import subprocess
+import sys
 from pathlib import Path
 
 import pytest
 
 from pybliometrics.scopus import init
-from pybliometrics.utils import get_insttokens, get_keys
+from pybliometrics.utils import get_config, get_insttokens, get_keys, \
+    get_request_context, get_session
 
 CURRENT_DIR = Path(__file__).resolve().parent
 TEST_CONFIG = CURRENT_DIR / 'test_config.cfg'
@@ -38,6 +41,17 @@ def test_imports():
     pybliometrics.scival.init()
 
 
+def test_lazy_imports():
+    """Test that importing pybliometrics does not import heavy dependencies."""
+    code = ("import sys, pybliometrics; "
+            "assert 'pybliometrics.scopus' not in sys.modules; "
+            "from pybliometrics.scopus import ScopusSearch; "
+            "assert 'requests' not in sys.modules; "
+            "assert 'tqdm' not in sys.modules; "
+            "assert pybliometrics.sciencedirect.ScienceDirectSearch")
+    subprocess.run([sys.executable, '-c', code], check=True)
+
+
 def test_new_config():
     """Test whether a new config file is created."""
     TEST_CONFIG.unlink(missing_ok=True)
@@ -69,3 +83,184 @@ def test_error_more_tokens_than_keys():
     """Test whether an error is raised if more tokens than keys are provided."""
     with pytest.raises(ValueError):
         init(keys=['1'], inst_tokens=['a', 'b'])
+
+
+def test_config_from_dict(tmp_path):
+    """Test whether a configuration passed as dictionary is used without files."""
+    config = {'Authentication': {'APIKey': ['1', '2'], 'InstToken': 'a'},
+              'Directories': {'ScopusSearch': str(tmp_path / 'search')},
+              'Requests': {'Timeout': 5}}
+    init(config=config)
+    assert get_keys() == ['1', '2']
+    assert get_insttokens() == ['a']
+    assert get_config().getint('Requests', 'Timeout') == 5
+    assert get_config().getint('Requests', 'Retries') == 5
+    assert get_config().get('Directories', 'AuthorSearch')
+    assert not (tmp_path / 'search').exists()
+    with pytest.raises(ValueError):
+        init(config={})
+
+
+def test_config_from_env(monkeypatch, tmp_path):
+    """Test whether the configuration is read from environment variables."""
+    monkeypatch.setenv('PYBLIOMETRICS_APIKEY', '8, 9')
+    monkeypatch.setenv('PYBLIOMETRICS_HTTPS_PROXY', 'https://127.0.0.1:1234')
+    monkeypatch.setenv('PYBLIOMETRICS_CACHE_DIR', str(tmp_path))
+    init(config={'Authentication': {'APIKey': '1'}}, from_env=True)
+    assert get_keys() == ['8', '9']
+    assert dict(get_config().items('Proxy')) == {'https': 'https://127.0.0.1:1234'}
+    path = Path(get_config().get('Directories', 'ScopusSearch'))
+    assert path == tmp_path / 'Scopus' / 'scopus_search'
+    assert not any(tmp_path.iterdir())
+    init()
+
+
+def test_request_context():
+    """Test whether the request context is built once per initialization."""
+    init(config={'Authentication': {'APIKey': '1, 2, 3', 'InstToken': 'a'},
+                 'Proxy': {'https': 'https://127.0.0.1:1234'},
+                 'Requests': {'Retries': 2}})
+    context = get_request_context()
+    assert context.keys == ('2', '3')
+    assert context.insttokens == (('1', 'a'),)
+    assert context.proxies == {'https': 'https://127.0.0.1:1234'}
+    assert (context.timeout, context.retries) == (20, 2)
+    with pytest.raises(TypeError):
+        context.proxies['http'] = 'http://127.0.0.1:1234'
+    session = get_session()
+    assert get_session() is session
+    assert get_request_context() is context
+    init(keys=['4'])
+    assert get_request_context().keys == ('4',)
+    assert get_session() is not session
+    init()
+
+
+def test_lazy_parsing(tmp_path):
+    """Test whether cached files are only parsed on first access if requested."""
+    from hashlib import md5
+    from pybliometrics.scopus import ScopusSearch
+    cache = tmp_path / 'COMPLETE' / md5(b'DOI(10.1/1)').hexdigest()
+    cache.parent.mkdir()
+    cache.write_text('{"eid": "2-s2.0-1"}\n{"eid": "2-s2.0-2"}')
+    config = {'Authentication': {'APIKey': '1'},
+              'Directories': {'ScopusSearch': str(tmp_path)}}
+    init(config=config, lazy=True)
+    s = ScopusSearch('DOI(10.1/1)')
+    assert s.get_results_size() == 2
+    assert s.get_key_remaining_quota() is None
+    assert '_json' not in s.__dict__
+    assert s.get_eids() == ['2-s2.0-1', '2-s2.0-2']
+    init(config=config)
+    assert '_json' in ScopusSearch('DOI(10.1/1)').__dict__
+    init()
+
+
+def test_property_attribute_error(tmp_path, monkeypatch):
+    """Test whether AttributeErrors of properties of eagerly parsed
+    objects propagate after a single call."""
+    from hashlib import md5
+    from pybliometrics.scopus import ScopusSearch
+    cache = tmp_path / 'COMPLETE' / md5(b'DOI(10.1/1)').hexdigest()
+    cache.parent.mkdir()
+    cache.write_text('{"eid": "2-s2.0-1"}')
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'ScopusSearch': str(tmp_path)}})
+    calls = []
+
+    def broken(self):
+        calls.append(self)
+        raise AttributeError('broken')
+
+    monkeypatch.setattr(ScopusSearch, 'broken', property(broken), raising=False)
+    s = ScopusSearch('DOI(10.1/1)')
+    with pytest.raises(AttributeError):
+        s.broken
+    assert len(calls) == 1
+    init()
+
+
+def test_lazy_results_compact(tmp_path):
+    """Test whether the compact results of a lazy object are built from
+    the cached file without decoding all results at once."""
+    from hashlib import md5
+    from pybliometrics.scopus import ScopusSearch
+    cache = tmp_path / 'COMPLETE' / md5(b'DOI(10.1/1)').hexdigest()
+    cache.parent.mkdir()
+    cache.write_text('{"eid": "2-s2.0-1", "citedby-count": "1", "openaccess": "0"}\n'
+                     '{"eid": "2-s2.0-2", "citedby-count": "2", "openaccess": "1"}')
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'ScopusSearch': str(tmp_path)}}, lazy=True)
+    s = ScopusSearch('DOI(10.1/1)')
+    compact = s.results_compact()
+    assert '_pending_cache' in s.__dict__
+    assert compact.column('citedby_count') == [1, 2]
+    assert list(compact) == s.results
+    init()
+
+
+def test_lazy_parsing_threads(tmp_path, monkeypatch):
+    """Test whether concurrent first accesses parse the cached file once."""
+    from concurrent.futures import ThreadPoolExecutor
+    from hashlib import md5
+    from time import sleep
+    from pybliometrics.scopus import ScopusSearch
+    from pybliometrics.superclasses import Base
+    cache = tmp_path / 'COMPLETE' / md5(b'DOI(10.1/1)').hexdigest()
+    cache.parent.mkdir()
+    cache.write_text('{"eid": "2-s2.0-1"}\n{"eid": "2-s2.0-2"}')
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'ScopusSearch': str(tmp_path)}}, lazy=True)
+    reads = []
+    read_cache = Base._read_cache
+
+    def slow_read_cache(self, *args):
+        reads.append(args)
+        sleep(0.05)
+        read_cache(self, *args)
+
+    monkeypatch.setattr(Base, '_read_cache', slow_read_cache)
+    s = ScopusSearch('DOI(10.1/1)')
+    with ThreadPoolExecutor(8) as executor:
+        received = list(executor.map(lambda _: s.get_eids(), range(8)))
+    assert received == [['2-s2.0-1', '2-s2.0-2']] * 8
+    assert len(reads) == 1
+    with pytest.raises(AttributeError):
+        s.missing
+    init()
+
+
+def test_bulk_probe(tmp_path, monkeypatch):
+    """Test whether bulk retrieval only probes for cached files before
+    building all objects in worker threads."""
+    from threading import current_thread
+    from pybliometrics.exception import Scopus404Error
+    from pybliometrics.sciencedirect import ObjectRetrieval
+    from pybliometrics.superclasses import base
+    (tmp_path / '1-s2.0-S1-gr1.jpg').write_bytes(b'jpg')
+    init(config={'Authentication': {'APIKey': '1'},
+                 'Directories': {'ObjectRetrieval': str(tmp_path),
+                                 'ArticleRetrieval': str(tmp_path / 'articles'),
+                                 'EIDMap': str(tmp_path / 'eid_map')}})
+    main = current_thread()
+    built, downloads = [], []
+    init_object = ObjectRetrieval.__init__
+
+    def record_init(self, *args, **kwds):
+        if not self._probe_cache:
+            built.append(current_thread())
+        init_object(self, *args, **kwds)
+
+    def get_content(url, api, params, **kwds):
+        downloads.append(current_thread())
+        raise Scopus404Error('RESOURCE_NOT_FOUND')
+
+    monkeypatch.setattr(ObjectRetrieval, '__init__', record_init)
+    monkeypatch.setattr(base, 'get_content', get_content)
+    items = list(ObjectRetrieval.bulk(['10.1/1', '1-s2.0-S1'], filename='gr1.jpg'))
+    results = {item.identifier: item for item in items}
+    assert results['1-s2.0-S1'].result.object.getvalue() == b'jpg'
+    assert isinstance(results['10.1/1'].error, Scopus404Error)
+    assert len(built) == 2 and len(downloads) == 1
+    assert main not in built + downloads
+    init()
@@ -0,0 +1,43 @@
+"""Tests for the tracing module."""
+import pytest
+
+from pybliometrics.utils import map_in_threads, set_span_attributes, start_span, \
+    tracing
+from pybliometrics.utils.tracing import tracing_enabled
+
+
+def test_no_tracing(monkeypatch):
+    monkeypatch.setattr(tracing, '_tracer', False)
+    assert not tracing_enabled()
+    with start_span('ScopusSearch', api='ScopusSearch') as span:
+        set_span_attributes(span, status=200)
+    assert span is None
+
+
+def test_spans():
+    pytest.importorskip('opentelemetry.sdk')
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+    from opentelemetry.sdk.trace.export.in_memory_span_exporter import \
+        InMemorySpanExporter
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+
+    def page(i):
+        with start_span('ScopusSearch page', page=i, view=None):
+            pass
+
+    with start_span('ScopusSearch', api='ScopusSearch') as span:
+        set_span_attributes(span, status=200)
+        map_in_threads(page, range(3), workers=3)
+    spans = exporter.get_finished_spans()
+    assert tracing_enabled()
+    assert [s.name for s in spans].count('ScopusSearch page') == 3
+    parent = spans[-1]
+    assert dict(parent.attributes) == {'pybliometrics.api': 'ScopusSearch',
+                                       'pybliometrics.status': 200}
+    assert all(s.parent.span_id == parent.context.span_id for s in spans[:-1])
+    assert sorted(s.attributes['pybliometrics.page'] for s in spans[:-1]) == [0, 1, 2]
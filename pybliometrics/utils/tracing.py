@@ -0,0 +1,43 @@
+"""Optional tracing of requests and cache accesses with OpenTelemetry."""
+from contextlib import nullcontext
+
+# Tracer of the OpenTelemetry API, False if it is not installed, None
+# before the first span
+_tracer = None
+
+
+def tracing_enabled() -> bool:
+    """Whether spans are recorded, i.e. the OpenTelemetry API is installed.
+    Spans are exported only if a tracer provider is configured.
+    """
+    global _tracer
+    if _tracer is None:
+        try:
+            from opentelemetry import trace
+        except ImportError:
+            _tracer = False
+        else:
+            _tracer = trace.get_tracer('pybliometrics')
+    return _tracer is not False
+
+
+def start_span(name: str, **attributes):
+    """Return a context manager running a span named `name` as child of the
+    current span, or doing nothing if the OpenTelemetry API is not installed.
+    Attributes get prefix `pybliometrics.`; attributes valued None are
+    omitted.  The context manager returns the span, or None.
+    """
+    if not tracing_enabled():
+        return nullcontext()
+    return _tracer.start_as_current_span(name, attributes=_attributes(attributes))
+
+
+def set_span_attributes(span, **attributes) -> None:
+    """Add attributes to `span` as returned by `start_span()`."""
+    if span is not None:
+        span.set_attributes(_attributes(attributes))
+
+
+def _attributes(attributes: dict) -> dict:
+    """Auxiliary function to prefix attributes and omit missing values."""
+    return {f'pybliometrics.{k}': v for k, v in attributes.items() if v is not None}